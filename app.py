@@ -8,7 +8,7 @@ import asyncio
 import logging
 import time
 from datetime import datetime
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, Response, stream_with_context
 import threading
 import os
 from typing import Dict, Any, List
@@ -68,6 +68,95 @@ app.config['SECRET_KEY'] = 'factryl_secret_key_2024'
 print("Starting Factryl...")
 engine = FactrylEngine()
 print(f"Loaded {len(engine.scrapers)} data sources")
+
+# Single long-lived event loop so aiohttp sessions (article extractor, scrapers)
+# can be shared across requests instead of being rebuilt in a fresh loop each time
+async_loop = asyncio.new_event_loop()
+
+def _run_async_loop():
+    asyncio.set_event_loop(async_loop)
+    async_loop.run_forever()
+
+Thread(target=_run_async_loop, name='factryl-async-loop', daemon=True).start()
+
+def run_async(coro, timeout=None):
+    """Run a coroutine on the shared event loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, async_loop).result(timeout)
+
+def iterate_async(agen, timeout=None):
+    """Iterate an async generator on the shared event loop from synchronous code."""
+    try:
+        while True:
+            try:
+                yield run_async(agen.__anext__(), timeout)
+            except StopAsyncIteration:
+                return
+    finally:
+        # Also runs when the client disconnects mid-stream, cancelling the generation
+        try:
+            run_async(agen.aclose(), 5)
+        except Exception as e:
+            logger.warning(f"Could not close stream: {e}")
+
+def sse_event(event, data):
+    """Format one server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+def summary_stream_response(agen, done_fields, side_events=None):
+    """
+    Stream summary events as server-sent events.
+
+    Args:
+        agen: Async generator of {'type': 'token'|'done', ...} events
+        done_fields: Callable(summary, cached, processing_time) -> payload of the final 'done' event
+        side_events: Optional {event name: concurrent future of its payload}; each is sent
+            as soon as it resolves, and at the latest just before 'done'
+    """
+    pending = dict(side_events or {})
+
+    def resolved(wait):
+        for name, future in list(pending.items()):
+            if wait or future.done():
+                del pending[name]
+                try:
+                    yield sse_event(name, future.result(timeout=30))
+                except Exception as e:
+                    logger.warning(f"Stream side event '{name}' failed: {e}")
+
+    def events():
+        start_time = time.time()
+        try:
+            for event in iterate_async(agen):
+                yield from resolved(wait=event['type'] != 'token')
+                if event['type'] == 'token':
+                    yield sse_event('token', {'text': event['text']})
+                else:
+                    processing_time = round(time.time() - start_time, 2)
+                    yield sse_event('done', done_fields(event['summary'], event.get('cached', False), processing_time))
+        except Exception as e:
+            logger.error(f"Summary stream error: {e}")
+            yield sse_event('error', {'error': f'Summary generation failed: {str(e)}'})
+
+    return Response(
+        stream_with_context(events()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+# Open DNS + keep-alive connections to the busiest hosts in the background
+asyncio.run_coroutine_threadsafe(engine.prewarm_connections(), async_loop)
+
+_standalone_extractor = None
+
+def get_article_extractor():
+    """Return the engine's article extractor, or a standalone one if the engine has none."""
+    global _standalone_extractor
+    if engine.article_extractor:
+        return engine.article_extractor
+    if _standalone_extractor is None:
+        from app.core.article_extractor import ArticleExtractor
+        _standalone_extractor = ArticleExtractor()
+    return _standalone_extractor
 print("Access the application at: http://localhost:5000")
 
 @app.route('/')
@@ -92,19 +181,9 @@ def api_search():
         
         print(f"API Search Request: '{query}' (max: {max_results})")
         
-        # Run the search in a new event loop
-        def run_search():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                result = loop.run_until_complete(engine.search(query, max_results))
-                return result
-            finally:
-                loop.close()
-        
-        # Execute search
+        # Execute search on the shared event loop
         start_time = time.time()
-        search_results = run_search()
+        search_results = run_async(engine.search(query, max_results))
         processing_time = time.time() - start_time
         
         # Add processing time to results
@@ -119,6 +198,39 @@ def api_search():
         traceback.print_exc()
         return jsonify({'error': f'Search failed: {str(e)}'}), 500
 
+async def fetch_definition(query):
+    """Dictionary definitions of the query, grouped by part of speech, as display text."""
+    from app.scraper.dictionary.dictionary import DictionaryScraper
+    
+    async with DictionaryScraper() as scraper:
+        results = await scraper.search(query, max_results=10)  # Get more definitions
+        if results:
+            # Group definitions by part of speech for better organization
+            formatted_definitions = []
+            current_phonetic = ""
+            
+            # Get phonetic from first result
+            if results[0].get('phonetic'):
+                current_phonetic = results[0]['phonetic']
+                formatted_definitions.append(f"**Pronunciation:** {current_phonetic}")
+            
+            # Group by part of speech
+            pos_groups = {}
+            for result in results:
+                pos = result.get('part_of_speech', 'General')
+                if pos not in pos_groups:
+                    pos_groups[pos] = []
+                pos_groups[pos].append(result.get('definition', ''))
+            
+            # Format definitions by part of speech
+            for pos, definitions in pos_groups.items():
+                formatted_definitions.append(f"**{pos.title()}:**")
+                for i, definition in enumerate(definitions[:3], 1):  # Limit to 3 per part of speech
+                    formatted_definitions.append(f"{i}. {definition}")
+            
+            return "\n".join(formatted_definitions)
+        return ""
+
 @app.route('/api/generate-summary', methods=['POST'])
 def api_generate_summary():
     """Generate AI summary of articles."""
@@ -139,52 +251,9 @@ def api_generate_summary():
         # Fetch dictionary definition separately
         definition = ""
         try:
-            from app.scraper.dictionary.dictionary import DictionaryScraper
-            
-            async def get_definition():
-                async with DictionaryScraper() as scraper:
-                    results = await scraper.search(query, max_results=10)  # Get more definitions
-                    if results:
-                        # Group definitions by part of speech for better organization
-                        formatted_definitions = []
-                        current_phonetic = ""
-                        
-                        # Get phonetic from first result
-                        if results[0].get('phonetic'):
-                            current_phonetic = results[0]['phonetic']
-                            formatted_definitions.append(f"**Pronunciation:** {current_phonetic}")
-                        
-                        # Group by part of speech
-                        pos_groups = {}
-                        for result in results:
-                            pos = result.get('part_of_speech', 'General')
-                            if pos not in pos_groups:
-                                pos_groups[pos] = []
-                            pos_groups[pos].append(result.get('definition', ''))
-                        
-                        # Format definitions by part of speech
-                        for pos, definitions in pos_groups.items():
-                            formatted_definitions.append(f"**{pos.title()}:**")
-                            for i, definition in enumerate(definitions[:3], 1):  # Limit to 3 per part of speech
-                                formatted_definitions.append(f"{i}. {definition}")
-                        
-                        return "\n".join(formatted_definitions)
-                    return ""
-            
-            # Run dictionary lookup in new event loop
-            def run_dictionary_lookup():
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    result = loop.run_until_complete(get_definition())
-                    return result
-                finally:
-                    loop.close()
-            
-            definition = run_dictionary_lookup()
+            definition = run_async(fetch_definition(query))
             if definition:
                 print(f"Dictionary definition found: {definition[:100]}...")
-            
         except Exception as e:
             print(f"Dictionary lookup failed: {e}")
         
@@ -210,6 +279,41 @@ def api_generate_summary():
         traceback.print_exc()
         return jsonify({'error': f'Summary generation failed: {str(e)}'}), 500
 
+@app.route('/api/generate-summary/stream', methods=['POST'])
+def api_generate_summary_stream():
+    """Stream the AI summary of articles as server-sent events ('token' events, then 'done')."""
+    data = request.get_json()
+    
+    if not data or 'articles' not in data:
+        return jsonify({'error': 'No articles provided'}), 400
+    
+    query = data.get('query', 'search results')
+    articles = data['articles']
+    max_length = data.get('max_length', 280)
+    
+    print(f"Streaming summary for {len(articles)} articles about '{query}'")
+    
+    # The definition is looked up while the report streams and sent as its own event
+    async def definition_event():
+        try:
+            return {'definition': await fetch_definition(query)}
+        except Exception as e:
+            print(f"Dictionary lookup failed: {e}")
+            return {'definition': ''}
+    
+    return summary_stream_response(
+        engine.stream_summary(articles, query, max_length),
+        lambda summary, cached, processing_time: {
+            'summary': summary,
+            'processing_time': processing_time,
+            'article_count': len(articles),
+            'character_count': len(summary),
+            'query': query,
+            'cached': cached
+        },
+        side_events={'definition': asyncio.run_coroutine_threadsafe(definition_event(), async_loop)}
+    )
+
 @app.route('/api/sources')
 def api_sources():
     """Get available data sources with credibility information."""
@@ -371,21 +475,11 @@ def api_article_image():
         if not article_url:
             return jsonify({'error': 'Article URL is required'}), 400
         print(f"Extracting image from article: {article_url}")
-        from app.core.article_extractor import ArticleExtractor
-        import asyncio
-        async def extract_article_image():
-            extractor = ArticleExtractor()
-            result = await extractor.extract_article_content(article_url)
-            return result
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            extraction_result = loop.run_until_complete(extract_article_image())
-        finally:
-            loop.close()
-        if extraction_result.success and extraction_result.metadata:
-            top_image = extraction_result.metadata.get('top_image', '')
-            images = extraction_result.metadata.get('images', [])
+        # Head-only fetch: og:image/twitter:image are all this endpoint needs
+        metadata = run_async(get_article_extractor().extract_metadata(article_url))
+        if metadata:
+            top_image = metadata.get('top_image', '')
+            images = metadata.get('images', [])
             GENERIC_GOOGLE_PATTERNS = [
                 'about-products-socialshare.png',
                 'googlecast.png',
@@ -404,9 +498,12 @@ def api_article_image():
                     'success': True,
                     'image_url': top_image,
                     'all_images': images,
-                    'title': extraction_result.title or article_title,
+                    'title': metadata.get('title') or article_title,
+                    'description': metadata.get('meta_description', ''),
+                    'canonical_link': metadata.get('canonical_link', ''),
+                    'favicon': metadata.get('meta_favicon', ''),
                     'source': 'article_extraction',
-                    'extraction_method': extraction_result.extraction_method
+                    'extraction_method': 'head_metadata'
                 })
             elif images:
                 filtered_images = [img for img in images if not is_generic_google_image(img)]
@@ -416,9 +513,12 @@ def api_article_image():
                         'success': True,
                         'image_url': filtered_images[0],
                         'all_images': filtered_images,
-                        'title': extraction_result.title or article_title,
+                        'title': metadata.get('title') or article_title,
+                        'description': metadata.get('meta_description', ''),
+                        'canonical_link': metadata.get('canonical_link', ''),
+                        'favicon': metadata.get('meta_favicon', ''),
                         'source': 'article_extraction',
-                        'extraction_method': extraction_result.extraction_method
+                        'extraction_method': 'head_metadata'
                     })
         print(f"No valid article image found, using Google Images search for keyword.")
         search_query = data.get('search_query', '').strip()
@@ -464,17 +564,8 @@ def api_article_summary():
         
         start_time = time.time()
         
-        # Handle async function call properly
-        def run_async_summary():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                return loop.run_until_complete(engine.generate_article_summary(article, max_words))
-            finally:
-                loop.close()
-        
         # Generate article summary using the engine's new method
-        summary = run_async_summary()
+        summary = run_async(engine.generate_article_summary(article, max_words))
         
         processing_time = time.time() - start_time
         
@@ -494,6 +585,31 @@ def api_article_summary():
         traceback.print_exc()
         return jsonify({'error': f'Article summary generation failed: {str(e)}'}), 500
 
+@app.route('/api/article-summary/stream', methods=['POST'])
+def api_article_summary_stream():
+    """Stream the LLM summary of an article as server-sent events ('token' events, then 'done')."""
+    data = request.get_json()
+    
+    if not data or 'article' not in data:
+        return jsonify({'error': 'No article provided'}), 400
+    
+    article = data['article']
+    max_words = data.get('max_words', 120)
+    
+    print(f"Streaming summary for article: {article.get('title', 'Unknown')[:50]}...")
+    
+    return summary_stream_response(
+        engine.stream_article_summary(article, max_words),
+        lambda summary, cached, processing_time: {
+            'summary': summary,
+            'processing_time': processing_time,
+            'word_count': len(summary.split()),
+            'max_words': max_words,
+            'cached': cached,
+            'llm_used': engine.ollama_analyzer is not None and engine.ollama_analyzer.is_service_available()
+        }
+    )
+
 @app.route('/api/batch-article-summaries', methods=['POST'])
 def api_batch_article_summaries():
     """Generate LLM summaries for multiple articles efficiently."""
@@ -511,25 +627,19 @@ def api_batch_article_summaries():
         start_time = time.time()
         summaries = []
         
-        def run_async_summary(article):
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                return loop.run_until_complete(engine.generate_article_summary(article, max_words))
-            finally:
-                loop.close()
-        
-        for i, article in enumerate(articles):
-            try:
-                summary = run_async_summary(article)
+        try:
+            # One call: extraction runs concurrently and the LLM summarizes several articles per prompt
+            results = run_async(engine.generate_article_summaries(articles, max_words))
+            for i, (article, summary) in enumerate(zip(articles, results)):
                 summaries.append({
                     'index': i,
                     'summary': summary,
                     'title': article.get('title', 'Unknown'),
                     'source': article.get('source', 'Unknown')
                 })
-            except Exception as e:
-                print(f"Failed to generate summary for article {i}: {e}")
+        except Exception as e:
+            print(f"Failed to generate batch summaries: {e}")
+            for i, article in enumerate(articles):
                 summaries.append({
                     'index': i,
                     'summary': article.get('title', 'Article content available.')[:100] + '...',
@@ -573,25 +683,8 @@ def api_article_content():
         
         start_time = time.time()
         
-        # Import the ArticleExtractor
-        from app.core.article_extractor import ArticleExtractor
-        
-        # Extract article content using async function
-        async def extract_article_content():
-            extractor = ArticleExtractor()
-            result = await extractor.extract_article_content(article_url)
-            return result
-        
-        # Run the extraction in a new event loop
-        def run_extraction():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                return loop.run_until_complete(extract_article_content())
-            finally:
-                loop.close()
-        
-        extraction_result = run_extraction()
+        # Extract with the engine's shared extractor (reuses its session and cache)
+        extraction_result = run_async(get_article_extractor().extract_article_content(article_url))
         processing_time = time.time() - start_time
         
         if extraction_result.success:
@@ -633,7 +726,7 @@ def api_article_content():
 
 @app.route('/api/llm-health')
 def api_llm_health():
-    """Check LLM service health."""
+    """Report LLM service health from the cached background probe (?refresh=1 starts a new probe)."""
     try:
         health_info = {
             'ollama_available': engine.ollama_analyzer is not None,
@@ -643,11 +736,15 @@ def api_llm_health():
         }
         
         if engine.ollama_analyzer:
-            ollama_health = engine.ollama_analyzer.health_check()
+            refresh = request.args.get('refresh', '').lower() in ('1', 'true', 'yes')
+            ollama_health = engine.ollama_analyzer.health_check(refresh=refresh)
             health_info.update({
                 'ollama_status': ollama_health.get('status', 'unknown'),
                 'model': ollama_health.get('model'),
                 'response_time': ollama_health.get('response_time'),
+                'model_loaded': ollama_health.get('loaded'),
+                'status_age': ollama_health.get('age'),
+                'queue': ollama_health.get('queue'),
                 'error': ollama_health.get('error')
             })
         
@@ -1538,11 +1635,8 @@ def debug_google_news():
         print(f"Input URL: {google_url}")
         
         # Use the existing article extractor
-        from app.core.article_extractor import ArticleExtractor
-        import asyncio
-        
         async def debug_extraction():
-            extractor = ArticleExtractor()
+            extractor = get_article_extractor()
             
             # Test URL resolution
             print("Testing URL resolution...")
@@ -1553,16 +1647,10 @@ def debug_google_news():
             print("Testing full extraction...")
             result = await extractor.extract_article_content(google_url)
             
-            await extractor.cleanup()
             return resolved_url, result
         
         # Run the async debugging
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            resolved_url, extraction_result = loop.run_until_complete(debug_extraction())
-        finally:
-            loop.close()
+        resolved_url, extraction_result = run_async(debug_extraction())
         
         debug_info = {
             'original_url': google_url,
@@ -8,6 +8,11 @@ from difflib import SequenceMatcher
 from .combiner import ContentCombiner
 from .deduplicator import Deduplicator
 from .scorer import ContentScorer
+from .minhash import MinHasher, LSHIndex, normalize_text, shingle
+from .story_index import StoryClusterIndex
+from .ranker import StreamingRanker
+from .domain_reputation import DomainReputation, get_domain_reputation
+from .entities import EntityRegistry, get_entity_registry
 
 
 class NewsAggregator:
@@ -20,23 +25,31 @@ class NewsAggregator:
         self.deduplication_threshold = aggregator_config.get('deduplication_threshold', 0.8)
         self.max_articles_per_source = aggregator_config.get('max_articles_per_source', 5)
         self.min_article_length = aggregator_config.get('min_article_length', 100)
+        self.shingle_size = aggregator_config.get('shingle_size', 4)
+        self.lsh_num_perm = aggregator_config.get('lsh_num_perm', 128)
+        self.lsh_bands = aggregator_config.get('lsh_bands', 32)
+        self.minhasher = MinHasher(self.lsh_num_perm)
     
     def deduplicate(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Remove duplicate articles based on content similarity."""
         unique_articles = []
+        index = LSHIndex(self.lsh_num_perm, self.lsh_bands)
         
         for article in articles:
+            content = article.get('content', '')
+            signature = self.minhasher.signature(shingle(normalize_text(content), self.shingle_size))
+            
+            # Only verify articles that share an LSH band, in keep order
             is_duplicate = False
-            for existing in unique_articles:
-                similarity = self._calculate_similarity(
-                    article.get('content', ''),
-                    existing.get('content', '')
-                )
-                if similarity >= self.deduplication_threshold:
+            for position in sorted(index.query(signature)):
+                matcher = SequenceMatcher(None, content, unique_articles[position].get('content', ''))
+                if (matcher.quick_ratio() >= self.deduplication_threshold and
+                        matcher.ratio() >= self.deduplication_threshold):
                     is_duplicate = True
                     break
             
             if not is_duplicate:
+                index.insert(len(unique_articles), signature)
                 unique_articles.append(article)
         
         return unique_articles
@@ -82,5 +95,11 @@ class NewsAggregator:
 __all__ = [
     'ContentCombiner',
     'Deduplicator',
-    'ContentScorer'
+    'ContentScorer',
+    'StoryClusterIndex',
+    'StreamingRanker',
+    'DomainReputation',
+    'get_domain_reputation',
+    'EntityRegistry',
+    'get_entity_registry'
 ]
@@ -6,22 +6,27 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 import hashlib
 
+from .domain_reputation import DomainReputation, get_domain_reputation
+from .timestamps import item_timestamp
+
 
 class ContentCombiner:
     """Combines content from multiple sources into a unified format."""
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, reputation: Optional[DomainReputation] = None):
         """
         Initialize the content combiner.
         
         Args:
             config: Configuration dictionary with combiner settings
+            reputation: Domain reputation service (defaults to the shared one)
         """
         self.config = config or {}
         self.max_items_per_source = self.config.get('max_items_per_source', 100)
         self.preserve_source_metadata = self.config.get('preserve_source_metadata', True)
         self.source_credibility = {}
         self._load_source_credibility()
+        self.reputation = reputation or get_domain_reputation()
     
     def _load_source_credibility(self):
         """Load source credibility information from hardcoded data."""
@@ -136,6 +141,11 @@ class ContentCombiner:
             ).hexdigest()
             item['id'] = f"{source}_{content_hash}"
         
+        # Sources we have no rating for are judged by the item's domain instead
+        credibility = cred_info['score']
+        if cred_info['type'] == 'unknown' and item.get('url'):
+            credibility = self.reputation.score(item['url'])
+        
         # Ensure required fields
         standardized = {
             'id': item['id'],
@@ -145,9 +155,10 @@ class ContentCombiner:
             'source': source,
             'source_type': cred_info['type'],
             'source_category': cred_info['category'],
-            'credibility_score': cred_info['score'],
+            'credibility_score': credibility,
             'bias_rating': cred_info['bias'],
             'published': item.get('published', datetime.utcnow().isoformat()),
+            'published_ts': item_timestamp(item),
             'author': item.get('author', ''),
             'metadata': {}
         }
@@ -162,13 +173,8 @@ class ContentCombiner:
     
     def _get_sort_key(self, item: Dict[str, Any]) -> tuple:
         """Get sort key for an item, prioritizing timestamp then relevance."""
-        try:
-            # Try to parse timestamp
-            timestamp = datetime.fromisoformat(item.get('published', '').replace('Z', '+00:00'))
-            return (timestamp, item.get('relevance_score', 0))
-        except (ValueError, TypeError):
-            # Fall back to relevance score
-            return (datetime.min, item.get('relevance_score', 0))
+        timestamp = item_timestamp(item)
+        return (timestamp if timestamp is not None else float('-inf'), item.get('relevance_score', 0))
     
     def get_source_statistics(self, combined_items: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
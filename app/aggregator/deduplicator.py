@@ -3,28 +3,62 @@ Deduplicator module for removing duplicate content items.
 """
 
 from typing import List, Dict, Any, Optional, Set, Tuple
+from dataclasses import dataclass
 import hashlib
-import re
 from difflib import SequenceMatcher
 from urllib.parse import urlparse
 
+import numpy as np
+
+from .minhash import MinHasher, LSHIndex, normalize_text, shingle
+from .text_view import text_view
+from .story_index import StoryClusterIndex
+from .url_canonicalizer import URLCanonicalizer, get_url_canonicalizer
+
+
+@dataclass
+class ItemFingerprint:
+    """Normalized fields and MinHash signature computed once per item."""
+    title: str
+    content: str
+    url: str
+    signature: np.ndarray
+
+    @property
+    def empty(self) -> bool:
+        """True when there is no text to shingle (the signature is then meaningless)."""
+        return not self.title and not self.content
+
 
 class Deduplicator:
     """Removes duplicate content items using various similarity detection methods."""
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, story_index: Optional[StoryClusterIndex] = None,
+                 canonicalizer: Optional[URLCanonicalizer] = None):
         """
         Initialize the deduplicator.
         
         Args:
             config: Configuration dictionary with deduplication settings
+            story_index: Persistent story-cluster index; when given, duplicates
+                are found by cluster lookup instead of pairwise verification
+            canonicalizer: URL canonicalizer (defaults to the shared one)
         """
         self.config = config or {}
+        self.story_index = story_index
+        self.canonicalizer = canonicalizer or get_url_canonicalizer()
         self.similarity_threshold = self.config.get('similarity_threshold', 0.8)
         self.title_threshold = self.config.get('title_threshold', 0.9)
         self.url_threshold = self.config.get('url_threshold', 0.95)
         self.content_threshold = self.config.get('content_threshold', 0.85)
         self.min_content_length = self.config.get('min_content_length', 50)
+        
+        # Near-duplicate candidate generation (MinHash + LSH banding)
+        self.shingle_size = self.config.get('shingle_size', 4)
+        self.lsh_num_perm = self.config.get('lsh_num_perm', 128)
+        self.lsh_bands = self.config.get('lsh_bands', 32)
+        # Signatures must be comparable with the story index's cluster signatures
+        self.minhasher = story_index.minhasher if story_index is not None else MinHasher(self.lsh_num_perm)
     
     def deduplicate(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -41,70 +75,159 @@ class Deduplicator:
         
         unique_items = []
         seen_hashes = set()
+        seen_urls: Dict[str, Dict[str, Any]] = {}
         processed_items = []
+        item_hashes = []
         
-        # First pass: exact duplicates by hash
+        # First pass: exact duplicates by content hash, then by canonical URL
         for item in items:
             item_hash = self._generate_content_hash(item)
-            if item_hash not in seen_hashes:
-                seen_hashes.add(item_hash)
-                processed_items.append(item)
+            if item_hash in seen_hashes:
+                continue
+            seen_hashes.add(item_hash)
+            
+            canonical_url = self._normalize_url(self._item_url(item))
+            if canonical_url in seen_urls:
+                self._merge_duplicate_metadata(seen_urls[canonical_url], item)
+                continue
+            if canonical_url:
+                seen_urls[canonical_url] = item
+            
+            processed_items.append(item)
+            item_hashes.append(item_hash)
+        
+        if self.story_index is not None:
+            return self._deduplicate_by_cluster(processed_items, item_hashes)
+        
+        # Second pass: similarity-based deduplication, only against LSH candidates
+        index = LSHIndex(self.lsh_num_perm, self.lsh_bands)
+        url_index: Dict[str, int] = {}
+        unique_fingerprints: List[ItemFingerprint] = []
         
-        # Second pass: similarity-based deduplication
         for item in processed_items:
-            is_duplicate = False
+            fingerprint = self._fingerprint(item)
+            candidates = set(index.query(fingerprint.signature))
+            if fingerprint.url in url_index:
+                candidates.add(url_index[fingerprint.url])
             
-            for existing_item in unique_items:
-                if self._are_similar(item, existing_item):
-                    # Merge metadata from duplicate into existing item
-                    self._merge_duplicate_metadata(existing_item, item)
-                    is_duplicate = True
+            # Check candidates in keep order so the first similar item still wins
+            match = None
+            for position in sorted(candidates):
+                if self._fingerprints_similar(fingerprint, unique_fingerprints[position]):
+                    match = position
                     break
             
-            if not is_duplicate:
+            if match is not None:
+                # Merge metadata from duplicate into existing item
+                self._merge_duplicate_metadata(unique_items[match], item)
+            else:
+                position = len(unique_items)
                 unique_items.append(item)
+                unique_fingerprints.append(fingerprint)
+                index.insert(position, fingerprint.signature)
+                if fingerprint.url:
+                    url_index.setdefault(fingerprint.url, position)
         
         return unique_items
     
-    def _generate_content_hash(self, item: Dict[str, Any]) -> str:
-        """Generate a hash for exact duplicate detection."""
-        # Normalize content for hashing
-        title = self._normalize_text(item.get('title', ''))
-        content = self._normalize_text(item.get('content', ''))
-        url = self._normalize_url(item.get('url', ''))
+    def _deduplicate_by_cluster(self, items: List[Dict[str, Any]], item_hashes: List[str]) -> List[Dict[str, Any]]:
+        """
+        Keep the first item of each story cluster and attach cluster siblings.
+
+        A cluster match only nominates a duplicate; the item is merged away when
+        it also passes the configured similarity/URL thresholds against the item
+        kept for that cluster. Items without text are never clustered.
+        """
+        unique_items = []
+        kept_by_cluster: Dict[str, List[Tuple[Dict[str, Any], ItemFingerprint]]] = {}
         
-        # Create hash from normalized content
-        hash_content = f"{title}|{content[:200]}|{url}"
-        return hashlib.md5(hash_content.encode()).hexdigest()
+        for item, item_hash in zip(items, item_hashes):
+            fingerprint = self._fingerprint(item)
+            if fingerprint.empty:
+                unique_items.append(item)
+                continue
+            keys = [item_hash, f"url:{fingerprint.url}" if fingerprint.url else '']
+            cluster_id = self.story_index.assign(keys, fingerprint.signature, item)
+            item['story_cluster_id'] = cluster_id
+            
+            kept = kept_by_cluster.setdefault(cluster_id, [])
+            match = next((kept_item for kept_item, kept_fingerprint in kept
+                          if self._fingerprints_similar(fingerprint, kept_fingerprint)), None)
+            if match is not None:
+                self._merge_duplicate_metadata(match, item)
+                continue
+            
+            kept.append((item, fingerprint))
+            unique_items.append(item)
+        
+        for item in unique_items:
+            if 'story_cluster_id' in item:
+                item['cluster_sources'] = self.story_index.siblings(
+                    item['story_cluster_id'], exclude_url=self._item_url(item)
+                )
+        
+        return unique_items
     
-    def _are_similar(self, item1: Dict[str, Any], item2: Dict[str, Any]) -> bool:
-        """Check if two items are similar enough to be considered duplicates."""
-        # Check URL similarity first (most reliable)
-        url_similarity = self._calculate_url_similarity(
-            item1.get('url', ''), item2.get('url', '')
+    def _fingerprint(self, item: Dict[str, Any]) -> ItemFingerprint:
+        """Normalize an item's fields and sign its title + content once."""
+        view = text_view(item)
+        title = view.normalized_title
+        content = view.normalized_content
+        signature = self.minhasher.signature(shingle(f"{title} {content}".strip(), self.shingle_size))
+        return ItemFingerprint(
+            title=title,
+            content=content,
+            url=self._normalize_url(self._item_url(item)),
+            signature=signature
         )
+    
+    def _fingerprints_similar(self, fp1: ItemFingerprint, fp2: ItemFingerprint) -> bool:
+        """Verify an LSH candidate pair with the configured thresholds."""
+        url_similarity = self._normalized_url_similarity(fp1.url, fp2.url)
         if url_similarity >= self.url_threshold:
             return True
         
-        # Check title similarity
-        title_similarity = self._calculate_text_similarity(
-            item1.get('title', ''), item2.get('title', '')
-        )
+        title_matcher = self._matcher(fp1.title, fp2.title)
+        content_matcher = self._matcher(fp1.content, fp2.content)
         
-        # Check content similarity
-        content_similarity = self._calculate_text_similarity(
-            item1.get('content', ''), item2.get('content', '')
+        # Cheap upper bound first; most false candidates stop here
+        upper_bound = (
+            (title_matcher.quick_ratio() if title_matcher else 0.0) * 0.4 +
+            (content_matcher.quick_ratio() if content_matcher else 0.0) * 0.4 +
+            url_similarity * 0.2
         )
+        if upper_bound < self.similarity_threshold:
+            return False
         
-        # Combine similarities with weights
         overall_similarity = (
-            title_similarity * 0.4 +
-            content_similarity * 0.4 +
+            (title_matcher.ratio() if title_matcher else 0.0) * 0.4 +
+            (content_matcher.ratio() if content_matcher else 0.0) * 0.4 +
             url_similarity * 0.2
         )
-        
         return overall_similarity >= self.similarity_threshold
     
+    def _matcher(self, text1: str, text2: str) -> Optional[SequenceMatcher]:
+        """SequenceMatcher over normalized texts, or None when either is empty."""
+        if not text1 or not text2:
+            return None
+        return SequenceMatcher(None, text1, text2)
+    
+    def _generate_content_hash(self, item: Dict[str, Any]) -> str:
+        """Generate a hash for exact duplicate detection."""
+        # Normalized content from the shared text view
+        view = text_view(item)
+        title = view.normalized_title
+        content = view.normalized_content
+        url = self._normalize_url(self._item_url(item))
+        
+        # Create hash from normalized content
+        hash_content = f"{title}|{content[:200]}|{url}"
+        return hashlib.md5(hash_content.encode()).hexdigest()
+    
+    def _are_similar(self, item1: Dict[str, Any], item2: Dict[str, Any]) -> bool:
+        """Check if two items are similar enough to be considered duplicates."""
+        return self._fingerprints_similar(self._fingerprint(item1), self._fingerprint(item2))
+    
     def _calculate_text_similarity(self, text1: str, text2: str) -> float:
         """Calculate similarity between two text strings."""
         if not text1 or not text2:
@@ -125,17 +248,20 @@ class Deduplicator:
         if not url1 or not url2:
             return 0.0
         
-        # Normalize URLs
-        norm_url1 = self._normalize_url(url1)
-        norm_url2 = self._normalize_url(url2)
+        return self._normalized_url_similarity(self._normalize_url(url1), self._normalize_url(url2))
+    
+    def _normalized_url_similarity(self, norm_url1: str, norm_url2: str) -> float:
+        """Calculate similarity between two already-normalized URLs."""
+        if not norm_url1 or not norm_url2:
+            return 0.0
         
         if norm_url1 == norm_url2:
             return 1.0
         
-        # Parse URLs for component comparison
+        # Parse URLs for component comparison (canonical keys have no scheme)
         try:
-            parsed1 = urlparse(norm_url1)
-            parsed2 = urlparse(norm_url2)
+            parsed1 = urlparse(f"//{norm_url1}")
+            parsed2 = urlparse(f"//{norm_url2}")
             
             # Compare domains
             if parsed1.netloc != parsed2.netloc:
@@ -154,40 +280,17 @@ class Deduplicator:
             # Fallback to string similarity
             return SequenceMatcher(None, norm_url1, norm_url2).ratio()
     
+    def _item_url(self, item: Dict[str, Any]) -> str:
+        """Item URL; scrapers emit either 'url' or 'link'."""
+        return item.get('url') or item.get('link', '')
+    
     def _normalize_text(self, text: str) -> str:
         """Normalize text for comparison."""
-        if not text:
-            return ""
-        
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        # Remove common punctuation
-        text = re.sub(r'[^\w\s]', '', text)
-        
-        return text
+        return normalize_text(text)
     
     def _normalize_url(self, url: str) -> str:
-        """Normalize URL for comparison."""
-        if not url:
-            return ""
-        
-        # Remove common URL parameters that don't affect content
-        url = re.sub(r'[?&](utm_[^&]*|ref[^&]*|source[^&]*|medium[^&]*)', '', url)
-        
-        # Remove trailing slash
-        url = url.rstrip('/')
-        
-        # Convert to lowercase
-        url = url.lower()
-        
-        # Remove www. prefix
-        url = re.sub(r'://www\.', '://', url)
-        
-        return url
+        """Canonicalize URL for comparison (redirect wrappers, AMP/mobile, tracking params)."""
+        return self.canonicalizer.canonicalize(url)
     
     def _merge_duplicate_metadata(self, existing_item: Dict[str, Any], duplicate_item: Dict[str, Any]):
         """Merge metadata from duplicate item into existing item."""
@@ -202,6 +305,6 @@ class Deduplicator:
         
         existing_item['duplicate_sources'].append({
             'source_type': duplicate_item.get('source_type'),
-            'url': duplicate_item.get('url'),
+            'url': self._item_url(duplicate_item) or None,
             'id': duplicate_item.get('id')
         })
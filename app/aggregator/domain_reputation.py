@@ -0,0 +1,266 @@
+"""
+Memoized domain reputation lookups.
+
+Resolves a URL to its host and registrable domain (public-suffix aware, so
+bbc.co.uk is a domain and co.uk is not) and scores it against a suffix trie
+of trusted domains in which subdomains inherit their parent's score
+(news.bbc.co.uk -> bbc.co.uk, cdc.gov -> gov). Inheritance stops at hosting
+platforms: alice.medium.com is its own site, not medium.com. The same hosts
+recur across every search, so final scores are kept in an LRU memo per host.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, Iterable, Optional, Tuple
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Hosting platforms where each subdomain is a separate site
+HOSTING_SUFFIXES = frozenset({
+    'github.io', 'gitlab.io', 'blogspot.com', 'wordpress.com', 'substack.com', 'medium.com',
+    'tumblr.com', 'herokuapp.com', 'netlify.app', 'vercel.app', 'pages.dev', 'appspot.com'
+})
+
+# Multi-label public suffixes we see in practice; single-label TLDs are implicit
+PUBLIC_SUFFIXES = HOSTING_SUFFIXES | frozenset({
+    'co.uk', 'org.uk', 'ac.uk', 'gov.uk', 'ltd.uk', 'plc.uk', 'me.uk', 'net.uk', 'nhs.uk', 'police.uk',
+    'com.au', 'net.au', 'org.au', 'edu.au', 'gov.au', 'asn.au', 'id.au',
+    'co.nz', 'org.nz', 'ac.nz', 'govt.nz', 'net.nz',
+    'co.jp', 'ne.jp', 'or.jp', 'ac.jp', 'go.jp',
+    'co.kr', 'or.kr', 'ac.kr', 'go.kr',
+    'co.in', 'net.in', 'org.in', 'ac.in', 'gov.in', 'nic.in',
+    'com.cn', 'net.cn', 'org.cn', 'edu.cn', 'gov.cn',
+    'com.hk', 'org.hk', 'edu.hk', 'gov.hk',
+    'com.tw', 'org.tw', 'edu.tw', 'gov.tw',
+    'com.sg', 'org.sg', 'edu.sg', 'gov.sg',
+    'com.my', 'org.my', 'edu.my', 'gov.my',
+    'co.za', 'org.za', 'ac.za', 'gov.za',
+    'com.br', 'org.br', 'gov.br', 'edu.br',
+    'com.ar', 'org.ar', 'gob.ar', 'com.mx', 'org.mx', 'gob.mx', 'edu.mx',
+    'com.tr', 'org.tr', 'gov.tr', 'edu.tr',
+    'co.il', 'org.il', 'ac.il', 'gov.il',
+    'com.ng', 'gov.ng', 'co.ke', 'go.ke', 'com.pk', 'gov.pk', 'com.ph', 'gov.ph',
+    'com.ua', 'gov.ua', 'com.ru', 'com.es', 'com.pl', 'co.id', 'go.id', 'ac.id', 'or.id',
+    'co.th', 'go.th', 'ac.th', 'com.vn', 'gov.vn', 'com.sa', 'gov.sa', 'com.eg', 'gov.eg'
+})
+
+# Scores at or above this mark a high-credibility domain
+HIGH_REPUTATION = 0.85
+
+DEFAULT_TRUSTED_DOMAINS = {
+    # News sources
+    'reuters.com': 0.95,
+    'bbc.com': 0.95,
+    'bbc.co.uk': 0.95,
+    'apnews.com': 0.95,
+    'npr.org': 0.90,
+    'cnn.com': 0.85,
+    'nytimes.com': 0.90,
+    'washingtonpost.com': 0.90,
+    'theguardian.com': 0.85,
+    'wsj.com': 0.90,
+
+    # Reference and science
+    'wikipedia.org': 0.85,
+    'britannica.com': 0.90,
+    'nature.com': 0.95,
+    'science.org': 0.95,
+
+    # Academic and research
+    'arxiv.org': 0.95,
+    'pubmed.ncbi.nlm.nih.gov': 0.95,
+    'scholar.google.com': 0.90,
+    'researchgate.net': 0.85,
+    'ieee.org': 0.90,
+    'acm.org': 0.90,
+
+    # Government, education and generic TLDs
+    'gov': 0.90,
+    'edu': 0.85,
+    'org': 0.70,
+    'com': 0.60,
+
+    # Tech sources
+    'github.com': 0.80,
+    'stackoverflow.com': 0.75,
+    'medium.com': 0.60,
+    'dev.to': 0.65,
+
+    # Social media (lower credibility)
+    'twitter.com': 0.40,
+    'x.com': 0.40,
+    'facebook.com': 0.35,
+    'reddit.com': 0.50,
+    'quora.com': 0.45,
+    'youtube.com': 0.45
+}
+
+
+@lru_cache(maxsize=16384)
+def url_host(url: str) -> str:
+    """Lowercase host of a URL (or bare host), without port, trailing dot or 'www.'."""
+    if not url:
+        return ''
+    try:
+        host = urlparse(url if '://' in url else f"//{url}").hostname or ''
+    except ValueError:
+        return ''
+    host = host.rstrip('.')
+    return host[4:] if host.startswith('www.') else host
+
+
+@lru_cache(maxsize=16384)
+def registrable_domain(url: str) -> str:
+    """
+    Registrable domain of a URL or host: one label below its public suffix.
+
+    'news.bbc.co.uk' -> 'bbc.co.uk', 'alice.github.io' -> 'alice.github.io',
+    'a.b.example.com' -> 'example.com'.
+    """
+    host = url_host(url)
+    labels = host.split('.') if host else []
+    if len(labels) < 2:
+        return host
+    # Longest matching public suffix, trying three-label then two-label suffixes
+    for size in (3, 2):
+        if len(labels) > size and '.'.join(labels[-size:]) in PUBLIC_SUFFIXES:
+            return '.'.join(labels[-size - 1:])
+    return '.'.join(labels[-2:])
+
+
+class DomainTrie:
+    """Suffix trie over reversed domain labels; lookups return the most specific match."""
+
+    def __init__(self, domains: Optional[Dict[str, Any]] = None):
+        self._root: Dict[str, Any] = {}
+        for domain, value in (domains or {}).items():
+            self.insert(domain, value)
+
+    def insert(self, domain: str, value: Any):
+        node = self._root
+        for label in reversed(domain.lower().strip('.').split('.')):
+            node = node.setdefault(label, {})
+        node[None] = value
+
+    def lookup(self, host: str) -> Tuple[Optional[str], Any]:
+        """
+        Find the deepest entry that is the host itself or one of its parent domains.
+
+        Returns:
+            (matched domain, value), or (None, None) when nothing matches
+        """
+        node = self._root
+        matched, value = None, None
+        labels = host.split('.')[::-1] if host else []
+        for depth, label in enumerate(labels):
+            node = node.get(label)
+            if node is None:
+                break
+            if None in node:
+                matched, value = '.'.join(reversed(labels[:depth + 1])), node[None]
+        return matched, value
+
+
+class DomainReputation:
+    """Domain credibility scores with subdomain inheritance and an LRU memo."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the reputation service.
+
+        Args:
+            config: Settings (trusted_domains, default_score, malformed_score, cache_size)
+        """
+        self.config = config or {}
+        self.trusted_domains: Dict[str, float] = dict(self.config.get('trusted_domains', DEFAULT_TRUSTED_DOMAINS))
+        self.default_score = self.config.get('default_score', 0.50)
+        self.malformed_score = self.config.get('malformed_score', 0.30)
+        self.cache_size = self.config.get('cache_size', 8192)
+
+        self._trie = DomainTrie(self.trusted_domains)
+        self._scores: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()  # Scores are looked up from analysis executor threads
+
+    def add_domain(self, domain: str, score: float):
+        """Add or change a trusted domain score."""
+        with self._lock:
+            self.trusted_domains[domain] = score
+            self._trie.insert(domain, score)
+            self._scores.clear()
+
+    def score(self, url: str) -> Optional[float]:
+        """
+        Reputation of the URL's domain (0-1).
+
+        Returns:
+            Score of the most specific trusted entry covering the host, the
+            default score for unknown hosts, or the malformed score when no
+            host can be parsed. None for an empty URL.
+        """
+        if not url:
+            return None
+        host = url_host(url)
+        with self._lock:
+            cached = self._scores.get(host)
+            if cached is not None:
+                self._scores.move_to_end(host)
+                return cached
+
+        if not host:
+            result = self.malformed_score
+        else:
+            matched, value = self._trie.lookup(host)
+            if matched in HOSTING_SUFFIXES and registrable_domain(host) != matched:
+                value = None  # A user's site on a hosting platform does not inherit the platform's score
+            result = value if value is not None else self.default_score
+
+        with self._lock:
+            self._scores[host] = result
+            if len(self._scores) > self.cache_size:
+                self._scores.popitem(last=False)
+        return result
+
+    def is_trusted(self, url: str) -> bool:
+        """Whether the URL's domain has a high-credibility reputation."""
+        score = self.score(url)
+        return score is not None and score >= HIGH_REPUTATION
+
+
+@lru_cache(maxsize=256)
+def _domain_set_trie(domains: Tuple[str, ...]) -> DomainTrie:
+    return DomainTrie({domain: True for domain in domains})
+
+
+def in_domains(url: str, domains: Iterable[str]) -> bool:
+    """
+    Whether the URL's host is one of the domains or a subdomain of one.
+
+    Entries may be TLDs ('gov') or full domains ('bbc.com'); unlike substring
+    checks, 'gov' does not match 'govtrack.us' and 'cnn.com' does not match
+    'notcnn.com'.
+    """
+    host = url_host(url)
+    return bool(host) and _domain_set_trie(tuple(domains)).lookup(host)[1] is True
+
+
+_reputation: Optional[DomainReputation] = None
+_reputation_lock = threading.Lock()
+
+
+def get_domain_reputation(config: Optional[Dict[str, Any]] = None) -> DomainReputation:
+    """
+    Return the process-wide reputation service, creating it on first use.
+
+    The engine builds it from its own config before any analyzer or scraper
+    asks for it; a different config passed afterwards is ignored with a warning.
+    """
+    global _reputation
+    with _reputation_lock:
+        if _reputation is None:
+            _reputation = DomainReputation(config)
+        elif config and config != _reputation.config:
+            logger.warning("Domain reputation service already configured; ignoring a different config")
+        return _reputation
@@ -0,0 +1,194 @@
+"""
+File-backed entity registry.
+
+Entities (names, aliases, related terms, members and a type) are loaded once
+from config/entities.json and compiled into a single token-level alias
+automaton, so resolving the entities in a query or an item is one pass over
+its words however many entities are registered. Item results are memoized
+by content hash, so relevance analysis and scoring share one scan per item.
+"""
+
+import json
+import logging
+import os
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from .multi_pattern import TermMatcher, WORD_PATTERN
+from .text_view import TextView
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'config', 'entities.json')
+
+# Term roles, in the order an exact query match prefers them
+ROLES = ('name', 'aliases', 'members', 'related_terms')
+
+
+@dataclass
+class EntityHits:
+    """Entity mentions found in one text: entity -> role -> Counter of matched terms."""
+
+    mentions: Dict[str, Dict[str, Counter]] = field(default_factory=dict)
+
+    def __contains__(self, entity: str) -> bool:
+        return entity in self.mentions
+
+    def roles(self, entity: str) -> Dict[str, Counter]:
+        return self.mentions.get(entity, {})
+
+    def has_term(self, entity: str, term: str) -> bool:
+        """Whether a specific (normalized) term of the entity was matched."""
+        return any(term in counter for counter in self.roles(entity).values())
+
+    def named(self, entity: str) -> bool:
+        """Whether the entity itself (by name or alias) is mentioned, not only related terms."""
+        roles = self.roles(entity)
+        return bool(roles.get('name') or roles.get('aliases'))
+
+
+def normalize_term(term: str) -> str:
+    """Lowercase word tokens joined by single spaces, the form terms are matched in."""
+    return ' '.join(WORD_PATTERN.findall(term.lower()))
+
+
+class EntityRegistry:
+    """Known entities compiled into one alias matcher."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Load and compile the registry.
+
+        Args:
+            config: Registry settings (path, cache_size); an 'entities' mapping
+                overrides the file
+        """
+        self.config = config or {}
+        self.path = self.config.get('path', DEFAULT_PATH)
+        self.cache_size = self.config.get('cache_size', 8192)
+
+        entities = self.config.get('entities')
+        self.entities: Dict[str, Dict[str, Any]] = self._normalize_entities(
+            entities if entities is not None else self.load()
+        )
+
+        # Normalized term -> [(entity, role)] for exact query lookups; automaton for text scans
+        self._exact: Dict[str, List[Tuple[str, str]]] = {}
+        self._roles: Dict[Tuple[str, str], str] = {}
+        terms: Dict[str, List[str]] = {}
+        for name, info in self.entities.items():
+            for role in ROLES:
+                for term in ([name] if role == 'name' else info[role]):
+                    normalized = normalize_term(term)
+                    if not normalized or (name, normalized) in self._roles:
+                        continue
+                    self._exact.setdefault(normalized, []).append((name, role))
+                    self._roles[(name, normalized)] = role
+                    terms.setdefault(name, []).append(normalized)
+        self.matcher = TermMatcher(terms)
+
+        self._item_hits: "OrderedDict[str, EntityHits]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.scan_query = lru_cache(maxsize=1024)(self._scan_query)
+
+    def load(self) -> Dict[str, Any]:
+        """Read the entity file; a missing or unreadable file gives an empty registry."""
+        if not self.path or not os.path.exists(self.path):
+            logger.info(f"No entity registry at {self.path}")
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entities = json.load(f).get('entities', {})
+            logger.info(f"Loaded {len(entities)} entities from {self.path}")
+            return entities
+        except Exception as e:
+            logger.warning(f"Could not load entity registry from {self.path}: {e}")
+            return {}
+
+    @staticmethod
+    def _normalize_entities(entities: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        return {
+            name.lower(): {
+                'type': info.get('type'),
+                'aliases': [term.lower() for term in info.get('aliases', [])],
+                'related_terms': [term.lower() for term in info.get('related_terms', [])],
+                'members': [term.lower() for term in info.get('members', [])]
+            }
+            for name, info in entities.items()
+        }
+
+    def entity_types(self) -> Dict[str, List[str]]:
+        """Entity type -> entity names, in registry order."""
+        types: Dict[str, List[str]] = {}
+        for name, info in self.entities.items():
+            if info['type']:
+                types.setdefault(info['type'], []).append(name)
+        return types
+
+    def type_counts(self, hits: EntityHits) -> Counter:
+        """Entity type -> number of distinct entities of that type named in the hits."""
+        return Counter(
+            self.entities[name]['type'] for name in hits.mentions
+            if self.entities[name]['type'] and hits.named(name)
+        )
+
+    def lookup(self, query: str) -> Optional[str]:
+        """
+        The entity a whole query names exactly (by name, alias or member).
+
+        Returns:
+            Entity name, or None
+        """
+        for name, role in self._exact.get(normalize_term(query or ''), []):
+            if role != 'related_terms':
+                return name
+        return None
+
+    def scan(self, tokens: Iterable[str]) -> EntityHits:
+        """Resolve every entity mention in a token stream in one pass."""
+        hits = EntityHits()
+        for name, term in self.matcher.matches(tokens):
+            role = self._roles[(name, term)]
+            hits.mentions.setdefault(name, {}).setdefault(role, Counter())[term] += 1
+        return hits
+
+    def _scan_query(self, query: str) -> EntityHits:
+        return self.scan(WORD_PATTERN.findall(query.lower()))
+
+    def item_entities(self, view: TextView) -> EntityHits:
+        """Entity mentions in an item's title and content, memoized by content hash."""
+        key = view.content_hash
+        with self._lock:
+            hits = self._item_hits.get(key)
+            if hits is not None:
+                self._item_hits.move_to_end(key)
+                return hits
+        hits = self.scan(view.words)
+        with self._lock:
+            self._item_hits[key] = hits
+            while len(self._item_hits) > self.cache_size:
+                self._item_hits.popitem(last=False)
+        return hits
+
+
+_registry: Optional[EntityRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_entity_registry(config: Optional[Dict[str, Any]] = None) -> EntityRegistry:
+    """
+    Return the process-wide entity registry, loading it on first use.
+
+    The engine builds it from its own config and passes it to the analyzers;
+    a different config passed afterwards is ignored with a warning.
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = EntityRegistry(config)
+        elif config and config != _registry.config:
+            logger.warning("Entity registry already loaded; ignoring a different config")
+        return _registry
@@ -0,0 +1,114 @@
+"""
+MinHash signatures and an LSH bucket index for near-duplicate detection.
+
+Each item is shingled and signed once; LSH banding then yields a small set of
+candidate pairs, so deduplication no longer compares every item with every
+other item.
+"""
+
+import re
+import zlib
+from typing import Dict, Hashable, Iterable, List, Set
+
+import numpy as np
+
+# Universal hashing h(x) = (a*x + b) mod p over the 61-bit Mersenne prime
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase, strip punctuation and collapse whitespace."""
+    if not text:
+        return ""
+    text = re.sub(r'\s+', ' ', text.lower()).strip()
+    return re.sub(r'[^\w\s]', '', text)
+
+
+def shingle(text: str, size: int = 4) -> Set[int]:
+    """
+    Hash the character shingles of already-normalized text.
+
+    Args:
+        text: Normalized text
+        size: Shingle length in characters
+
+    Returns:
+        Set of 32-bit shingle hashes
+    """
+    if not text:
+        return set()
+    if len(text) <= size:
+        return {zlib.crc32(text.encode())}
+    return {zlib.crc32(text[i:i + size].encode()) for i in range(len(text) - size + 1)}
+
+
+class MinHasher:
+    """Computes fixed-length MinHash signatures from shingle hashes."""
+
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        """
+        Initialize the hash family.
+
+        Args:
+            num_perm: Number of hash permutations (signature length)
+            seed: Seed for the permutation parameters; signatures are only
+                comparable between hashers built with the same seed and size
+        """
+        self.num_perm = num_perm
+        generator = np.random.RandomState(seed)
+        self._a = generator.randint(1, np.iinfo(np.int64).max, size=num_perm, dtype=np.int64).astype(np.uint64)
+        self._b = generator.randint(0, np.iinfo(np.int64).max, size=num_perm, dtype=np.int64).astype(np.uint64)
+
+    def signature(self, shingles: Iterable[int]) -> np.ndarray:
+        """Return the MinHash signature (uint64 array) for a set of shingle hashes."""
+        values = np.fromiter(shingles, dtype=np.uint64)
+        if values.size == 0:
+            return np.full(self.num_perm, MAX_HASH, dtype=np.uint64)
+        # uint64 products wrap around, which is fine for hashing purposes
+        with np.errstate(over='ignore'):
+            hashed = (np.outer(self._a, values) + self._b[:, None]) % MERSENNE_PRIME
+        return (hashed & MAX_HASH).min(axis=1)
+
+    @staticmethod
+    def jaccard(signature1: np.ndarray, signature2: np.ndarray) -> float:
+        """Estimate Jaccard similarity from two signatures."""
+        return float(np.mean(signature1 == signature2))
+
+
+class LSHIndex:
+    """Banded locality-sensitive hashing index over MinHash signatures."""
+
+    def __init__(self, num_perm: int = 128, bands: int = 32):
+        """
+        Initialize the index.
+
+        Args:
+            num_perm: Signature length; must be divisible by bands
+            bands: Number of bands. More bands lower the similarity at which
+                pairs become candidates (roughly (1/bands) ** (1/rows))
+        """
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets: List[Dict[bytes, List[Hashable]]] = [{} for _ in range(bands)]
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def insert(self, key: Hashable, signature: np.ndarray):
+        """Add a signature to every band bucket it falls into."""
+        for band, band_key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(band_key, []).append(key)
+
+    def query(self, signature: np.ndarray) -> List[Hashable]:
+        """Return keys sharing at least one band with the signature, in insertion order per band."""
+        seen = set()
+        candidates = []
+        for band, band_key in enumerate(self._band_keys(signature)):
+            for key in self._buckets[band].get(band_key, ()):
+                if key not in seen:
+                    seen.add(key)
+                    candidates.append(key)
+        return candidates
@@ -0,0 +1,94 @@
+"""
+Single-pass multi-pattern term matching.
+
+Term lists from several categories are compiled once into an Aho-Corasick
+automaton whose alphabet is word tokens, so a document that has already
+been tokenized (see text_view) is scanned in one pass over its words,
+however many terms and categories there are.
+"""
+
+import re
+from collections import Counter, deque
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+WORD_PATTERN = re.compile(r'\b\w+\b')
+
+
+class TermMatcher:
+    """Aho-Corasick automaton over word tokens, reporting hits per category."""
+
+    def __init__(self, categories: Dict[str, Iterable[str]]):
+        """
+        Compile the automaton.
+
+        Args:
+            categories: Category name -> terms (single words or phrases)
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[str, str]]] = [[]]
+        self.categories = list(categories)
+
+        for category, terms in categories.items():
+            for term in terms:
+                tokens = WORD_PATTERN.findall(term.lower())
+                if tokens:
+                    self._insert(tokens, (category, term))
+        self._build_failure_links()
+
+    def _insert(self, tokens: List[str], label: Tuple[str, str]):
+        state = 0
+        for token in tokens:
+            next_state = self._goto[state].get(token)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][token] = next_state
+            state = next_state
+        self._output[state].append(label)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(token, 0)
+                # Inherit matches that end here through the failure link (shorter suffixes)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def scan(self, tokens: Iterable[str]) -> Dict[str, Counter]:
+        """
+        Find every term occurrence in a token stream.
+
+        Args:
+            tokens: Lowercase word tokens
+
+        Returns:
+            Category -> Counter of matched terms (occurrence counts)
+        """
+        hits: Dict[str, Counter] = {category: Counter() for category in self.categories}
+        for category, term in self.matches(tokens):
+            hits[category][term] += 1
+        return hits
+
+    def matches(self, tokens: Iterable[str]) -> Iterator[Tuple[str, str]]:
+        """
+        Yield (category, term) for every term occurrence in a token stream.
+
+        Unlike scan(), the cost does not depend on the number of categories,
+        which suits automata with one category per entity.
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for token in tokens:
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            if output[state]:
+                yield from output[state]
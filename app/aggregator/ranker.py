@@ -0,0 +1,277 @@
+"""
+Streaming top-k ranker.
+
+Keeps the best k items by composite score as results arrive, with an
+optional per-source quota so one prolific source cannot fill the page. The
+quota is soft: when too few sources remain to fill k slots within it, the
+free slots are backfilled with the best over-quota items.
+Each offer costs O(log n) and reports which items entered or left the
+ranking, so provisional rankings can be published while scrapers and the
+extractor are still running, without rescoring everything collected so far.
+"""
+
+import heapq
+import itertools
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .url_canonicalizer import canonical_key
+
+
+def item_key(item: Dict[str, Any]) -> str:
+    """Stable identity for an item across copies (canonical URL, else ID, else object identity)."""
+    url = item.get('url') or item.get('link')
+    if url:
+        return canonical_key(url)
+    if item.get('id') is not None:
+        return f"id:{item['id']}"
+    return f"obj:{id(item)}"
+
+
+def composite_score(item: Dict[str, Any]) -> float:
+    """Composite score written by ContentScorer (0 when the item is unscored)."""
+    score = item.get('score')
+    if isinstance(score, dict):
+        return score.get('composite', 0.0)
+    return item.get('composite_score', 0.0)
+
+
+@dataclass
+class RankUpdate:
+    """Changes to the ranking caused by one offer/remove call."""
+    entered: List[str] = field(default_factory=list)
+    left: List[str] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.entered or self.left)
+
+    def merge(self, other: 'RankUpdate'):
+        for key in other.entered:
+            if key in self.left:
+                self.left.remove(key)
+            elif key not in self.entered:
+                self.entered.append(key)
+        for key in other.left:
+            if key in self.entered:
+                self.entered.remove(key)
+            elif key not in self.left:
+                self.left.append(key)
+
+
+class StreamingRanker:
+    """Bounded top-k selection by composite score with per-source diversity quotas."""
+
+    def __init__(self, k: int, max_per_source: Optional[int] = None,
+                 score_func: Callable[[Dict[str, Any]], float] = composite_score,
+                 key_func: Callable[[Dict[str, Any]], str] = item_key):
+        """
+        Initialize an empty ranking.
+
+        Args:
+            k: Number of items to keep in the ranking
+            max_per_source: Maximum selected items per source (None for no quota)
+            score_func: Returns an item's ranking score
+            key_func: Returns an item's identity, used to update or remove it later
+        """
+        self.k = k
+        self.max_per_source = max_per_source
+        self.score_func = score_func
+        self.key_func = key_func
+
+        self._items: Dict[str, Dict[str, Any]] = {}
+        self._priority: Dict[str, Tuple[float, int]] = {}
+        self._selected: set = set()
+        self._source_counts: Dict[str, int] = {}
+        self._seq = itertools.count()
+
+        # Heaps with lazy deletion; entries are checked against _priority/_selected on pop
+        self._selected_heap: List[Tuple[float, int, str]] = []   # Lowest selected first
+        self._source_heaps: Dict[str, List[Tuple[float, int, str]]] = {}
+        self._reserve_heap: List[Tuple[float, int, str]] = []    # Best non-selected first
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self._selected)
+
+    def offer(self, item: Dict[str, Any]) -> RankUpdate:
+        """
+        Add an item, or update it if its key was seen before.
+
+        Returns:
+            Keys that entered and left the ranking
+        """
+        key = self.key_func(item)
+        # Rank on rounded scores and arrival order, like ContentScorer.score_batch
+        score = round(float(self.score_func(item)), 3)
+        update = RankUpdate()
+
+        if key in self._priority:
+            if self._priority[key][0] == score:
+                self._items[key] = item
+                return update
+            update.merge(self._discard(key))
+            seq = self._priority[key][1]
+        else:
+            seq = next(self._seq)
+
+        self._items[key] = item
+        self._priority[key] = (score, seq)
+        update.merge(self._place(key))
+        if update.changed:
+            self.version += 1
+        return update
+
+    def offer_many(self, items: Iterable[Dict[str, Any]]) -> RankUpdate:
+        """Offer several items, returning the combined change."""
+        update = RankUpdate()
+        for item in items:
+            update.merge(self.offer(item))
+        return update
+
+    def remove(self, key: str) -> RankUpdate:
+        """Drop an item (e.g. merged as a duplicate) and promote the best eligible replacement."""
+        if key not in self._priority:
+            return RankUpdate()
+        update = RankUpdate()
+        if key in self._selected:
+            self._unselect(key)
+            update.left.append(key)
+        del self._priority[key]
+        del self._items[key]
+        update.merge(self._refill())
+        if update.changed:
+            self.version += 1
+        return update
+
+    def sync(self, items: List[Dict[str, Any]]) -> RankUpdate:
+        """
+        Make the candidate pool match items: drop keys not present, offer the rest.
+
+        Only items whose score changed move in the heaps.
+        """
+        keep = {self.key_func(item) for item in items}
+        update = RankUpdate()
+        for key in [key for key in self._priority if key not in keep]:
+            update.merge(self.remove(key))
+        update.merge(self.offer_many(items))
+        return update
+
+    def ranking(self) -> List[Dict[str, Any]]:
+        """Selected items, best first, then over-quota items backfilling any free slots."""
+        keys = sorted(self._selected, key=lambda key: (-self._priority[key][0], self._priority[key][1]))
+        if len(keys) < self.k:
+            keys.extend(self._backfill(self.k - len(keys)))
+        return [self._items[key] for key in keys]
+
+    def _backfill(self, count: int) -> List[str]:
+        """Best live reserve keys, in score order (only over-quota items remain there when slots are free)."""
+        keys = []
+        seen = set()
+        for neg_score, seq, key in sorted(self._reserve_heap):
+            if len(keys) >= count:
+                break
+            if key in seen or key in self._selected or self._priority.get(key) != (-neg_score, seq):
+                continue  # Stale or duplicate entry
+            seen.add(key)
+            keys.append(key)
+        return keys
+
+    def _source(self, key: str) -> str:
+        return self._items[key].get('source', 'unknown')
+
+    def _place(self, key: str) -> RankUpdate:
+        update = RankUpdate()
+        source = self._source(key)
+
+        if self.max_per_source and self._source_counts.get(source, 0) >= self.max_per_source:
+            # Source is at quota: only displace that source's weakest selected item
+            weakest = self._peek(self._source_heaps.get(source, []), source)
+            if weakest is not None and self._beats(key, weakest):
+                self._unselect(weakest)
+                self._push_reserve(weakest)
+                update.left.append(weakest)
+                self._select(key)
+                update.entered.append(key)
+            else:
+                self._push_reserve(key)
+                if len(self._selected) < self.k:
+                    update.entered.append(key)  # Visible as a backfill item
+            return update
+
+        if len(self._selected) < self.k:
+            self._select(key)
+            update.entered.append(key)
+            return update
+
+        lowest = self._peek(self._selected_heap)
+        if lowest is not None and self._beats(key, lowest):
+            self._unselect(lowest)
+            self._push_reserve(lowest)
+            update.left.append(lowest)
+            self._select(key)
+            update.entered.append(key)
+        else:
+            self._push_reserve(key)
+        return update
+
+    def _discard(self, key: str) -> RankUpdate:
+        """Take a key out of the selection; its heap entries go stale."""
+        update = RankUpdate()
+        if key in self._selected:
+            self._unselect(key)
+            update.left.append(key)
+            update.merge(self._refill())
+        return update
+
+    def _refill(self) -> RankUpdate:
+        """Promote the best eligible reserve items into free slots."""
+        update = RankUpdate()
+        skipped = []
+        while len(self._selected) < self.k and self._reserve_heap:
+            neg_score, seq, key = heapq.heappop(self._reserve_heap)
+            if key in self._selected or self._priority.get(key) != (-neg_score, seq):
+                continue  # Stale entry
+            source = self._source(key)
+            if self.max_per_source and self._source_counts.get(source, 0) >= self.max_per_source:
+                skipped.append((neg_score, seq, key))
+                continue
+            self._select(key)
+            update.entered.append(key)
+        for entry in skipped:
+            heapq.heappush(self._reserve_heap, entry)
+        return update
+
+    def _beats(self, key: str, other: str) -> bool:
+        score, seq = self._priority[key]
+        other_score, other_seq = self._priority[other]
+        return score > other_score or (score == other_score and seq < other_seq)
+
+    def _select(self, key: str):
+        score, seq = self._priority[key]
+        source = self._source(key)
+        self._selected.add(key)
+        self._source_counts[source] = self._source_counts.get(source, 0) + 1
+        # Min-heaps keyed so the item that loses ties (later arrival) pops first
+        entry = (score, -seq, key)
+        heapq.heappush(self._selected_heap, entry)
+        heapq.heappush(self._source_heaps.setdefault(source, []), entry)
+
+    def _unselect(self, key: str):
+        source = self._source(key)
+        self._selected.discard(key)
+        self._source_counts[source] -= 1
+
+    def _push_reserve(self, key: str):
+        score, seq = self._priority[key]
+        heapq.heappush(self._reserve_heap, (-score, seq, key))
+
+    def _peek(self, heap: List[Tuple[float, int, str]], source: Optional[str] = None) -> Optional[str]:
+        """Lowest live selected key in a heap, dropping stale entries."""
+        while heap:
+            score, neg_seq, key = heap[0]
+            if (key in self._selected and self._priority.get(key) == (score, -neg_seq)
+                    and (source is None or self._source(key) == source)):
+                return key
+            heapq.heappop(heap)
+        return None
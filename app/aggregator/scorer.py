@@ -4,18 +4,30 @@ Content scorer module for ranking and scoring content items.
 
 from typing import List, Dict, Any, Optional
 import math
-from datetime import datetime, timedelta
+import time
+
+import numpy as np
+
+from .entities import EntityRegistry, get_entity_registry
+from .text_view import TextView, text_view
+from .timestamps import item_timestamp
+
+SCORE_COLUMNS = ('relevance', 'credibility', 'recency', 'engagement', 'source_boost', 'composite')
+
+RESEARCH_TERMS = ('research', 'study', 'analysis', 'peer-reviewed')
+CLICKBAIT_TERMS = ('click here', 'you won\'t believe', 'shocking')
 
 
 class ContentScorer:
     """Scores and ranks content items based on various factors."""
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, entity_registry: Optional[EntityRegistry] = None):
         """
         Initialize the content scorer.
         
         Args:
             config: Configuration dictionary with scoring settings
+            entity_registry: Known-entity registry (defaults to the shared one)
         """
         self.config = config or {}
         self.min_score = self.config.get('min_score', 0.1)
@@ -29,12 +41,18 @@ class ContentScorer:
         self.max_age_days = self.config.get('max_age_days', 30)
         self.boost_factors = self.config.get('boost_factors', {})
         
-        # Known entity types for specialized scoring
-        self.entity_types = {
-            'k-pop': ['bts', 'blackpink', 'twice', 'exo', 'nct', 'iu', 'psy'],
-            'tech': ['apple', 'google', 'microsoft', 'meta', 'amazon'],
-            'sports': ['nba', 'nfl', 'mlb', 'fifa', 'uefa']
-        }
+        # Component weights (relevance, credibility, recency, engagement); entity-focused
+        # content boosts relevance importance, then the row is renormalized
+        self._default_weights = np.array([
+            self.relevance_weight, self.credibility_weight, self.recency_weight, self.engagement_weight
+        ])
+        entity_weights = self._default_weights * np.array([1.5, 0.8, 1.0, 0.7])
+        self._entity_weights = entity_weights / entity_weights.sum()
+        
+        # Known entity types for specialized scoring, from the shared entity registry
+        self.entity_registry = entity_registry or get_entity_registry(self.config.get('entities'))
+        self.entity_types = self.entity_registry.entity_types()
+        self._type_rank = {entity_type: rank for rank, entity_type in enumerate(self.entity_types)}
     
     def score(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -49,239 +67,225 @@ class ContentScorer:
         if not items:
             return []
         
-        # Calculate scores for each item
-        scored_items = []
-        for item in items:
-            score_data = self.calculate_score(item)
-            item_copy = item.copy()
-            item_copy['score'] = score_data
-            scored_items.append(item_copy)
-        
-        # Sort by the specified criteria
-        if self.sort_by == 'relevance':
-            scored_items.sort(key=lambda x: x['score']['relevance'], reverse=True)
-        elif self.sort_by == 'recency':
-            scored_items.sort(key=lambda x: x['score']['recency'], reverse=True)
-        elif self.sort_by == 'credibility':
-            scored_items.sort(key=lambda x: x['score']['credibility'], reverse=True)
-        elif self.sort_by == 'engagement':
-            scored_items.sort(key=lambda x: x['score']['engagement'], reverse=True)
-        else:  # composite score
-            scored_items.sort(key=lambda x: x['score']['composite'], reverse=True)
-        
-        return scored_items
+        scored_items = [item.copy() for item in items]
+        return self.score_batch(scored_items)
+    
+    def score_batch(self, items: List[Dict[str, Any]], top_k: Optional[int] = None,
+                    sort_by: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Score items in place as one vectorized batch and return the ranked top-k.
+        
+        Args:
+            items: Candidate items; each gets a 'score' dict
+            top_k: Number of items to return (all when None)
+            sort_by: Score column to rank by (defaults to the configured sort_by)
+            
+        Returns:
+            The top_k items ordered by the chosen score column
+        """
+        if not items:
+            return []
+        
+        columns = self.score_columns(items)
+        for item, score_data in zip(items, self._score_dicts(columns)):
+            item['score'] = score_data
+        
+        key = sort_by or self.sort_by
+        if key not in SCORE_COLUMNS:
+            key = 'composite'
+        # Rank on the reported (rounded) values so ties keep input order
+        return [items[i] for i in self.top_k(np.round(columns[key], 3), top_k)]
     
     def calculate_score(self, item: Dict[str, Any]) -> Dict[str, float]:
         """Calculate comprehensive score for an item."""
-        # Extract analysis data
-        analysis = item.get('analysis', {})
-        
-        # Calculate component scores
-        relevance_score = self._calculate_relevance_score(analysis)
-        credibility_score = self._calculate_credibility_score(analysis)
-        recency_score = self._calculate_recency_score(item)
-        engagement_score = self._calculate_engagement_score(item)
-        
-        # Detect if content is about a known entity type
-        entity_type = self._detect_entity_type(item)
-        
-        # Apply entity-specific scoring adjustments
-        if entity_type:
-            # For entity-focused content, boost relevance importance
-            relevance_weight = self.relevance_weight * 1.5
-            credibility_weight = self.credibility_weight * 0.8
-            recency_weight = self.recency_weight
-            engagement_weight = self.engagement_weight * 0.7
-            
-            # Normalize weights
-            total_weight = relevance_weight + credibility_weight + recency_weight + engagement_weight
-            relevance_weight /= total_weight
-            credibility_weight /= total_weight
-            recency_weight /= total_weight
-            engagement_weight /= total_weight
-        else:
-            # Use default weights
-            relevance_weight = self.relevance_weight
-            credibility_weight = self.credibility_weight
-            recency_weight = self.recency_weight
-            engagement_weight = self.engagement_weight
-        
-        # Calculate composite score with appropriate weights
-        composite_score = (
-            relevance_score * relevance_weight +
-            credibility_score * credibility_weight +
-            recency_score * recency_weight +
-            engagement_score * engagement_weight
+        return self._score_dicts(self.score_columns([item]))[0]
+    
+    def score_columns(self, items: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """
+        Compute every score component for a batch of items as NumPy columns.
+        
+        Returns:
+            Dict of float arrays: relevance, credibility, recency, engagement,
+            source_boost and composite (unrounded)
+        """
+        # Shared text views: source boosts scan the lowercase title/content, entity detection the words
+        views = [text_view(item) for item in items]
+        lowered = [(view.title_lower, view.content_lower) for view in views]
+        
+        relevance = self._relevance_column(items)
+        credibility = self._credibility_column(items)
+        recency = self._recency_column(items)
+        engagement = self._engagement_column(items)
+        source_boost = self._source_boost_column(items, lowered)
+        entity_mask = np.fromiter(
+            (self._detect_entity_type(item, view) is not None for item, view in zip(items, views)),
+            dtype=bool, count=len(items)
         )
         
-        # Apply source-specific boosts
-        source_boost = self._calculate_source_boost(item)
-        composite_score *= source_boost
+        # Entity-focused content weights relevance up; pick a weight row per item
+        weights = np.where(entity_mask[:, None], self._entity_weights, self._default_weights)
+        components = np.column_stack((relevance, credibility, recency, engagement))
+        composite = np.einsum('ij,ij->i', components, weights) * source_boost
         
         # For entity searches, if relevance is very low, significantly reduce overall score
-        if entity_type and relevance_score < 0.3:
-            composite_score *= 0.3  # Heavily penalize likely unrelated content
+        composite = np.where(entity_mask & (relevance < 0.3), composite * 0.3, composite)
         
         return {
-            'relevance': round(relevance_score, 3),
-            'credibility': round(credibility_score, 3),
-            'recency': round(recency_score, 3),
-            'engagement': round(engagement_score, 3),
-            'source_boost': round(source_boost, 3),
-            'composite': round(max(composite_score, self.min_score), 3)
+            'relevance': relevance,
+            'credibility': credibility,
+            'recency': recency,
+            'engagement': engagement,
+            'source_boost': source_boost,
+            'composite': np.maximum(composite, self.min_score)
         }
     
-    def _calculate_relevance_score(self, analysis: Dict[str, Any]) -> float:
-        """Calculate relevance score from analysis data."""
-        relevance_data = analysis.get('relevance', {})
-        
-        if not relevance_data:
-            return 0.5  # Default neutral score
-        
-        base_score = relevance_data.get('score', 0.5)
-        
-        # Boost for title matches
-        title_matches = len(relevance_data.get('title_matches', []))
-        title_boost = min(title_matches * 0.1, 0.3)
-        
-        # Boost for keyword density
-        keyword_density = relevance_data.get('keyword_density', 0)
-        density_boost = min(keyword_density * 2, 0.2)
-        
-        return min(base_score + title_boost + density_boost, 1.0)
+    def top_k(self, values: np.ndarray, k: Optional[int] = None) -> np.ndarray:
+        """Indices of the k largest values, highest first (ties keep input order)."""
+        n = len(values)
+        if k is None or k >= n:
+            return np.argsort(-values, kind='stable')
+        if k <= 0:
+            return np.array([], dtype=int)
+        # argpartition selects the top k in O(n); only those k are sorted
+        candidates = np.argpartition(-values, k - 1)[:k]
+        return candidates[np.lexsort((candidates, -values[candidates]))]
     
-    def _calculate_credibility_score(self, analysis: Dict[str, Any]) -> float:
-        """Calculate credibility score from analysis data."""
-        credibility_data = analysis.get('credibility', {})
-        
-        if not credibility_data:
-            return 0.5  # Default neutral score
-        
-        base_score = credibility_data.get('score', 0.5)
-        
-        # Penalty for risk factors
-        risk_factors = credibility_data.get('risk_factors', [])
-        risk_penalty = len(risk_factors) * 0.1
-        
-        return max(base_score - risk_penalty, 0.0)
+    def _score_dicts(self, columns: Dict[str, np.ndarray]) -> List[Dict[str, float]]:
+        """Convert score columns into the per-item dicts callers expect."""
+        rounded = {name: np.round(columns[name], 3).tolist() for name in SCORE_COLUMNS}
+        return [
+            {name: rounded[name][i] for name in SCORE_COLUMNS}
+            for i in range(len(rounded['composite']))
+        ]
     
-    def _calculate_recency_score(self, item: Dict[str, Any]) -> float:
-        """Calculate recency score based on publication date."""
-        published_date = item.get('published_date')
-        
-        if not published_date:
-            return 0.5  # Default neutral score
-        
-        try:
-            # Parse the date
-            if isinstance(published_date, str):
-                pub_date = datetime.fromisoformat(published_date.replace('Z', '+00:00'))
-            else:
-                pub_date = published_date
-            
-            # Calculate age in days
-            now = datetime.now()
-            age_days = (now - pub_date).days
-            
-            # Score based on age (exponential decay)
-            if age_days <= 0:
-                return 1.0  # Future dates get max score
-            elif age_days >= self.max_age_days:
-                return 0.1  # Very old content gets minimal score
-            else:
-                # Exponential decay: score = e^(-age/half_life)
-                half_life = self.max_age_days / 3  # Half score at 1/3 max age
-                return math.exp(-age_days / half_life)
-                
-        except (ValueError, TypeError):
-            return 0.5  # Default for unparseable dates
+    def _relevance_column(self, items: List[Dict[str, Any]]) -> np.ndarray:
+        """Relevance from analysis data, boosted by title matches and keyword density."""
+        base = np.full(len(items), 0.5)
+        title_matches = np.zeros(len(items))
+        keyword_density = np.zeros(len(items))
+        
+        for i, item in enumerate(items):
+            relevance_data = item.get('analysis', {}).get('relevance', {})
+            if relevance_data:
+                base[i] = relevance_data.get('score', 0.5)
+                title_matches[i] = len(relevance_data.get('title_matches', []))
+                keyword_density[i] = relevance_data.get('keyword_density', 0)
+        
+        title_boost = np.minimum(title_matches * 0.1, 0.3)
+        density_boost = np.minimum(keyword_density * 2, 0.2)
+        return np.minimum(base + title_boost + density_boost, 1.0)
     
-    def _calculate_engagement_score(self, item: Dict[str, Any]) -> float:
-        """Calculate engagement score based on social metrics."""
-        metadata = item.get('metadata', {})
-        source_type = item.get('source_type', '')
-        
-        # Source-specific engagement calculation
-        if source_type == 'youtube':
-            views = metadata.get('views', 0)
-            likes = metadata.get('likes', 0)
-            
-            # Normalize based on typical YouTube metrics
-            view_score = min(math.log10(max(views, 1)) / 6, 1.0)  # Log scale up to 1M views
-            like_ratio = likes / max(views, 1) if views > 0 else 0
-            like_score = min(like_ratio * 100, 1.0)  # Up to 1% like ratio
-            
-            return (view_score * 0.7 + like_score * 0.3)
-            
-        elif source_type == 'reddit':
-            score = metadata.get('score', 0)
-            comments = metadata.get('comments', 0)
-            upvote_ratio = metadata.get('upvote_ratio', 0.5)
-            
-            # Normalize Reddit metrics
-            score_normalized = min(math.log10(max(score, 1)) / 4, 1.0)  # Log scale up to 10k
-            comment_score = min(math.log10(max(comments, 1)) / 3, 1.0)  # Log scale up to 1k
-            
-            return (score_normalized * 0.4 + comment_score * 0.3 + upvote_ratio * 0.3)
-            
-        elif source_type == 'twitter':
-            retweets = metadata.get('retweets', 0)
-            likes = metadata.get('likes', 0)
-            replies = metadata.get('replies', 0)
+    def _credibility_column(self, items: List[Dict[str, Any]]) -> np.ndarray:
+        """Credibility from analysis data with a penalty per risk factor."""
+        base = np.full(len(items), 0.5)
+        risk_count = np.zeros(len(items))
+        
+        for i, item in enumerate(items):
+            credibility_data = item.get('analysis', {}).get('credibility', {})
+            if credibility_data:
+                base[i] = credibility_data.get('score', 0.5)
+                risk_count[i] = len(credibility_data.get('risk_factors', []))
+        
+        return np.maximum(base - risk_count * 0.1, 0.0)
+    
+    def _recency_column(self, items: List[Dict[str, Any]]) -> np.ndarray:
+        """Exponential recency decay from publication age (0.5 when unknown)."""
+        now = time.time()
+        age_days = np.fromiter((self._age_days(item, now) for item in items), dtype=float, count=len(items))
+        
+        # Half score at 1/3 max age
+        half_life = self.max_age_days / 3
+        with np.errstate(invalid='ignore'):
+            decay = np.exp(-np.clip(age_days, 0, None) / half_life)
+        return np.select(
+            [np.isnan(age_days), age_days <= 0, age_days >= self.max_age_days],
+            [0.5, 1.0, 0.1],  # Unknown, future dates, very old content
+            default=decay
+        )
+    
+    def _age_days(self, item: Dict[str, Any], now: Optional[float] = None) -> float:
+        """Whole days since publication, or NaN when the date is missing or unparseable."""
+        timestamp = item_timestamp(item)
+        if timestamp is None:
+            return math.nan
+        now = time.time() if now is None else now
+        return float(math.floor((now - timestamp) / 86400))
+    
+    def _engagement_column(self, items: List[Dict[str, Any]]) -> np.ndarray:
+        """Source-specific engagement from social metrics (word count for news)."""
+        n = len(items)
+        source_types = [item.get('source_type', '') for item in items]
+        metric_names = ('views', 'likes', 'score', 'comments', 'upvote_ratio', 'retweets', 'replies')
+        metrics = {name: np.zeros(n) for name in metric_names}
+        metrics['upvote_ratio'][:] = 0.5
+        word_count = np.zeros(n)
+        
+        for i, item in enumerate(items):
+            metadata = item.get('metadata', {})
+            if source_types[i] in ('youtube', 'reddit', 'twitter'):
+                for name in metric_names:
+                    if name in metadata:
+                        metrics[name][i] = metadata[name]
+            elif source_types[i] == 'news':
+                # For news, use word count as a proxy for article depth
+                word_count[i] = len(item.get('content', '').split())
+        
+        def log_scale(values: np.ndarray, decades: float) -> np.ndarray:
+            return np.minimum(np.log10(np.maximum(values, 1)) / decades, 1.0)
+        
+        views, likes = metrics['views'], metrics['likes']
+        
+        # YouTube: log scale up to 1M views, like ratio up to 1%
+        like_ratio = np.where(views > 0, likes / np.maximum(views, 1), 0)
+        youtube = log_scale(views, 6) * 0.7 + np.minimum(like_ratio * 100, 1.0) * 0.3
+        
+        # Reddit: log scale up to 10k score and 1k comments
+        reddit = (log_scale(metrics['score'], 4) * 0.4 +
+                  log_scale(metrics['comments'], 3) * 0.3 +
+                  metrics['upvote_ratio'] * 0.3)
+        
+        twitter = (log_scale(metrics['retweets'], 4) * 0.4 +
+                   log_scale(likes, 4) * 0.4 +
+                   log_scale(metrics['replies'], 3) * 0.2)
+        
+        # News: optimal article length around 800-1200 words
+        news = np.select(
+            [(word_count >= 800) & (word_count <= 1200), word_count < 200, word_count > 3000],
+            [1.0, 0.3, 0.6],
+            default=0.7
+        )
+        
+        types = np.array(source_types, dtype=object)
+        return np.select(
+            [types == 'youtube', types == 'reddit', types == 'twitter', types == 'news'],
+            [youtube, reddit, twitter, news],
+            default=0.5
+        )
+    
+    def _source_boost_column(self, items: List[Dict[str, Any]], lowered: List[tuple]) -> np.ndarray:
+        """Configured per-source boosts times content-quality adjustments."""
+        boost = np.ones(len(items))
+        
+        for i, (item, (title, content)) in enumerate(zip(items, lowered)):
+            # Base boost from configuration
+            factor = self.boost_factors.get(item.get('source_type', ''), 1.0)
             
-            # Normalize Twitter metrics
-            retweet_score = min(math.log10(max(retweets, 1)) / 4, 1.0)
-            like_score = min(math.log10(max(likes, 1)) / 4, 1.0)
-            reply_score = min(math.log10(max(replies, 1)) / 3, 1.0)
+            # Boost for verified or authoritative sources
+            if item.get('metadata', {}).get('verified', False):
+                factor *= 1.2
             
-            return (retweet_score * 0.4 + like_score * 0.4 + reply_score * 0.2)
+            # Boost for academic or research content
+            text = title + content
+            if any(term in text for term in RESEARCH_TERMS):
+                factor *= 1.1
             
-        elif source_type == 'news':
-            # For news, engagement is harder to measure
-            # Use word count as a proxy for article depth
-            word_count = len(item.get('content', '').split())
+            # Penalty for potential spam or low-quality indicators
+            if any(term in title for term in CLICKBAIT_TERMS):
+                factor *= 0.8
             
-            # Optimal article length around 800-1200 words
-            if 800 <= word_count <= 1200:
-                return 1.0
-            elif word_count < 200:
-                return 0.3  # Too short
-            elif word_count > 3000:
-                return 0.6  # Too long
-            else:
-                return 0.7  # Reasonable length
-                
-        else:
-            # Default engagement score for other sources
-            return 0.5
-    
-    def _calculate_source_boost(self, item: Dict[str, Any]) -> float:
-        """Calculate source-specific boost factors."""
-        source_type = item.get('source_type', '')
-        
-        # Base boost from configuration
-        base_boost = self.boost_factors.get(source_type, 1.0)
-        
-        # Additional boosts based on content characteristics
-        additional_boost = 1.0
+            boost[i] = factor
         
-        # Boost for verified or authoritative sources
-        metadata = item.get('metadata', {})
-        if metadata.get('verified', False):
-            additional_boost *= 1.2
-        
-        # Boost for academic or research content
-        title = item.get('title', '').lower()
-        content = item.get('content', '').lower()
-        
-        if any(term in title + content for term in ['research', 'study', 'analysis', 'peer-reviewed']):
-            additional_boost *= 1.1
-        
-        # Penalty for potential spam or low-quality indicators
-        if any(term in title for term in ['click here', 'you won\'t believe', 'shocking']):
-            additional_boost *= 0.8
-        
-        return base_boost * additional_boost
+        return boost
     
     def get_scoring_explanation(self, item: Dict[str, Any]) -> str:
         """Generate human-readable explanation of the scoring."""
@@ -334,20 +338,19 @@ class ContentScorer:
         
         return f"Score: {composite:.2f} - {', '.join(explanations)}"
     
-    def _detect_entity_type(self, item: Dict[str, Any]) -> Optional[str]:
+    def _detect_entity_type(self, item: Dict[str, Any], view: Optional[TextView] = None) -> Optional[str]:
         """Detect if the content is about a known entity type."""
-        query = item.get('metadata', {}).get('search_query', '').lower()
-        title = item.get('title', '').lower()
-        content = item.get('content', '').lower()
-        
-        for entity_type, entities in self.entity_types.items():
-            # Check if query matches any entity
-            if any(entity in query for entity in entities):
-                return entity_type
-            
-            # Check if title or content has strong entity presence
-            entity_mentions = sum(1 for entity in entities if entity in title or entity in content)
-            if entity_mentions >= 2:  # Multiple mentions indicate strong relevance
-                return entity_type
-        
-        return None
+        registry = self.entity_registry
+        query = item.get('metadata', {}).get('search_query', '')
+        view = text_view(item) if view is None else view
+        
+        # Types named in the query, plus types with multiple distinct entities in the item
+        # (multiple mentions indicate strong relevance); registry scans are memoized
+        candidates = set(registry.type_counts(registry.scan_query(query.lower()))) if query else set()
+        candidates.update(
+            entity_type for entity_type, count in registry.type_counts(registry.item_entities(view)).items()
+            if count >= 2
+        )
+        if not candidates:
+            return None
+        return min(candidates, key=lambda entity_type: self._type_rank.get(entity_type, len(self._type_rank)))
@@ -0,0 +1,209 @@
+"""
+Persistent, incrementally updated story-cluster index.
+
+The same wire story shows up across many sources and many queries. Instead of
+rediscovering that relationship on every search, items are assigned to story
+clusters through an exact-fingerprint map and an LSH index over cluster
+signatures, and the clusters are kept on disk between runs.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from typing import Dict, Any, Optional, List
+
+import numpy as np
+
+from .minhash import MinHasher, LSHIndex
+
+logger = logging.getLogger(__name__)
+
+
+class StoryClusterIndex:
+    """Maps item fingerprints to story cluster IDs across queries."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the index and load any persisted clusters.
+
+        Args:
+            config: Index settings (path, thresholds, retention)
+        """
+        self.config = config or {}
+        self.path = self.config.get('path', os.path.join('data', 'cache', 'story_clusters.json'))
+        self.num_perm = self.config.get('lsh_num_perm', 128)
+        self.bands = self.config.get('lsh_bands', 32)
+        self.cluster_threshold = self.config.get('cluster_threshold', 0.5)  # Estimated Jaccard to join a cluster
+        self.max_clusters = self.config.get('max_clusters', 20000)
+        self.max_sources_per_cluster = self.config.get('max_sources_per_cluster', 25)
+        self.retention_days = self.config.get('retention_days', 14)
+        self.save_interval = self.config.get('save_interval', 60)  # Seconds between writes of a changed index
+
+        self.minhasher = MinHasher(self.num_perm)
+        self.clusters: Dict[str, Dict[str, Any]] = {}
+        self.fingerprints: Dict[str, str] = {}  # Exact item fingerprint -> cluster ID
+        self._signatures: Dict[str, np.ndarray] = {}
+        self._lsh = LSHIndex(self.num_perm, self.bands)
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._last_save = 0.0
+
+        self.load()
+
+    def assign(self, keys: List[str], signature: np.ndarray, item: Dict[str, Any]) -> str:
+        """
+        Return the cluster ID for an item, creating a cluster if none matches.
+
+        Args:
+            keys: Exact fingerprints of the item (content hash, normalized URL)
+            signature: MinHash signature of the item's normalized text
+            item: The item itself (source, URL and title are recorded)
+
+        Returns:
+            Story cluster ID
+        """
+        keys = [key for key in keys if key]
+        with self._lock:
+            cluster_id = next((self.fingerprints[key] for key in keys
+                               if self.fingerprints.get(key) in self.clusters), None)
+            if cluster_id is None:
+                cluster_id = self._closest_cluster(signature)
+            if cluster_id is None:
+                cluster_id = self._create_cluster(signature, item)
+
+            for key in keys:
+                self.fingerprints[key] = cluster_id
+            self._record_source(self.clusters[cluster_id], item)
+            self._dirty = True
+            return cluster_id
+
+    def siblings(self, cluster_id: str, exclude_url: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Return the sources seen for a cluster, optionally excluding one URL."""
+        cluster = self.clusters.get(cluster_id)
+        if not cluster:
+            return []
+        return [dict(source) for source in cluster['sources'] if not exclude_url or source.get('url') != exclude_url]
+
+    def _closest_cluster(self, signature: np.ndarray) -> Optional[str]:
+        best_id = None
+        best_similarity = self.cluster_threshold
+        for cluster_id in self._lsh.query(signature):
+            cluster_signature = self._signatures.get(cluster_id)
+            if cluster_signature is None:
+                continue  # Pruned since the LSH index was built
+            similarity = MinHasher.jaccard(signature, cluster_signature)
+            if similarity >= best_similarity:
+                best_id, best_similarity = cluster_id, similarity
+        return best_id
+
+    def _create_cluster(self, signature: np.ndarray, item: Dict[str, Any]) -> str:
+        cluster_id = uuid.uuid4().hex[:12]
+        now = time.time()
+        self.clusters[cluster_id] = {
+            'id': cluster_id,
+            'title': item.get('title', ''),
+            'sources': [],
+            'first_seen': now,
+            'last_seen': now,
+            'signature': [int(value) for value in signature]
+        }
+        self._signatures[cluster_id] = signature
+        self._lsh.insert(cluster_id, signature)
+        if len(self.clusters) > self.max_clusters:
+            self.prune()
+        return cluster_id
+
+    def _record_source(self, cluster: Dict[str, Any], item: Dict[str, Any]):
+        cluster['last_seen'] = time.time()
+        url = item.get('url') or item.get('link', '')
+        if any(source.get('url') == url for source in cluster['sources']):
+            return
+        if len(cluster['sources']) < self.max_sources_per_cluster:
+            cluster['sources'].append({
+                'source': item.get('source', ''),
+                'title': item.get('title', ''),
+                'url': url
+            })
+
+    def prune(self):
+        """Drop clusters older than the retention window, then the oldest beyond max_clusters."""
+        with self._lock:
+            cutoff = time.time() - self.retention_days * 86400
+            keep = [cluster for cluster in self.clusters.values() if cluster['last_seen'] >= cutoff]
+            keep.sort(key=lambda cluster: cluster['last_seen'], reverse=True)
+            keep = keep[:self.max_clusters]
+            if len(keep) == len(self.clusters):
+                return
+
+            self.clusters = {cluster['id']: cluster for cluster in keep}
+            self.fingerprints = {fp: cid for fp, cid in self.fingerprints.items() if cid in self.clusters}
+            self._rebuild_lsh()
+            self._dirty = True
+
+    def _rebuild_lsh(self):
+        self._lsh = LSHIndex(self.num_perm, self.bands)
+        self._signatures = {}
+        for cluster_id, cluster in self.clusters.items():
+            signature = np.array(cluster['signature'], dtype=np.uint64)
+            self._signatures[cluster_id] = signature
+            self._lsh.insert(cluster_id, signature)
+
+    def load(self):
+        """Load persisted clusters; a missing or unreadable file starts an empty index."""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('num_perm') != self.num_perm:
+                logger.info("Story index signature size changed; starting a fresh index")
+                return
+            with self._lock:
+                self.clusters = data.get('clusters', {})
+                self.fingerprints = data.get('fingerprints', {})
+                self._rebuild_lsh()
+            self.prune()
+            logger.info(f"Loaded {len(self.clusters)} story clusters from {self.path}")
+        except Exception as e:
+            logger.warning(f"Could not load story index from {self.path}: {e}")
+
+    def save(self, force: bool = False):
+        """
+        Persist the index if it changed, at most once per save interval.
+
+        The index is snapshotted under the lock and serialized outside it, so
+        assign() is not held up while the file is written.
+
+        Args:
+            force: Write a changed index even within the save interval
+        """
+        if not self.path or not self._dirty:
+            return
+        if not force and time.time() - self._last_save < self.save_interval:
+            return
+        with self._lock:
+            # Source lists grow in place; everything else in a cluster is replaced, not mutated
+            clusters = {cluster_id: dict(cluster, sources=list(cluster['sources']))
+                        for cluster_id, cluster in self.clusters.items()}
+            fingerprints = dict(self.fingerprints)
+            self._dirty = False
+            self._last_save = time.time()
+        try:
+            payload = json.dumps({
+                'num_perm': self.num_perm,
+                'clusters': clusters,
+                'fingerprints': fingerprints
+            })
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            logger.warning(f"Could not save story index to {self.path}: {e}")
+            self._dirty = True
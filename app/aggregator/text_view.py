@@ -0,0 +1,141 @@
+"""
+Shared, memoized text view of a content item.
+
+The analyzers, the deduplicator and the engine all need the same derived
+forms of an item's title and content: HTML-free text, a lowercase copy,
+word tokens, sentences, a normalized form and a content hash. text_view()
+computes each form lazily, at most once per distinct (title, content), and
+returns the same TextView to every consumer.
+"""
+
+import hashlib
+import html
+import re
+from functools import cached_property, lru_cache
+from typing import Any, Dict, List, Set, Tuple, Union
+
+from .minhash import normalize_text
+
+TAG_PATTERN = re.compile(r'<[^>]+>')
+URL_PATTERN = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+EMAIL_PATTERN = re.compile(r'\S+@\S+')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+WORD_PATTERN = re.compile(r'\b\w+\b')
+SENTENCE_PATTERN = re.compile(r'(?<=[.!?])\s+')
+
+
+@lru_cache(maxsize=8192)
+def strip_html(text: str) -> str:
+    """Strip HTML tags and entities and collapse whitespace; for text that is displayed."""
+    if not text:
+        return ""
+    return WHITESPACE_PATTERN.sub(' ', html.unescape(TAG_PATTERN.sub('', text))).strip()
+
+
+@lru_cache(maxsize=8192)
+def clean_text(text: str) -> str:
+    """Strip HTML tags and entities, URLs and e-mail addresses, and collapse whitespace."""
+    if not text:
+        return ""
+    text = html.unescape(TAG_PATTERN.sub(' ', text))
+    text = URL_PATTERN.sub('', text)
+    text = EMAIL_PATTERN.sub('', text)
+    return WHITESPACE_PATTERN.sub(' ', text).strip()
+
+
+class TextView:
+    """Lazily derived text forms of one item; every property is computed once."""
+
+    def __init__(self, title: str, content: str, description: str = '', tags: Tuple[str, ...] = ()):
+        self.title = title
+        self.content = content
+        self.description = description
+        self.tags = tags
+
+    @cached_property
+    def clean_title(self) -> str:
+        return clean_text(self.title)
+
+    @cached_property
+    def clean_content(self) -> str:
+        return clean_text(self.content)
+
+    @cached_property
+    def text(self) -> str:
+        """Cleaned title and content."""
+        return f"{self.clean_title} {self.clean_content}".strip()
+
+    @cached_property
+    def lower(self) -> str:
+        return f"{self.title_lower} {self.content_lower}".strip()
+
+    @cached_property
+    def title_lower(self) -> str:
+        return self.clean_title.lower()
+
+    @cached_property
+    def content_lower(self) -> str:
+        return self.clean_content.lower()
+
+    @cached_property
+    def words(self) -> List[str]:
+        """Lowercase word tokens of the title and content."""
+        return WORD_PATTERN.findall(self.lower)
+
+    @cached_property
+    def word_set(self) -> Set[str]:
+        return set(self.words)
+
+    @cached_property
+    def title_words(self) -> List[str]:
+        return WORD_PATTERN.findall(self.title_lower)
+
+    @cached_property
+    def extra_words(self) -> List[str]:
+        """Lowercase word tokens of the description and tags."""
+        extra = ' '.join((clean_text(self.description),) + self.tags)
+        return WORD_PATTERN.findall(extra.lower())
+
+    @cached_property
+    def sentences(self) -> List[str]:
+        """Sentences of the cleaned content."""
+        return [sentence for sentence in SENTENCE_PATTERN.split(self.clean_content) if sentence]
+
+    @cached_property
+    def normalized_title(self) -> str:
+        """Lowercase, punctuation-free title (deduplication form)."""
+        return normalize_text(self.clean_title)
+
+    @cached_property
+    def normalized_content(self) -> str:
+        return normalize_text(self.clean_content)
+
+    @cached_property
+    def content_hash(self) -> str:
+        """Hash of the normalized title and content; identical articles share it."""
+        return hashlib.md5(f"{self.normalized_title}|{self.normalized_content}".encode('utf-8')).hexdigest()
+
+
+@lru_cache(maxsize=4096)
+def _view(title: str, content: str, description: str, tags: Tuple[str, ...]) -> TextView:
+    return TextView(title, content, description, tags)
+
+
+def text_view(item: Union[Dict[str, Any], str]) -> TextView:
+    """
+    Return the shared text view of an item (or of a bare content string).
+
+    Views are keyed by the item's text, so every analyzer that looks at the
+    same article gets the same view, and an item whose content was replaced
+    (e.g. by full-article extraction) gets a fresh one.
+    """
+    if isinstance(item, str):
+        return _view('', item, '', ())
+    tags = item.get('tags')
+    tags = tuple(tag for tag in tags if isinstance(tag, str)) if isinstance(tags, list) else ()
+    return _view(
+        item.get('title') or '',
+        item.get('content') or '',
+        item.get('description') or '',
+        tags
+    )
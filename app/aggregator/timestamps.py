@@ -0,0 +1,224 @@
+"""
+Ingest-time timestamp normalization.
+
+Scrapers report publication dates as RFC-822 strings (feedparser), ISO
+strings, relative text such as "2 hours ago", plain dates and epoch numbers,
+under different keys. normalize_timestamps() converts each item's date to a
+UTC epoch once, at ingest, so downstream recency scoring is a subtraction.
+"""
+
+import calendar
+import logging
+import re
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Where publication dates live, in order of preference
+PUBLISHED_FIELDS = ('published_date', 'published', 'created_utc', 'pubDate', 'date')
+METADATA_FIELDS = ('published_date', 'published', 'created_utc', 'upload_date')
+
+STRPTIME_FORMATS = (
+    '%Y-%m-%d',
+    '%Y/%m/%d',
+    '%d %b %Y',
+    '%d %B %Y',
+    '%b %d, %Y',
+    '%B %d, %Y',
+    '%b %d %Y',
+    '%m/%d/%Y',
+    '%d.%m.%Y',
+    '%Y-%m-%d %H:%M',
+    '%a, %d %b %Y',
+    '%Y%m%d',
+)
+
+RELATIVE_UNITS = {
+    'second': 1, 'sec': 1, 's': 1,
+    'minute': 60, 'min': 60, 'm': 60,
+    'hour': 3600, 'hr': 3600, 'h': 3600,
+    'day': 86400, 'd': 86400,
+    'week': 604800, 'w': 604800,
+    'month': 2592000, 'mo': 2592000,
+    'year': 31536000, 'yr': 31536000, 'y': 31536000
+}
+RELATIVE_PATTERN = re.compile(r'^(an?|\d+)\s*([a-z]+?)s?\s+ago$')
+RELATIVE_WORDS = {'just now': 0, 'now': 0, 'today': 0, 'yesterday': 86400}
+
+
+def _to_epoch(value: datetime) -> float:
+    # Naive datetimes come from datetime.now() in the scrapers, i.e. local time
+    return value.timestamp()
+
+
+def _parse_epoch(text: str) -> Optional[float]:
+    if not re.fullmatch(r'\d{9,13}(\.\d+)?', text):
+        return None
+    value = float(text)
+    return value / 1000 if value > 1e12 else value
+
+
+def _parse_iso(text: str) -> Optional[float]:
+    try:
+        return _to_epoch(datetime.fromisoformat(text.replace('Z', '+00:00')))
+    except ValueError:
+        return None
+
+
+def _parse_rfc822(text: str) -> Optional[float]:
+    try:
+        return _to_epoch(parsedate_to_datetime(text))
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def _make_strptime(date_format: str) -> Callable[[str], Optional[float]]:
+    def parse(text: str) -> Optional[float]:
+        try:
+            return _to_epoch(datetime.strptime(text, date_format))
+        except ValueError:
+            return None
+    parse.__name__ = f"strptime({date_format})"
+    return parse
+
+
+ABSOLUTE_PARSERS: Tuple[Callable[[str], Optional[float]], ...] = (
+    _parse_epoch, _parse_iso, _parse_rfc822, *(_make_strptime(f) for f in STRPTIME_FORMATS)
+)
+
+# Shape of a date string (digits -> 9, letter runs -> a) -> index of the parser that worked
+_format_by_shape: Dict[str, int] = {}
+
+
+def _shape(text: str) -> str:
+    return re.sub(r'[A-Za-z]+', 'a', re.sub(r'\d', '9', text))
+
+
+def _relative_offset(text: str) -> Optional[float]:
+    """Seconds before now for relative dates such as '2 hours ago' or 'yesterday'."""
+    lowered = text.lower().strip()
+    if lowered in RELATIVE_WORDS:
+        return RELATIVE_WORDS[lowered]
+    match = RELATIVE_PATTERN.match(lowered)
+    if not match:
+        return None
+    count, unit = match.groups()
+    seconds = RELATIVE_UNITS.get(unit) or RELATIVE_UNITS.get(unit.rstrip('s'))
+    if seconds is None:
+        return None
+    return (1 if count in ('a', 'an') else int(count)) * seconds
+
+
+@lru_cache(maxsize=16384)
+def _parse_absolute(text: str) -> Optional[float]:
+    """Parse an absolute date string, trying the parser remembered for its shape first."""
+    shape = _shape(text)
+    known = _format_by_shape.get(shape)
+    if known is not None:
+        result = ABSOLUTE_PARSERS[known](text)
+        if result is not None:
+            return result
+
+    for index, parser in enumerate(ABSOLUTE_PARSERS):
+        if index == known:
+            continue
+        result = parser(text)
+        if result is not None:
+            _format_by_shape[shape] = index
+            return result
+    return None
+
+
+def parse_timestamp(value: Any, now: Optional[float] = None) -> Optional[float]:
+    """
+    Convert a date value of any supported kind to a UTC epoch.
+
+    Args:
+        value: Epoch number, datetime, or date string (ISO, RFC-822, common
+            date formats, relative text like "3 days ago")
+        now: Reference time for relative dates (defaults to the current time)
+
+    Returns:
+        Seconds since the epoch, or None when the value cannot be parsed
+    """
+    if value is None or value == '':
+        return None
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value) / 1000 if value > 1e12 else float(value)
+    if isinstance(value, datetime):
+        return _to_epoch(value)
+    if isinstance(value, time.struct_time):
+        # feedparser's *_parsed fields are UTC
+        return float(calendar.timegm(value))
+    if not isinstance(value, str):
+        return None
+
+    text = value.strip()
+    if not text:
+        return None
+
+    offset = _relative_offset(text)
+    if offset is not None:
+        return (now if now is not None else time.time()) - offset
+    return _parse_absolute(text)
+
+
+def item_timestamp(item: Dict[str, Any], now: Optional[float] = None) -> Optional[float]:
+    """Publication time of an item as a UTC epoch (normalized value if present)."""
+    if 'published_ts' in item:
+        return item['published_ts']
+    return _find_published(item, now)[0]
+
+
+def _find_published(item: Dict[str, Any], now: Optional[float]) -> Tuple[Optional[float], Optional[str]]:
+    for field in PUBLISHED_FIELDS:
+        timestamp = parse_timestamp(item.get(field), now)
+        if timestamp is not None:
+            return timestamp, field
+    metadata = item.get('metadata')
+    if isinstance(metadata, dict):
+        for field in METADATA_FIELDS:
+            timestamp = parse_timestamp(metadata.get(field), now)
+            if timestamp is not None:
+                return timestamp, f"metadata.{field}"
+    return None, None
+
+
+def normalize_timestamps(items: Iterable[Dict[str, Any]], now: Optional[float] = None) -> List[Dict[str, Any]]:
+    """
+    Add UTC epoch timestamps to items in place.
+
+    Sets 'published_ts' (publication time or None), 'published_ts_field'
+    (which field it came from) and 'scraped_ts'.
+
+    Returns:
+        The same items
+    """
+    now = time.time() if now is None else now
+    items = list(items)
+    unparsed = 0
+    for item in items:
+        published_ts, field = _find_published(item, now)
+        item['published_ts'] = published_ts
+        item['published_ts_field'] = field
+        scraped_ts = parse_timestamp(item.get('scraped_at'), now)
+        item['scraped_ts'] = scraped_ts if scraped_ts is not None else now
+        if published_ts is None and any(item.get(f) for f in PUBLISHED_FIELDS):
+            unparsed += 1
+
+    if unparsed:
+        logger.debug(f"{unparsed} items had a publication date in an unrecognized format")
+    return items
+
+
+def format_timestamp(timestamp: Optional[float]) -> str:
+    """ISO-8601 UTC string for a normalized timestamp ('' when unknown)."""
+    if timestamp is None:
+        return ''
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
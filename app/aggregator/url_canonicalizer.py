@@ -0,0 +1,237 @@
+"""
+URL canonicalization for exact-match deduplication.
+
+Search engines and aggregators hand out the same article under many URLs:
+Google News / Bing / DuckDuckGo redirect wrappers, AMP and mobile variants,
+tracking parameters. Canonicalizing them up front lets the first dedup pass
+match those items by hash instead of falling through to similarity checks.
+Canonical links learned during article extraction (rel=canonical, resolved
+redirects) are kept in a persistent cache.
+"""
+
+import base64
+import json
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, Optional
+from urllib.parse import urlparse, parse_qsl, urlencode
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that never change which article is served
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid',
+    'ref', 'ref_src', 'ref_url', 'referrer', 'source', 'cmpid', 'ocid', 'smid', 'smtyp',
+    'guccounter', 'guce_referrer', 'guce_referrer_sig', 'amp', 'outputtype',
+    'hl', 'gl', 'ceid', 'oc', 'ito'
+}
+TRACKING_PREFIXES = ('utm_', 'ns_', 'at_', 'pk_', 'mtm_', 'ga_')
+
+MOBILE_PREFIXES = ('www.', 'm.', 'mobile.', 'amp.')
+
+URL_IN_BYTES = re.compile(rb'https?://[\x21-\x7e]+')
+
+
+def _unwrap_redirect(url: str) -> str:
+    """Return the target of a known search-engine/aggregator redirect wrapper."""
+    parsed = urlparse(url)
+    host = parsed.netloc.lower()
+    params = dict(parse_qsl(parsed.query))
+
+    # DuckDuckGo: //duckduckgo.com/l/?uddg=<encoded target>
+    if host.endswith('duckduckgo.com') and parsed.path.startswith('/l/') and params.get('uddg'):
+        return params['uddg']
+
+    # Bing: /ck/a?...&u=a1<urlsafe base64 target>
+    if host.endswith('bing.com') and parsed.path.startswith('/ck/') and params.get('u', '').startswith('a1'):
+        encoded = params['u'][2:]
+        try:
+            return base64.urlsafe_b64decode(encoded + '=' * (-len(encoded) % 4)).decode('utf-8')
+        except Exception:
+            return url
+
+    # Google: /url?q=<target> or /url?url=<target>
+    if re.match(r'^(www\.)?google\.[a-z.]+$', host) and parsed.path == '/url':
+        target = params.get('q') or params.get('url')
+        if target and target.startswith('http'):
+            return target
+
+    # Google AMP viewer: /amp/s/<host>/<path>
+    if re.match(r'^(www\.)?google\.[a-z.]+$', host) and parsed.path.startswith('/amp/'):
+        rest = parsed.path[len('/amp/'):]
+        secure = rest.startswith('s/')
+        return ('https://' if secure else 'http://') + (rest[2:] if secure else rest)
+
+    # AMP cache: <dashed-host>.cdn.ampproject.org/c/s/<host>/<path>
+    if host.endswith('.cdn.ampproject.org'):
+        match = re.match(r'^/[a-z]/(s/)?(.+)$', parsed.path)
+        if match:
+            return ('https://' if match.group(1) else 'http://') + match.group(2)
+
+    # Google News article IDs: older IDs embed the publisher URL in base64
+    if host == 'news.google.com':
+        match = re.search(r'/articles/([A-Za-z0-9_-]+)', parsed.path)
+        if match:
+            article_id = match.group(1)
+            try:
+                decoded = base64.urlsafe_b64decode(article_id + '=' * (-len(article_id) % 4))
+                found = URL_IN_BYTES.search(decoded)
+                if found:
+                    return found.group(0).decode('ascii')
+            except Exception:
+                pass
+
+    return url
+
+
+@lru_cache(maxsize=8192)
+def canonical_key(url: str) -> str:
+    """
+    Map a URL to its canonical dedup key (scheme-less, lowercase host).
+
+    Unwraps redirect wrappers, drops tracking parameters and fragments, and
+    folds AMP and mobile variants into the desktop URL.
+    """
+    if not url:
+        return ""
+
+    url = url.strip()
+    for _ in range(3):  # Wrappers can be nested (e.g. a Bing link to an AMP cache URL)
+        unwrapped = _unwrap_redirect(url)
+        if unwrapped == url:
+            break
+        url = unwrapped
+
+    try:
+        parsed = urlparse(url if '://' in url else f"http://{url}")
+    except ValueError:
+        return url.lower()
+
+    host = parsed.hostname or ''
+    changed = True
+    while changed:
+        changed = False
+        for prefix in MOBILE_PREFIXES:
+            if host.startswith(prefix) and host.count('.') > 1:
+                host = host[len(prefix):]
+                changed = True
+
+    path = parsed.path or '/'
+    # AMP path variants: /amp, /amp/, /amp/<path>, <path>.amp, <path>.amp.html
+    path = re.sub(r'/amp/?$', '/', path)
+    path = re.sub(r'^/amp/', '/', path)
+    path = re.sub(r'\.amp(\.html?)?$', r'\1', path)
+    path = re.sub(r'/+', '/', path).rstrip('/') or ''
+
+    query = [
+        (key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    ]
+    query_string = urlencode(sorted(query))
+
+    port = f":{parsed.port}" if parsed.port and parsed.port not in (80, 443) else ''
+    return f"{host}{port}{path.lower()}" + (f"?{query_string}" if query_string else '')
+
+
+class URLCanonicalizer:
+    """Canonicalizes URLs and remembers canonical links learned from extraction."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the canonicalizer and load the persistent link cache.
+
+        Args:
+            config: Cache settings (path, max_entries)
+        """
+        self.config = config or {}
+        self.path = self.config.get('path', os.path.join('data', 'cache', 'canonical_urls.json'))
+        self.max_entries = self.config.get('max_entries', 50000)
+
+        # canonical key of a seen URL -> full canonical URL reported by the page
+        self.links: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._dirty = False
+        self.load()
+
+    def canonicalize(self, url: str) -> str:
+        """Return the canonical dedup key for a URL, following learned canonical links."""
+        key = canonical_key(url)
+        learned = self.links.get(key)
+        return canonical_key(learned) if learned else key
+
+    def resolved(self, url: str) -> Optional[str]:
+        """Return the full canonical URL learned for this URL, if any."""
+        return self.links.get(canonical_key(url))
+
+    def record(self, url: str, canonical_url: Optional[str]):
+        """
+        Remember that a URL serves the article at canonical_url.
+
+        Args:
+            url: URL the article was reached through (feed link, redirect wrapper)
+            canonical_url: rel=canonical link or final resolved URL
+        """
+        if not url or not canonical_url or not canonical_url.startswith('http'):
+            return
+        key = canonical_key(url)
+        target_key = canonical_key(canonical_url)
+        if not key or '/' not in target_key:
+            return  # Canonical links pointing at a homepage are misconfigured
+        if key == target_key and key not in self.links:
+            return  # Nothing new to learn
+        with self._lock:
+            if self.links.get(key) == canonical_url:
+                self.links.move_to_end(key)
+                return
+            self.links[key] = canonical_url
+            self.links.move_to_end(key)
+            while len(self.links) > self.max_entries:
+                self.links.popitem(last=False)
+            self._dirty = True
+
+    def load(self):
+        """Load the persisted link cache; a missing or unreadable file starts empty."""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            with self._lock:
+                self.links = OrderedDict(data.get('links', {}))
+            logger.info(f"Loaded {len(self.links)} canonical links from {self.path}")
+        except Exception as e:
+            logger.warning(f"Could not load canonical URL cache from {self.path}: {e}")
+
+    def save(self):
+        """Persist the link cache if it changed since the last save."""
+        if not self.path or not self._dirty:
+            return
+        try:
+            with self._lock:
+                payload = json.dumps({'links': self.links})
+                self._dirty = False
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            logger.warning(f"Could not save canonical URL cache to {self.path}: {e}")
+            self._dirty = True
+
+
+_canonicalizer: Optional[URLCanonicalizer] = None
+
+
+def get_url_canonicalizer(config: Optional[Dict[str, Any]] = None) -> URLCanonicalizer:
+    """Return the process-wide canonicalizer, creating it on first use."""
+    global _canonicalizer
+    if _canonicalizer is None:
+        _canonicalizer = URLCanonicalizer(config)
+    return _canonicalizer
@@ -6,10 +6,16 @@ from .sentiment import SentimentAnalyzer
 from .credibility import CredibilityAnalyzer
 from .relevance import RelevanceAnalyzer
 from .bias import BiasAnalyzer
+from .bm25 import BM25Index
+from .analysis_cache import AnalysisCache
+from .semantic import SemanticScorer
 
 __all__ = [
     'SentimentAnalyzer',
     'CredibilityAnalyzer', 
     'RelevanceAnalyzer',
-    'BiasAnalyzer'
+    'BiasAnalyzer',
+    'BM25Index',
+    'AnalysisCache',
+    'SemanticScorer'
 ]
@@ -0,0 +1,231 @@
+"""
+Two-tier cache for query-independent analysis results.
+
+Sentiment and bias results depend only on the article, and the same
+articles come back across many queries. Results are keyed by
+(analyzer name, analyzer version, content key) and kept in an in-memory LRU
+in front of per-analyzer JSON shards on disk. Each shard file is named after
+the analyzer version, so bumping an analyzer's ``cache_version`` starts a
+fresh shard and the stale one is deleted the first time it would be read.
+Shards are read in the default executor and written at most once per save
+interval, serialized outside the lock so lookups are never held up.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_UNSAFE_FILENAME = re.compile(r'[^A-Za-z0-9_.-]+')
+
+
+class AnalysisCache:
+    """LRU memory tier over per-analyzer, per-version disk shards."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the cache; disk shards are loaded lazily per analyzer.
+
+        Args:
+            config: Cache settings (directory, memory_entries, disk_entries, enabled, save_interval)
+        """
+        self.config = config or {}
+        self.enabled = self.config.get('enabled', True)
+        self.directory = self.config.get('directory', os.path.join('data', 'cache', 'analysis'))
+        self.memory_entries = self.config.get('memory_entries', 20000)
+        self.disk_entries = self.config.get('disk_entries', 50000)  # Per analyzer shard
+        self.save_interval = self.config.get('save_interval', 60)  # Seconds between writes of changed shards
+
+        self._memory: "OrderedDict[Tuple[str, str, str], Dict[str, Any]]" = OrderedDict()
+        # (name, version) -> key -> result, oldest first
+        self._shards: Dict[Tuple[str, str], "OrderedDict[str, Dict[str, Any]]"] = {}
+        self._dirty: set = set()
+        self._lock = threading.RLock()
+        self._last_save = 0.0
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0}
+
+    def get(self, name: str, version: str, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a result in memory, then on disk; disk hits are promoted to memory."""
+        memory_key = (name, str(version), key)
+        with self._lock:
+            result = self._memory.get(memory_key)
+            if result is not None:
+                self._memory.move_to_end(memory_key)
+                self.stats['memory_hits'] += 1
+                return result
+
+        shard = self._shard(name, str(version))
+        with self._lock:
+            result = shard.get(key)
+            if result is not None:
+                self.stats['disk_hits'] += 1
+                self._remember(memory_key, result)
+                return result
+
+            self.stats['misses'] += 1
+            return None
+
+    def put(self, name: str, version: str, key: str, result: Dict[str, Any]):
+        """Store a result in both tiers."""
+        version = str(version)
+        with self._lock:
+            self._remember((name, version, key), result)
+            shard = self._shard(name, version)
+            shard[key] = result
+            shard.move_to_end(key)
+            while len(shard) > self.disk_entries:
+                shard.popitem(last=False)
+            self._dirty.add((name, version))
+
+    async def analyze_batch(self, analyzer: Any, contents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run ``analyzer.analyze_batch`` on cache misses only.
+
+        The analyzer provides ``cache_name``, ``cache_version`` and
+        ``cache_key(content)``; a key of None bypasses the cache for that item.
+        Analyzers with a synchronous ``analyze_many`` are run in the default
+        executor, so their CPU work stays off the shared event loop.
+
+        Args:
+            analyzer: A query-independent analyzer
+            contents: Content items to analyze
+
+        Returns:
+            Results in input order; callers get copies, never the cached dicts
+        """
+        if not self.enabled:
+            return await self._run(analyzer, contents)
+
+        name, version = analyzer.cache_name, str(analyzer.cache_version)
+        if (name, version) not in self._shards:
+            # The first read of a shard parses a large JSON file; keep it off the event loop
+            await asyncio.get_running_loop().run_in_executor(None, self._shard, name, version)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(contents)
+        pending: Dict[Optional[str], List[int]] = {}
+        for i, content in enumerate(contents):
+            key = analyzer.cache_key(content)
+            cached = self.get(name, version, key) if key is not None else None
+            if cached is not None:
+                results[i] = _copy(cached)
+            elif key is None:
+                pending.setdefault(None, []).append(i)
+            else:
+                pending.setdefault(key, []).append(i)
+
+        # Identical content in several items is analyzed once
+        todo = [(key, positions) for key, positions in pending.items() if key is not None]
+        todo_indices = [positions[0] for _, positions in todo] + pending.get(None, [])
+        if todo_indices:
+            fresh = await self._run(analyzer, [contents[i] for i in todo_indices])
+            for (key, positions), result in zip(todo, fresh):
+                self.put(name, version, key, result)
+                for i in positions:
+                    results[i] = _copy(result)
+            for i, result in zip(pending.get(None, []), fresh[len(todo):]):
+                results[i] = result
+        return results
+
+    @staticmethod
+    async def _run(analyzer: Any, contents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if hasattr(analyzer, 'analyze_many'):
+            return await asyncio.get_running_loop().run_in_executor(None, analyzer.analyze_many, contents)
+        return await analyzer.analyze_batch(contents)
+
+    def _remember(self, memory_key: Tuple[str, str, str], result: Dict[str, Any]):
+        self._memory[memory_key] = result
+        self._memory.move_to_end(memory_key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _shard_path(self, name: str, version: str) -> str:
+        return os.path.join(self.directory, f"{_safe(name)}@{_safe(version)}.json")
+
+    def _shard(self, name: str, version: str) -> "OrderedDict[str, Dict[str, Any]]":
+        shard = self._shards.get((name, version))
+        if shard is None:
+            # Read outside the lock; if another thread loaded the shard meanwhile, keep theirs
+            loaded = self._load_shard(name, version)
+            with self._lock:
+                shard = self._shards.setdefault((name, version), loaded)
+        return shard
+
+    def _load_shard(self, name: str, version: str) -> "OrderedDict[str, Dict[str, Any]]":
+        """Read an analyzer's shard for this version and delete shards of other versions."""
+        if not self.directory or not os.path.isdir(self.directory):
+            return OrderedDict()
+
+        path = self._shard_path(name, version)
+        prefix = f"{_safe(name)}@"
+        for filename in os.listdir(self.directory):
+            stale = os.path.join(self.directory, filename)
+            if filename.startswith(prefix) and filename.endswith('.json') and stale != path:
+                try:
+                    os.remove(stale)
+                    logger.info(f"Dropped analysis cache shard from an older analyzer version: {filename}")
+                except OSError as e:
+                    logger.warning(f"Could not remove stale analysis cache shard {stale}: {e}")
+
+        if not os.path.exists(path):
+            return OrderedDict()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entries = json.load(f).get('entries', {})
+            logger.info(f"Loaded {len(entries)} cached {name} results from {path}")
+            return OrderedDict(entries)
+        except Exception as e:
+            logger.warning(f"Could not load analysis cache from {path}: {e}")
+            return OrderedDict()
+
+    def save(self, force: bool = False):
+        """
+        Write shards that changed since the last save, at most once per save interval.
+
+        Args:
+            force: Write changed shards even within the save interval
+        """
+        if not self._dirty:
+            return
+        if not force and time.time() - self._last_save < self.save_interval:
+            return
+        with self._lock:
+            # Entries are never mutated in place, so a shallow copy is a consistent snapshot
+            snapshots = {shard_key: dict(self._shards[shard_key]) for shard_key in self._dirty}
+            self._dirty.clear()
+            self._last_save = time.time()
+
+        for (name, version), entries in snapshots.items():
+            path = self._shard_path(name, version)
+            try:
+                payload = json.dumps({'analyzer': name, 'version': version, 'entries': entries})
+                os.makedirs(self.directory, exist_ok=True)
+                temp_path = f"{path}.tmp"
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    f.write(payload)
+                os.replace(temp_path, path)
+            except Exception as e:
+                logger.warning(f"Could not save analysis cache to {path}: {e}")
+                with self._lock:
+                    self._dirty.add((name, version))
+
+    def clear(self):
+        """Drop the memory tier and forget loaded shards (files are kept)."""
+        with self._lock:
+            self._memory.clear()
+            self._shards.clear()
+            self._dirty.clear()
+
+
+def _safe(part: str) -> str:
+    return _UNSAFE_FILENAME.sub('_', part)
+
+
+def _copy(result: Dict[str, Any]) -> Dict[str, Any]:
+    # Results are JSON data; a round trip is a cheap deep copy that keeps cached dicts immutable
+    return json.loads(json.dumps(result))
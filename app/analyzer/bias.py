@@ -2,15 +2,20 @@
 Bias analysis module for detecting potential bias and perspective in content.
 """
 
-import asyncio
-from typing import Dict, Any, Optional, List
-import re
+from typing import Dict, Any, Optional, List, Union
 from collections import Counter
 
+from ..aggregator.multi_pattern import TermMatcher
+from ..aggregator.text_view import text_view
+
 
 class BiasAnalyzer:
     """Analyzes content for potential bias indicators and perspective."""
     
+    # Bump when the term lists or scoring change so cached results are discarded
+    cache_name = 'bias'
+    cache_version = 1
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize the bias analyzer.
@@ -66,6 +71,20 @@ class BiasAnalyzer:
                 'ambitious', 'assertive', 'confident', 'strong-willed'
             }
         }
+        
+        # All term lists compiled into one automaton; pronouns are counted in the same pass
+        self.matcher = TermMatcher({
+            'left_leaning': self.political_indicators['left_leaning'],
+            'right_leaning': self.political_indicators['right_leaning'],
+            'highly_emotional': self.emotional_bias['highly_emotional'],
+            'loaded_language': self.emotional_bias['loaded_language'],
+            'opinion_markers': self.source_bias['opinion_markers'],
+            'certainty_markers': self.source_bias['certainty_markers'],
+            'gendered_language': self.gender_bias['gendered_language'],
+            'first_person': {'i', 'me', 'my', 'mine', 'myself'},
+            'he': {'he'},
+            'she': {'she'}
+        })
     
     async def analyze(self, content: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -77,20 +96,18 @@ class BiasAnalyzer:
         Returns:
             Dictionary containing bias analysis results
         """
-        # Extract content fields
-        title = content.get('title', '')
-        text_content = content.get('content', '')
-        source = content.get('source', '')
-        author = content.get('author', '')
-        
-        # Combine text for analysis
-        full_text = f"{title} {text_content}".lower()
+        return self._analyze_one(content)
+    
+    def _analyze_one(self, content: Dict[str, Any]) -> Dict[str, Any]:
+        """Synchronous bias analysis of one item."""
+        # One pass over the item's shared word tokens for every term category
+        hits = self.matcher.scan(text_view(content).words)
         
         # Analyze different types of bias
-        political_bias = self._analyze_political_bias(full_text)
-        emotional_bias = self._analyze_emotional_bias(full_text)
-        source_bias = self._analyze_source_bias(full_text)
-        gender_bias = self._analyze_gender_bias(full_text)
+        political_bias = self._analyze_political_bias(hits)
+        emotional_bias = self._analyze_emotional_bias(hits)
+        source_bias = self._analyze_source_bias(hits)
+        gender_bias = self._analyze_gender_bias(hits)
         
         # Calculate overall bias score
         bias_indicators = (
@@ -133,12 +150,11 @@ class BiasAnalyzer:
             }
         }
     
-    def _analyze_political_bias(self, text: str) -> Dict[str, Any]:
+    def _analyze_political_bias(self, hits: Union[str, Dict[str, Counter]]) -> Dict[str, Any]:
         """Analyze political bias indicators."""
-        left_matches = sum(1 for term in self.political_indicators['left_leaning'] 
-                          if term in text)
-        right_matches = sum(1 for term in self.political_indicators['right_leaning'] 
-                           if term in text)
+        hits = self._hits(hits)
+        left_matches = len(hits['left_leaning'])
+        right_matches = len(hits['right_leaning'])
         
         total_matches = left_matches + right_matches
         
@@ -174,12 +190,11 @@ class BiasAnalyzer:
             }
         }
     
-    def _analyze_emotional_bias(self, text: str) -> Dict[str, Any]:
+    def _analyze_emotional_bias(self, hits: Union[str, Dict[str, Counter]]) -> Dict[str, Any]:
         """Analyze emotional bias and loaded language."""
-        emotional_matches = sum(1 for term in self.emotional_bias['highly_emotional'] 
-                               if term in text)
-        loaded_matches = sum(1 for term in self.emotional_bias['loaded_language'] 
-                            if term in text)
+        hits = self._hits(hits)
+        emotional_matches = len(hits['highly_emotional'])
+        loaded_matches = len(hits['loaded_language'])
         
         total_emotional = emotional_matches + loaded_matches
         
@@ -193,15 +208,14 @@ class BiasAnalyzer:
             'total_indicators': total_emotional
         }
     
-    def _analyze_source_bias(self, text: str) -> Dict[str, Any]:
+    def _analyze_source_bias(self, hits: Union[str, Dict[str, Counter]]) -> Dict[str, Any]:
         """Analyze source bias and subjectivity."""
-        opinion_matches = sum(1 for term in self.source_bias['opinion_markers'] 
-                             if term in text)
-        certainty_matches = sum(1 for term in self.source_bias['certainty_markers'] 
-                               if term in text)
+        hits = self._hits(hits)
+        opinion_matches = len(hits['opinion_markers'])
+        certainty_matches = len(hits['certainty_markers'])
         
         # Check for first-person pronouns
-        first_person = len(re.findall(r'\b(i|me|my|mine|myself)\b', text))
+        first_person = sum(hits['first_person'].values())
         
         # Calculate subjectivity score
         total_subjective = opinion_matches + certainty_matches + (first_person / 5)
@@ -214,14 +228,14 @@ class BiasAnalyzer:
             'first_person_count': first_person
         }
     
-    def _analyze_gender_bias(self, text: str) -> Dict[str, Any]:
+    def _analyze_gender_bias(self, hits: Union[str, Dict[str, Counter]]) -> Dict[str, Any]:
         """Analyze potential gender bias in language."""
-        gendered_matches = sum(1 for term in self.gender_bias['gendered_language'] 
-                              if term in text)
+        hits = self._hits(hits)
+        gendered_matches = len(hits['gendered_language'])
         
         # Check for gendered pronouns imbalance
-        he_count = len(re.findall(r'\bhe\b', text))
-        she_count = len(re.findall(r'\bshe\b', text))
+        he_count = hits['he']['he']
+        she_count = hits['she']['she']
         
         pronoun_imbalance = 0
         if he_count + she_count > 0:
@@ -238,6 +252,12 @@ class BiasAnalyzer:
             'she_count': she_count
         }
     
+    def _hits(self, hits: Union[str, Dict[str, Counter]]) -> Dict[str, Counter]:
+        """Accept raw text as well as precomputed matcher hits."""
+        if isinstance(hits, str):
+            return self.matcher.scan(text_view(hits).words)
+        return hits
+    
     def _identify_bias_types(
         self, 
         political: Dict, 
@@ -295,6 +315,10 @@ class BiasAnalyzer:
         
         return f"Bias indicators: {', '.join(explanations)}"
     
+    def cache_key(self, content: Dict[str, Any]) -> Optional[str]:
+        """Analysis cache key: bias depends only on the item's text."""
+        return text_view(content).content_hash
+    
     async def analyze_batch(self, contents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Analyze bias for a batch of content items.
@@ -305,5 +329,16 @@ class BiasAnalyzer:
         Returns:
             List of bias analysis results
         """
-        tasks = [self.analyze(content) for content in contents]
-        return await asyncio.gather(*tasks)
+        return self.analyze_many(contents)
+    
+    def analyze_many(self, contents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Synchronous batch analysis (pure CPU, safe to run in an executor).
+        
+        Args:
+            contents: List of content dictionaries
+            
+        Returns:
+            List of bias analysis results
+        """
+        return [self._analyze_one(content) for content in contents]
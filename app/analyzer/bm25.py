@@ -0,0 +1,220 @@
+"""
+BM25 scoring backed by a persisted, incrementally updated IDF table.
+
+Document frequencies are accumulated from every article we ingest (each
+article counted once, by content hash) and stored under data/cache/, so IDF
+reflects our real corpus instead of a per-document guess. The vocabulary is
+capped by dropping the rarest terms, whose IDF barely differs from that of
+an unseen term, and the table is written at most once per save interval. A batch of
+candidates is turned into one sparse term-count matrix and scored against
+the query with a single sparse matrix-vector product.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List
+
+import numpy as np
+
+try:
+    from scipy import sparse
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class BM25Index:
+    """Corpus document frequencies plus batched BM25 scoring."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the index and load the persisted IDF table.
+
+        Args:
+            config: BM25 settings (path, k1, b, max_seen, max_terms, save_interval)
+        """
+        self.config = config or {}
+        self.path = self.config.get('path', os.path.join('data', 'cache', 'bm25_idf.json'))
+        self.k1 = self.config.get('k1', 1.2)
+        self.b = self.config.get('b', 0.75)
+        self.max_seen = self.config.get('max_seen', 100000)
+        self.max_terms = self.config.get('max_terms', 200000)
+        self.save_interval = self.config.get('save_interval', 60)  # Seconds between writes of a changed table
+
+        self.num_docs = 0
+        self.total_length = 0
+        self.doc_freq: Dict[str, int] = {}
+        # Hashes of documents already counted, so re-scraped articles are not double counted
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._last_save = 0.0
+        self.load()
+
+    @property
+    def avg_length(self) -> float:
+        return self.total_length / self.num_docs if self.num_docs else 0.0
+
+    def idf(self, term: str) -> float:
+        """BM25 inverse document frequency (always positive)."""
+        df = self.doc_freq.get(term, 0)
+        return math.log(1 + (self.num_docs - df + 0.5) / (df + 0.5))
+
+    def add_document(self, tokens: List[str], doc_id: Optional[str] = None) -> bool:
+        """
+        Count a document in the corpus statistics, once per content hash.
+
+        Args:
+            tokens: Document tokens
+            doc_id: Stable document identity (defaults to a hash of the tokens)
+
+        Returns:
+            True if the document was new
+        """
+        if not tokens:
+            return False
+        doc_id = doc_id or hashlib.md5(' '.join(tokens).encode('utf-8')).hexdigest()
+        with self._lock:
+            if doc_id in self._seen:
+                self._seen.move_to_end(doc_id)
+                return False
+            self._seen[doc_id] = None
+            while len(self._seen) > self.max_seen:
+                self._seen.popitem(last=False)
+
+            self.num_docs += 1
+            self.total_length += len(tokens)
+            for term in set(tokens):
+                self.doc_freq[term] = self.doc_freq.get(term, 0) + 1
+            # Prune with 10% slack so the sort runs once per many new terms, not per document
+            if len(self.doc_freq) > self.max_terms * 1.1:
+                self._prune_vocabulary()
+            self._dirty = True
+            return True
+
+    def _prune_vocabulary(self):
+        """Keep the max_terms most frequent terms; dropped ones score as unseen (highest IDF)."""
+        kept = sorted(self.doc_freq.items(), key=lambda entry: entry[1], reverse=True)[:self.max_terms]
+        logger.info(f"Pruning BM25 vocabulary from {len(self.doc_freq)} to {len(kept)} terms")
+        self.doc_freq = dict(kept)
+
+    def score_batch(self, query_tokens: List[str], documents: List[List[str]]) -> np.ndarray:
+        """
+        BM25 scores for a batch of tokenized documents, normalized to 0-1.
+
+        Scores are divided by the query's maximum attainable score (every term
+        saturated), so they do not depend on the other documents in the batch.
+
+        Args:
+            query_tokens: Query tokens (repeats weight a term more)
+            documents: Tokenized documents
+
+        Returns:
+            Array of scores, one per document
+        """
+        n = len(documents)
+        if n == 0 or not query_tokens:
+            return np.zeros(n)
+
+        # Only query terms contribute, so the matrix needs one column per query term
+        vocabulary: Dict[str, int] = {}
+        query_weights: List[float] = []
+        for term in query_tokens:
+            if term in vocabulary:
+                query_weights[vocabulary[term]] += 1
+            else:
+                vocabulary[term] = len(vocabulary)
+                query_weights.append(1.0)
+        idf = np.array([self.idf(term) for term in vocabulary])
+        weights = np.array(query_weights) * idf
+
+        rows, cols, counts = [], [], []
+        lengths = np.empty(n)
+        for row, tokens in enumerate(documents):
+            lengths[row] = len(tokens)
+            term_counts: Dict[int, int] = {}
+            for token in tokens:
+                col = vocabulary.get(token)
+                if col is not None:
+                    term_counts[col] = term_counts.get(col, 0) + 1
+            for col, count in term_counts.items():
+                rows.append(row)
+                cols.append(col)
+                counts.append(count)
+
+        avg_length = self.avg_length or max(lengths.mean(), 1.0)
+        norm = self.k1 * (1 - self.b + self.b * lengths / avg_length)
+
+        rows = np.array(rows, dtype=np.int64)
+        cols = np.array(cols, dtype=np.int64)
+        tf = np.array(counts, dtype=float)
+        saturated = tf * (self.k1 + 1) / (tf + norm[rows])
+
+        if SCIPY_AVAILABLE:
+            matrix = sparse.csr_matrix((saturated, (rows, cols)), shape=(n, len(vocabulary)))
+            raw = matrix @ weights
+        else:
+            dense = np.zeros((n, len(vocabulary)))
+            dense[rows, cols] = saturated
+            raw = dense @ weights
+
+        max_score = float(weights.sum() * (self.k1 + 1))
+        return np.asarray(raw).ravel() / max_score if max_score > 0 else np.zeros(n)
+
+    def load(self):
+        """Load the persisted IDF table; a missing or unreadable file starts empty."""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            with self._lock:
+                self.num_docs = data.get('num_docs', 0)
+                self.total_length = data.get('total_length', 0)
+                self.doc_freq = data.get('doc_freq', {})
+                self._seen = OrderedDict.fromkeys(data.get('seen', []))
+            logger.info(f"Loaded BM25 statistics for {self.num_docs} documents from {self.path}")
+        except Exception as e:
+            logger.warning(f"Could not load BM25 statistics from {self.path}: {e}")
+
+    def save(self, force: bool = False):
+        """
+        Persist the IDF table if it changed, at most once per save interval.
+
+        Args:
+            force: Write a changed table even within the save interval
+        """
+        if not self.path or not self._dirty:
+            return
+        if not force and time.time() - self._last_save < self.save_interval:
+            return
+        with self._lock:
+            # Snapshot under the lock; serialize outside it so add_document is not held up
+            snapshot = {
+                'num_docs': self.num_docs,
+                'total_length': self.total_length,
+                'doc_freq': dict(self.doc_freq),
+                'seen': list(self._seen)
+            }
+            self._dirty = False
+            self._last_save = time.time()
+        try:
+            payload = json.dumps(snapshot)
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            logger.warning(f"Could not save BM25 statistics to {self.path}: {e}")
+            self._dirty = True
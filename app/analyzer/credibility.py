@@ -5,63 +5,58 @@ Credibility analysis module for assessing content trustworthiness and reliabilit
 import asyncio
 from typing import Dict, Any, Optional, List
 import re
-from urllib.parse import urlparse
-from datetime import datetime, timedelta
+import time
+from functools import lru_cache
+
+from ..aggregator.domain_reputation import DomainReputation, get_domain_reputation
+from ..aggregator.text_view import TextView, text_view
+from ..aggregator.timestamps import item_timestamp, parse_timestamp
+
+
+@lru_cache(maxsize=1024)
+def _source_type_score(source_lower: str) -> float:
+    """Score a source name by type keywords; the same few source names recur on every item."""
+    # Academic and research sources
+    if any(term in source_lower for term in ['university', 'research', 'institute', 'journal']):
+        return 0.90
+    
+    # Government sources
+    if any(term in source_lower for term in ['government', 'official', 'agency']):
+        return 0.85
+    
+    # News organizations
+    if any(term in source_lower for term in ['news', 'times', 'post', 'herald', 'tribune']):
+        return 0.75
+    
+    # Tech sources
+    if any(term in source_lower for term in ['tech', 'developer', 'engineering']):
+        return 0.70
+    
+    # Social media
+    if any(term in source_lower for term in ['social', 'twitter', 'facebook', 'reddit']):
+        return 0.45
+    
+    return 0.60  # Default score
 
 
 class CredibilityAnalyzer:
     """Analyzes credibility of content based on source, recency, and content quality indicators."""
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, reputation: Optional[DomainReputation] = None):
         """
         Initialize the credibility analyzer.
         
         Args:
             config: Configuration dictionary with credibility analysis settings
+            reputation: Domain reputation service (defaults to the shared one)
         """
         self.config = config or {}
         self.min_score = self.config.get('min_score', 0.3)
         self.fact_check_apis = self.config.get('fact_check_apis', [])
         
-        # Trusted domains with credibility scores
-        self.trusted_domains = {
-            # News sources
-            'reuters.com': 0.95,
-            'bbc.com': 0.95,
-            'apnews.com': 0.95,
-            'npr.org': 0.90,
-            'cnn.com': 0.85,
-            'nytimes.com': 0.90,
-            'washingtonpost.com': 0.90,
-            'theguardian.com': 0.85,
-            'wsj.com': 0.90,
-            
-            # Academic and research
-            'arxiv.org': 0.95,
-            'pubmed.ncbi.nlm.nih.gov': 0.95,
-            'scholar.google.com': 0.90,
-            'researchgate.net': 0.85,
-            'ieee.org': 0.90,
-            'acm.org': 0.90,
-            
-            # Government sources
-            'gov': 0.90,
-            'edu': 0.85,
-            'org': 0.70,
-            
-            # Tech sources
-            'github.com': 0.80,
-            'stackoverflow.com': 0.75,
-            'medium.com': 0.60,
-            'dev.to': 0.65,
-            
-            # Social media (lower credibility)
-            'twitter.com': 0.40,
-            'facebook.com': 0.35,
-            'reddit.com': 0.50,
-            'quora.com': 0.45,
-            'youtube.com': 0.45
-        }
+        # Trusted domains live in the shared reputation service (suffix trie + score memo)
+        self.reputation = reputation or get_domain_reputation(self.config.get('domain_reputation'))
+        self.trusted_domains = self.reputation.trusted_domains
         
         # Quality indicators
         self.quality_indicators = {
@@ -90,16 +85,15 @@ class CredibilityAnalyzer:
         # Extract content fields
         url = content.get('url', '')
         source = content.get('source', '')
-        title = content.get('title', '')
-        text_content = content.get('content', '')
         author = content.get('author', '')
-        published_date = content.get('published_date', '')
+        published_ts = item_timestamp(content)
+        view = text_view(content)
         
         # Calculate different credibility factors
         domain_score = self._analyze_domain(url)
         source_score = self._analyze_source(source)
-        content_score = self._analyze_content_quality(title, text_content)
-        recency_score = self._analyze_recency(published_date)
+        content_score = self._analyze_content_quality(view)
+        recency_score = self._analyze_recency(published_ts)
         author_score = self._analyze_author(author)
         
         # Combine scores with weights
@@ -129,7 +123,7 @@ class CredibilityAnalyzer:
         )
         
         # Identify risk factors
-        risk_factors = self._identify_risk_factors(title, text_content, url)
+        risk_factors = self._identify_risk_factors(view, url)
         
         return {
             'score': round(final_score, 3),
@@ -150,65 +144,19 @@ class CredibilityAnalyzer:
         if not url:
             return 0.5  # Neutral score for missing URL
         
-        try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            
-            # Remove www. prefix
-            if domain.startswith('www.'):
-                domain = domain[4:]
-            
-            # Check exact domain matches
-            if domain in self.trusted_domains:
-                return self.trusted_domains[domain]
-            
-            # Check TLD-based scoring
-            if domain.endswith('.gov'):
-                return 0.90
-            elif domain.endswith('.edu'):
-                return 0.85
-            elif domain.endswith('.org'):
-                return 0.70
-            elif domain.endswith('.com'):
-                return 0.60
-            else:
-                return 0.50
-                
-        except Exception:
-            return 0.30  # Low score for malformed URLs
+        return self.reputation.score(url)
     
     def _analyze_source(self, source: str) -> float:
         """Analyze credibility based on source type."""
         if not source:
             return 0.5
         
-        source_lower = source.lower()
-        
-        # Academic and research sources
-        if any(term in source_lower for term in ['university', 'research', 'institute', 'journal']):
-            return 0.90
-        
-        # Government sources
-        if any(term in source_lower for term in ['government', 'official', 'agency']):
-            return 0.85
-        
-        # News organizations
-        if any(term in source_lower for term in ['news', 'times', 'post', 'herald', 'tribune']):
-            return 0.75
-        
-        # Tech sources
-        if any(term in source_lower for term in ['tech', 'developer', 'engineering']):
-            return 0.70
-        
-        # Social media
-        if any(term in source_lower for term in ['social', 'twitter', 'facebook', 'reddit']):
-            return 0.45
-        
-        return 0.60  # Default score
+        return _source_type_score(source.lower())
     
-    def _analyze_content_quality(self, title: str, content: str) -> float:
+    def _analyze_content_quality(self, view: TextView) -> float:
         """Analyze content quality indicators."""
-        full_text = f"{title} {content}".lower()
+        title = view.clean_title
+        full_text = view.lower
         
         # Count positive and negative indicators
         positive_count = sum(1 for indicator in self.quality_indicators['positive'] 
@@ -237,38 +185,27 @@ class CredibilityAnalyzer:
         
         return max(0.0, min(1.0, quality_score))
     
-    def _analyze_recency(self, published_date: str) -> float:
+    def _analyze_recency(self, published: Any) -> float:
         """Analyze content recency (newer content generally more credible for current events)."""
-        if not published_date:
-            return 0.5  # Neutral score for missing date
-        
-        try:
-            # Try to parse the date (assuming ISO format or common formats)
-            if isinstance(published_date, str):
-                # Simple parsing - would need more robust date parsing in production
-                pub_date = datetime.fromisoformat(published_date.replace('Z', '+00:00'))
-            else:
-                pub_date = published_date
-            
-            now = datetime.now()
-            age_days = (now - pub_date).days
-            
-            # Scoring based on age
-            if age_days <= 1:
-                return 0.95  # Very recent
-            elif age_days <= 7:
-                return 0.85  # Recent
-            elif age_days <= 30:
-                return 0.75  # Moderately recent
-            elif age_days <= 90:
-                return 0.65  # Somewhat old
-            elif age_days <= 365:
-                return 0.55  # Old
-            else:
-                return 0.45  # Very old
-                
-        except Exception:
-            return 0.5  # Neutral score for unparseable dates
+        timestamp = parse_timestamp(published)
+        if timestamp is None:
+            return 0.5  # Neutral score for missing or unrecognized dates
+        
+        age_days = (time.time() - timestamp) // 86400
+        
+        # Scoring based on age
+        if age_days <= 1:
+            return 0.95  # Very recent
+        elif age_days <= 7:
+            return 0.85  # Recent
+        elif age_days <= 30:
+            return 0.75  # Moderately recent
+        elif age_days <= 90:
+            return 0.65  # Somewhat old
+        elif age_days <= 365:
+            return 0.55  # Old
+        else:
+            return 0.45  # Very old
     
     def _analyze_author(self, author: str) -> float:
         """Analyze author credibility indicators."""
@@ -289,10 +226,12 @@ class CredibilityAnalyzer:
         
         return 0.60  # Default score for named authors
     
-    def _identify_risk_factors(self, title: str, content: str, url: str) -> List[str]:
+    def _identify_risk_factors(self, view: TextView, url: str) -> List[str]:
         """Identify potential credibility risk factors."""
         risk_factors = []
-        full_text = f"{title} {content}".lower()
+        title = view.clean_title
+        content = view.clean_content
+        full_text = view.lower
         
         # Clickbait indicators
         if title and any(phrase in title.lower() for phrase in [
@@ -2,22 +2,26 @@
 Relevance analysis module for determining content relevance to queries.
 """
 
+from typing import Dict, Any, Optional, List, Tuple
 import asyncio
-from typing import Dict, Any, Optional, List
 import re
-from collections import Counter
-import math
+
+from .bm25 import BM25Index
+from .semantic import SemanticScorer
+from ..aggregator.entities import EntityRegistry, get_entity_registry, normalize_term
+from ..aggregator.text_view import TextView, text_view
 
 
 class RelevanceAnalyzer:
-    """Analyzes relevance of content to search queries using TF-IDF and keyword matching."""
+    """Analyzes relevance of content to search queries using BM25 and keyword matching."""
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, entity_registry: Optional[EntityRegistry] = None):
         """
         Initialize the relevance analyzer.
         
         Args:
             config: Configuration dictionary with relevance analysis settings
+            entity_registry: Known-entity registry (defaults to the shared one)
         """
         self.config = config or {}
         self.min_score = self.config.get('min_score', 0.1)
@@ -25,23 +29,15 @@ class RelevanceAnalyzer:
         self.boost_title = self.config.get('boost_title', 2.0)
         self.boost_keywords = self.config.get('boost_keywords', 1.5)
         
-        # Known entities that should be treated as exact matches
-        self.known_entities = {
-            'bts': {
-                'aliases': ['방탄소년단', 'bangtan boys', 'bangtantv', 'bangtan sonyeondan'],
-                'related_terms': ['k-pop', 'kpop', 'korean', 'idol', 'army'],
-                'members': [
-                    'rm', 'kim nam-joon', 'kim namjoon',
-                    'jin', 'kim seok-jin', 'kim seokjin',
-                    'suga', 'min yoon-gi', 'min yoongi', 'agust d',
-                    'j-hope', 'jung ho-seok', 'jung hoseok',
-                    'jimin', 'park ji-min', 'park jimin',
-                    'v', 'kim tae-hyung', 'kim taehyung',
-                    'jungkook', 'jeon jung-kook', 'jeon jungkook'
-                ]
-            }
-            # Add more entities as needed
-        }
+        # Corpus document frequencies, persisted across runs
+        self.bm25 = BM25Index(self.config.get('bm25', {}))
+        
+        # Sentence-embedding similarity when sentence-transformers is installed; lexical otherwise
+        self.semantic = SemanticScorer(self.config.get('semantic', {}))
+        
+        # Known entities come from the shared registry (one compiled alias matcher)
+        self.entity_registry = entity_registry or get_entity_registry(self.config.get('entities'))
+        self.known_entities = self.entity_registry.entities
         
         # Common stop words to filter out
         self.stop_words = {
@@ -53,24 +49,9 @@ class RelevanceAnalyzer:
             'her', 'us', 'them', 'my', 'your', 'his', 'its', 'our', 'their'
         }
     
-    def _is_known_entity(self, query: str) -> Optional[Dict[str, Any]]:
-        """Check if query matches any known entity."""
-        query_lower = query.lower().strip()
-        
-        for entity, info in self.known_entities.items():
-            # Check exact match
-            if query_lower == entity:
-                return info
-            
-            # Check aliases
-            if query_lower in info['aliases']:
-                return info
-            
-            # Check members (for group entities)
-            if 'members' in info and query_lower in info['members']:
-                return info
-        
-        return None
+    def _is_known_entity(self, query: str) -> Optional[str]:
+        """Return the known entity the query names (by name, alias or member), if any."""
+        return self.entity_registry.lookup(query)
     
     async def analyze(self, content: Dict[str, Any], query: str) -> Dict[str, Any]:
         """
@@ -87,44 +68,38 @@ class RelevanceAnalyzer:
         if isinstance(content, str) and isinstance(query, dict):
             content, query = query, content
         
-        if not query or not query.strip():
-            return {
-                'score': 0.0,
-                'matches': [],
-                'title_matches': [],
-                'keyword_density': 0.0,
-                'explanation': 'No query provided'
-            }
-        
-        # Check if query is a known entity
-        entity_info = self._is_known_entity(query)
-        
-        # Extract text fields
-        title = content.get('title', '')
-        text_content = content.get('content', '')
-        description = content.get('description', '')
-        tags = content.get('tags', [])
-        
-        # Combine all text for analysis
-        full_text = f"{title} {description} {text_content}"
-        if isinstance(tags, list):
-            full_text += " " + " ".join(tags)
-        
-        # Clean and tokenize query and content
-        query_tokens = self._tokenize(query)
-        content_tokens = self._tokenize(full_text)
-        title_tokens = self._tokenize(title)
-        
+        return (await self.analyze_batch([content], query))[0]
+    
+    def _prepare(self, content: Dict[str, Any]) -> Tuple[TextView, List[str], List[str]]:
+        """Tokens of an item's full text and title, from its shared text view."""
+        view = text_view(content)
+        content_tokens = self._filter_tokens(view.words) + self._filter_tokens(view.extra_words)
+        return view, content_tokens, self._filter_tokens(view.title_words)
+    
+    def _score_item(
+        self,
+        query: str,
+        query_tokens: List[str],
+        entity: Optional[str],
+        view: TextView,
+        content_tokens: List[str],
+        title_tokens: List[str],
+        bm25_score: float,
+        embedding_score: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Combine the per-item relevance components into the analysis result."""
         # Calculate different relevance scores
         keyword_score = self._calculate_keyword_score(query_tokens, content_tokens)
         title_score = self._calculate_keyword_score(query_tokens, title_tokens) * self.boost_title
-        tfidf_score = self._calculate_tfidf_score(query_tokens, content_tokens)
-        semantic_score = self._calculate_semantic_score(query, full_text)
+        if embedding_score is not None:
+            semantic_score = embedding_score
+        else:
+            semantic_score = self._calculate_semantic_score(query_tokens, content_tokens)
         
         # Apply entity-specific scoring if applicable
-        if entity_info:
+        if entity:
             # Check for exact entity matches
-            entity_score = self._calculate_entity_score(query, full_text, entity_info)
+            entity_score = self._calculate_entity_score(query, view, entity)
             
             # Boost scores if entity-related terms are found
             if entity_score > 0:
@@ -136,12 +111,12 @@ class RelevanceAnalyzer:
         final_score = (
             keyword_score * 0.3 +
             title_score * 0.3 +
-            tfidf_score * 0.2 +
+            bm25_score * 0.2 +
             semantic_score * 0.2
         )
         
         # If it's a known entity but score is low, likely unrelated
-        if entity_info and final_score < 0.4:
+        if entity and final_score < 0.4:
             final_score *= 0.5  # Penalize likely unrelated content
         
         # Find specific matches
@@ -165,7 +140,7 @@ class RelevanceAnalyzer:
             'components': {
                 'keyword_score': round(keyword_score, 3),
                 'title_score': round(title_score, 3),
-                'tfidf_score': round(tfidf_score, 3),
+                'bm25_score': round(bm25_score, 3),
                 'semantic_score': round(semantic_score, 3)
             }
         }
@@ -176,9 +151,10 @@ class RelevanceAnalyzer:
             return []
         
         # Convert to lowercase and extract words
-        words = re.findall(r'\b\w+\b', text.lower())
-        
-        # Filter out stop words and short words
+        return self._filter_tokens(re.findall(r'\b\w+\b', text.lower()))
+    
+    def _filter_tokens(self, words: List[str]) -> List[str]:
+        """Filter out stop words and short words."""
         return [word for word in words if word not in self.stop_words and len(word) > 2]
     
     def _calculate_keyword_score(self, query_tokens: List[str], content_tokens: List[str]) -> float:
@@ -191,38 +167,14 @@ class RelevanceAnalyzer:
         
         return matches / len(query_tokens)
     
-    def _calculate_tfidf_score(self, query_tokens: List[str], content_tokens: List[str]) -> float:
-        """Calculate TF-IDF based relevance score."""
-        if not query_tokens or not content_tokens:
-            return 0.0
-        
-        content_counter = Counter(content_tokens)
-        total_words = len(content_tokens)
-        
-        score = 0.0
-        for token in query_tokens:
-            if token in content_counter:
-                # Term frequency
-                tf = content_counter[token] / total_words
-                
-                # Simple IDF approximation (would need document corpus for real IDF)
-                idf = math.log(1000 / (content_counter[token] + 1))
-                
-                score += tf * idf
-        
-        return min(score, 1.0)
-    
-    def _calculate_semantic_score(self, query: str, content: str) -> float:
+    def _calculate_semantic_score(self, query_tokens: List[str], content_tokens: List[str]) -> float:
         """Calculate semantic similarity (simplified version)."""
-        if not query or not content:
+        if not query_tokens or not content_tokens:
             return 0.0
         
-        # Simple semantic scoring based on word overlap and proximity
-        query_words = set(self._tokenize(query))
-        content_words = set(self._tokenize(content))
-        
-        if not query_words:
-            return 0.0
+        # Simple semantic scoring based on word overlap
+        query_words = set(query_tokens)
+        content_words = set(content_tokens)
         
         # Jaccard similarity
         intersection = len(query_words.intersection(content_words))
@@ -260,30 +212,24 @@ class RelevanceAnalyzer:
                 explanation += f", high keyword density ({keyword_density:.1%})"
             return explanation
     
-    def _calculate_entity_score(self, query: str, content: str, entity_info: Dict[str, Any]) -> float:
-        """Calculate relevance score for known entities."""
-        content_lower = content.lower()
+    def _calculate_entity_score(self, query: str, view: TextView, entity: str) -> float:
+        """Calculate relevance score for known entities from the item's registry matches."""
+        hits = self.entity_registry.item_entities(view)
+        roles = hits.roles(entity)
         score = 0.0
         
-        # Check for exact matches of entity name and aliases
-        if query.lower() in content_lower:
+        # Check for exact matches of the queried name and of aliases
+        if hits.has_term(entity, normalize_term(query)):
             score += 0.6
-        for alias in entity_info['aliases']:
-            if alias in content_lower:
-                score += 0.4
-                break
+        if roles.get('aliases'):
+            score += 0.4
         
-        # Check for related terms
-        for term in entity_info['related_terms']:
-            if term in content_lower:
-                score += 0.2
+        # Each related term found
+        score += 0.2 * len(roles.get('related_terms', ()))
         
-        # Check for member names if applicable
-        if 'members' in entity_info:
-            for member in entity_info['members']:
-                if member in content_lower:
-                    score += 0.3
-                    break
+        # Member names
+        if roles.get('members'):
+            score += 0.3
         
         return min(score, 1.0)
     
@@ -291,6 +237,11 @@ class RelevanceAnalyzer:
         """
         Analyze relevance for a batch of content items.
         
+        Each item is tokenized once, added to the corpus IDF table, and the
+        whole batch is BM25-scored in one sparse matrix operation. Semantic
+        scores come from batched sentence embeddings when the model is
+        loaded, and from token overlap otherwise.
+        
         Args:
             contents: List of content dictionaries
             query: Search query string
@@ -298,5 +249,32 @@ class RelevanceAnalyzer:
         Returns:
             List of relevance analysis results
         """
-        tasks = [self.analyze(content, query) for content in contents]
-        return await asyncio.gather(*tasks)
+        if not query or not query.strip():
+            return [{
+                'score': 0.0,
+                'matches': [],
+                'title_matches': [],
+                'keyword_density': 0.0,
+                'explanation': 'No query provided'
+            } for _ in contents]
+        
+        # Check if query is a known entity
+        entity = self._is_known_entity(query)
+        query_tokens = self._tokenize(query)
+        
+        # Tokenizing and scoring are CPU-bound; keep them off the shared event loop
+        loop = asyncio.get_running_loop()
+        prepared, bm25_scores = await loop.run_in_executor(None, self._prepare_batch, contents, query_tokens)
+        embedding_scores = await self.semantic.score_batch(query, [view for view, _, _ in prepared])
+        
+        return await loop.run_in_executor(None, lambda: [
+            self._score_item(query, query_tokens, entity, view, content_tokens, title_tokens, float(bm25), embedding)
+            for (view, content_tokens, title_tokens), bm25, embedding in zip(prepared, bm25_scores, embedding_scores)
+        ])
+    
+    def _prepare_batch(self, contents: List[Dict[str, Any]], query_tokens: List[str]):
+        """Tokenize a batch, add it to the corpus statistics and BM25-score it."""
+        prepared = [self._prepare(content) for content in contents]
+        for view, content_tokens, _ in prepared:
+            self.bm25.add_document(content_tokens, view.content_hash)
+        return prepared, self.bm25.score_batch(query_tokens, [tokens for _, tokens, _ in prepared])
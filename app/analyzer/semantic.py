@@ -0,0 +1,205 @@
+"""
+Optional sentence-embedding relevance backend.
+
+Candidate titles and snippets are encoded in one batched forward pass with a
+sentence-transformers model on CPU, embeddings are cached by content hash
+(optionally stored as float16 or int8), and cosine scores against the query
+come out of a single matrix product. Scoring runs under a latency budget:
+while the model is still loading, or when encoding would take too long,
+items get no semantic score and the caller falls back to lexical scoring.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
+from ..aggregator.text_view import TextView
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """LRU of unit-normalized embeddings by content hash, stored as float32, float16 or int8."""
+
+    def __init__(self, max_entries: int = 20000, storage: str = 'float16'):
+        self.max_entries = max_entries
+        self.storage = storage if storage in ('float32', 'float16', 'int8') else 'float32'
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        with self._lock:
+            stored = self._entries.get(key)
+            if stored is None:
+                return None
+            self._entries.move_to_end(key)
+        return self._decode(stored)
+
+    def put(self, key: str, vector: np.ndarray):
+        stored = self._encode(vector)
+        with self._lock:
+            self._entries[key] = stored
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _encode(self, vector: np.ndarray) -> np.ndarray:
+        if self.storage == 'int8':
+            # Components of a unit vector lie in [-1, 1]
+            return np.round(np.clip(vector, -1.0, 1.0) * 127).astype(np.int8)
+        return vector.astype(self.storage)
+
+    def _decode(self, stored: np.ndarray) -> np.ndarray:
+        if self.storage == 'int8':
+            vector = stored.astype(np.float32) / 127
+            # Quantization perturbs the norm slightly; renormalize so dot products stay cosines
+            norm = np.linalg.norm(vector)
+            return vector / norm if norm > 0 else vector
+        return stored.astype(np.float32)
+
+
+class SemanticScorer:
+    """Query-to-candidate cosine similarity with sentence embeddings, under a latency budget."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the scorer; the model is loaded in the background on first use.
+
+        Args:
+            config: Semantic settings (enabled, model, device, batch_size,
+                storage, cache_size, latency_budget_ms, snippet_chars)
+        """
+        self.config = config or {}
+        self.enabled = self.config.get('enabled', True) and SENTENCE_TRANSFORMERS_AVAILABLE
+        self.model_name = self.config.get('model', 'all-MiniLM-L6-v2')
+        self.device = self.config.get('device', 'cpu')
+        self.batch_size = self.config.get('batch_size', 64)
+        self.latency_budget = self.config.get('latency_budget_ms', 300) / 1000
+        self.snippet_chars = self.config.get('snippet_chars', 500)
+
+        self.cache = EmbeddingCache(self.config.get('cache_size', 20000), self.config.get('storage', 'float16'))
+        self._model = None
+        self._loading = False
+        self._load_lock = threading.Lock()
+        self._encode_lock = threading.Lock()
+        self._seconds_per_text: Optional[float] = None  # Moving average of encode cost
+
+    @property
+    def ready(self) -> bool:
+        """Whether the model is loaded and can score."""
+        return self._model is not None
+
+    def warm(self):
+        """Start loading the model in a background thread (no-op if loading or disabled)."""
+        if not self.enabled or self._model is not None:
+            return
+        with self._load_lock:
+            if self._loading:
+                return
+            self._loading = True
+        threading.Thread(target=self._load_model, name='semantic-model-loader', daemon=True).start()
+
+    def _load_model(self):
+        try:
+            start = time.perf_counter()
+            self._model = SentenceTransformer(self.model_name, device=self.device)
+            logger.info(f"Loaded sentence embedding model {self.model_name} in {time.perf_counter() - start:.1f}s")
+        except Exception as e:
+            logger.warning(f"Could not load sentence embedding model {self.model_name}; using lexical relevance: {e}")
+            self.enabled = False
+        finally:
+            self._loading = False
+
+    def candidate_text(self, view: TextView) -> str:
+        """Title plus the start of the content: what gets embedded for a candidate."""
+        return f"{view.clean_title}. {view.clean_content[:self.snippet_chars]}".strip(' .')
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """One batched forward pass; rows are unit-normalized float32 embeddings."""
+        with self._encode_lock:
+            start = time.perf_counter()
+            vectors = self._model.encode(
+                texts,
+                batch_size=self.batch_size,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False
+            )
+            per_text = (time.perf_counter() - start) / max(len(texts), 1)
+            self._seconds_per_text = per_text if self._seconds_per_text is None else (
+                0.8 * self._seconds_per_text + 0.2 * per_text
+            )
+        return np.asarray(vectors, dtype=np.float32)
+
+    def _encode_missing(self, keys: List[str], texts: List[str]):
+        vectors = self._encode(texts)
+        for key, vector in zip(keys, vectors):
+            self.cache.put(key, vector)
+
+    async def score_batch(self, query: str, views: List[TextView]) -> List[Optional[float]]:
+        """
+        Cosine similarity of each candidate to the query, clipped to 0-1.
+
+        Args:
+            query: Search query
+            views: Text views of the candidates
+
+        Returns:
+            One score per candidate, or None for every candidate when any of
+            them has no embedding within the latency budget (callers then
+            score the whole batch lexically)
+        """
+        if not views or not query:
+            return [None] * len(views)
+        if not self.ready:
+            self.warm()
+            return [None] * len(views)
+
+        deadline = time.perf_counter() + self.latency_budget
+        loop = asyncio.get_running_loop()
+        query_key = f"query:{query.strip().lower()}"
+
+        # Uncached candidates, in order, as many as the per-text cost estimate fits in the budget
+        missing: Dict[str, str] = {}
+        if self.cache.get(query_key) is None:
+            missing[query_key] = query
+        for view in views:
+            if view.content_hash not in missing and self.cache.get(view.content_hash) is None:
+                missing[view.content_hash] = self.candidate_text(view)
+        if missing:
+            keys = list(missing)
+            if self._seconds_per_text:
+                keys = keys[:max(1, int(self.latency_budget / self._seconds_per_text))]
+            encoding = loop.run_in_executor(None, self._encode_missing, keys, [missing[key] for key in keys])
+            try:
+                # The executor keeps encoding past a timeout, so late embeddings still fill the cache
+                await asyncio.wait_for(asyncio.shield(encoding), max(deadline - time.perf_counter(), 0.001))
+            except asyncio.TimeoutError:
+                logger.info(f"Semantic encoding exceeded {self.latency_budget * 1000:.0f}ms; using lexical relevance")
+            except Exception as e:
+                logger.warning(f"Semantic encoding failed; using lexical relevance: {e}")
+
+        query_vector = self.cache.get(query_key)
+        if query_vector is None:
+            return [None] * len(views)
+
+        # Cosine and lexical overlap are on different scales, so a batch uses one or the other
+        vectors = [self.cache.get(view.content_hash) for view in views]
+        if any(vector is None for vector in vectors):
+            return [None] * len(views)
+        similarities = np.clip(np.vstack(vectors) @ query_vector, 0.0, 1.0)
+        return [float(similarity) for similarity in similarities]
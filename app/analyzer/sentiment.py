@@ -2,14 +2,29 @@
 Sentiment analysis module for analyzing emotional tone of content.
 """
 
-import asyncio
-from typing import Dict, Any, Optional
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Set, Union
 import re
-from textblob import TextBlob
+
+try:
+    from textblob import TextBlob
+    TEXTBLOB_AVAILABLE = True
+except ImportError:
+    TEXTBLOB_AVAILABLE = False
+
+from .sentiment_lexicon import LexiconSentimentModel
+from ..aggregator.text_view import TextView, clean_text, text_view
+
+logger = logging.getLogger(__name__)
 
 
 class SentimentAnalyzer:
-    """Analyzes sentiment of text content using TextBlob and rule-based approaches."""
+    """Analyzes sentiment of text content with a batched lexicon model (TextBlob optional) and keyword rules."""
+    
+    # Bump when the lexicon or keyword rules change so cached results are discarded
+    cache_version = 2
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
@@ -17,10 +32,22 @@ class SentimentAnalyzer:
         
         Args:
             config: Configuration dictionary with sentiment analysis settings
+                (backend: 'lexicon' or 'textblob', cache_size)
         """
         self.config = config or {}
         self.threshold_positive = self.config.get('threshold_positive', 0.1)
         self.threshold_negative = self.config.get('threshold_negative', -0.1)
+        self.backend = self.config.get('backend', 'lexicon')
+        if self.backend == 'textblob' and not TEXTBLOB_AVAILABLE:
+            logger.warning("TextBlob not installed; using the lexicon sentiment backend")
+            self.backend = 'lexicon'
+        self.cache_size = self.config.get('cache_size', 4096)
+        
+        # Lexicon arrays are compiled on first use
+        self._model: Optional[LexiconSentimentModel] = None
+        # Content hash -> result, most recently used last
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()  # analyze_many runs in executor threads
         
         # Sentiment keywords for rule-based enhancement
         self.positive_keywords = {
@@ -35,35 +62,96 @@ class SentimentAnalyzer:
             'ridiculous', 'stupid', 'waste', 'failure', 'disaster', 'nightmare'
         }
     
-    async def analyze(self, content: str) -> Dict[str, Any]:
+    @property
+    def cache_name(self) -> str:
+        """Analysis cache namespace; each backend keeps its own results."""
+        return f"sentiment_{self.backend}"
+    
+    def cache_key(self, content: Union[str, Dict[str, Any]]) -> Optional[str]:
+        """Analysis cache key: sentiment depends only on the text."""
+        return text_view(content).content_hash if content else None
+    
+    @property
+    def model(self) -> LexiconSentimentModel:
+        if self._model is None:
+            self._model = LexiconSentimentModel()
+        return self._model
+    
+    async def analyze(self, content: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
         """
         Analyze sentiment of the given content.
         
         Args:
-            content: Text content to analyze
+            content: Text content to analyze, or a content item (title + content are used)
             
         Returns:
             Dictionary containing sentiment analysis results
         """
-        if not content or not content.strip():
-            return {
-                'polarity': 0.0,
-                'subjectivity': 0.0,
-                'label': 'neutral',
-                'confidence': 0.0,
-                'keywords': []
-            }
-        
-        # Clean the content
-        cleaned_content = self._clean_text(content)
+        return self.analyze_many([content])[0]
+    
+    async def analyze_batch(self, contents: List[Union[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Analyze sentiment for a batch of content items.
         
-        # TextBlob analysis
-        blob = TextBlob(cleaned_content)
-        polarity = blob.sentiment.polarity
-        subjectivity = blob.sentiment.subjectivity
+        Args:
+            contents: List of text content or content items to analyze
+            
+        Returns:
+            List of sentiment analysis results
+        """
+        return self.analyze_many(contents)
+    
+    def analyze_many(self, contents: List[Union[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Synchronous batch analysis; uncached items are scored together in one pass.
         
+        Args:
+            contents: List of text content or content items to analyze
+            
+        Returns:
+            List of sentiment analysis results
+        """
+        views = [text_view(content) if content else None for content in contents]
+        results: List[Optional[Dict[str, Any]]] = [None] * len(contents)
+        
+        pending: Dict[str, List[int]] = {}
+        for i, view in enumerate(views):
+            if view is None or not view.text:
+                results[i] = self._empty_result()
+                continue
+            key = f"{self.backend}:{view.content_hash}"
+            with self._cache_lock:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+            if cached is not None:
+                results[i] = dict(cached)
+            else:
+                pending.setdefault(key, []).append(i)
+        
+        if pending:
+            keys = list(pending)
+            first_views = [views[pending[key][0]] for key in keys]
+            polarities, subjectivities = self._score_views(first_views)
+            for key, view, polarity, subjectivity in zip(keys, first_views, polarities, subjectivities):
+                result = self._build_result(view, float(polarity), float(subjectivity))
+                self._remember(key, result)
+                for i in pending[key]:
+                    results[i] = dict(result)
+        
+        return results
+    
+    def _score_views(self, views: List[TextView]):
+        """Base polarity and subjectivity for a batch of texts from the configured backend."""
+        if self.backend == 'textblob':
+            sentiments = [TextBlob(view.text).sentiment for view in views]
+            return [s.polarity for s in sentiments], [s.subjectivity for s in sentiments]
+        return self.model.score([view.words for view in views])
+    
+    def _build_result(self, view: TextView, polarity: float, subjectivity: float) -> Dict[str, Any]:
+        """Combine backend scores with keyword rules into the analysis result."""
         # Rule-based enhancement
-        keyword_sentiment = self._analyze_keywords(cleaned_content)
+        keyword_sentiment = self._analyze_keywords(view.word_set)
         
         # Combine scores (weighted average)
         final_polarity = (polarity * 0.7) + (keyword_sentiment['score'] * 0.3)
@@ -87,23 +175,30 @@ class SentimentAnalyzer:
             'keywords': keyword_sentiment['keywords']
         }
     
+    def _empty_result(self) -> Dict[str, Any]:
+        return {
+            'polarity': 0.0,
+            'subjectivity': 0.0,
+            'label': 'neutral',
+            'confidence': 0.0,
+            'keywords': []
+        }
+    
+    def _remember(self, key: str, result: Dict[str, Any]):
+        with self._cache_lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+    
     def _clean_text(self, text: str) -> str:
         """Clean and preprocess text for sentiment analysis."""
-        # Remove URLs
-        text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
-        
-        # Remove email addresses
-        text = re.sub(r'\S+@\S+', '', text)
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        return text
+        return clean_text(text)
     
-    def _analyze_keywords(self, text: str) -> Dict[str, Any]:
-        """Analyze sentiment using keyword matching."""
-        text_lower = text.lower()
-        words = set(re.findall(r'\b\w+\b', text_lower))
+    def _analyze_keywords(self, words: Union[str, Set[str]]) -> Dict[str, Any]:
+        """Analyze sentiment using keyword matching (over text or a lowercase word set)."""
+        if isinstance(words, str):
+            words = set(re.findall(r'\b\w+\b', words.lower()))
         
         positive_matches = words.intersection(self.positive_keywords)
         negative_matches = words.intersection(self.negative_keywords)
@@ -124,20 +219,3 @@ class SentimentAnalyzer:
                 'negative': list(negative_matches)
             }
         }
-    
-    def analyze_batch(self, contents: list) -> list:
-        """
-        Analyze sentiment for a batch of content items.
-        
-        Args:
-            contents: List of text content to analyze
-            
-        Returns:
-            List of sentiment analysis results
-        """
-        return asyncio.run(self._analyze_batch_async(contents))
-    
-    async def _analyze_batch_async(self, contents: list) -> list:
-        """Async batch processing of sentiment analysis."""
-        tasks = [self.analyze(content) for content in contents]
-        return await asyncio.gather(*tasks)
@@ -0,0 +1,178 @@
+"""
+Batched lexicon sentiment scoring.
+
+Scores many documents at once with TextBlob's pattern algorithm: each known
+word is one assessment; an adverb modifier ("very") is folded into the next
+known word, scaling its scores by the modifier's intensity; a negation
+flips and halves the polarity of the assessment it precedes. Assessment
+scores from the whole batch are then averaged per document in one pass.
+The lexicon is the one that ships with TextBlob (averaged per part of
+speech and then per word form, with "-ly" adverbs derived from adjectives,
+as TextBlob does), compiled once; without TextBlob a small built-in lexicon
+is used.
+
+Tokens are plain words, so unlike TextBlob, exclamation marks and emoticons
+are not scored, and contractions and hyphenated words split into separate
+words; otherwise scores match TextBlob's.
+"""
+
+import logging
+import os
+import xml.etree.ElementTree as ET
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# A negation flips and halves the polarity of the next assessment, as in TextBlob's pattern analyzer
+# ('t' is the tail of "don't", which TextBlob tokenizes as "n't")
+NEGATIONS = {'not', 'no', 'never', 't'}
+NEGATION_FACTOR = -0.5
+
+# Word form -> (polarity, subjectivity, intensity, modifier); modifiers are adverbs
+LexiconEntry = Tuple[float, float, float, bool]
+
+FALLBACK_LEXICON: Dict[str, LexiconEntry] = {
+    **{word: (0.8, 0.9, 1.0, False) for word in (
+        'excellent', 'amazing', 'fantastic', 'great', 'wonderful', 'outstanding', 'brilliant',
+        'superb', 'magnificent', 'perfect', 'love', 'awesome', 'incredible', 'remarkable',
+        'exceptional', 'marvelous', 'terrific', 'good', 'positive', 'success', 'successful'
+    )},
+    **{word: (-0.8, 0.9, 1.0, False) for word in (
+        'terrible', 'awful', 'horrible', 'disgusting', 'hate', 'worst', 'pathetic', 'useless',
+        'disappointing', 'frustrating', 'annoying', 'ridiculous', 'stupid', 'waste', 'failure',
+        'disaster', 'nightmare', 'bad', 'negative', 'poor'
+    )},
+    'very': (0.2, 0.3, 1.3, True),
+    'really': (0.2, 0.2, 1.0, True),
+    'highly': (0.16, 0.54, 1.0, True)
+}
+
+
+def _average(values: List[Tuple[float, float, float]]) -> Tuple[float, float, float]:
+    return tuple(sum(column) / len(values) for column in zip(*values))
+
+
+@lru_cache(maxsize=1)
+def load_lexicon() -> Dict[str, LexiconEntry]:
+    """Word form -> (polarity, subjectivity, intensity, modifier), averaged as TextBlob does."""
+    try:
+        import textblob
+        path = os.path.join(os.path.dirname(textblob.__file__), 'en', 'en-sentiment.xml')
+        senses: Dict[str, Dict[str, List[Tuple[float, float, float]]]] = {}
+        for word in ET.parse(path).getroot().iter('word'):
+            form = word.get('form', '').lower()
+            if not form or ' ' in form:
+                continue
+            senses.setdefault(form, {}).setdefault(word.get('pos'), []).append((
+                float(word.get('polarity', 0.0)),
+                float(word.get('subjectivity', 0.0)),
+                float(word.get('intensity', 1.0))
+            ))
+        # Average the senses of each part of speech, then the parts of speech
+        by_pos = {form: {pos: _average(values) for pos, values in tags.items()} for form, tags in senses.items()}
+        lexicon = {
+            form: (*_average(list(tags.values())), 'RB' in tags)
+            for form, tags in by_pos.items()
+        }
+        # Adjectives also score as their adverbs ("terrible" -> "terribly"), replacing any listed scores
+        for form, tags in by_pos.items():
+            if 'JJ' in tags:
+                stem = form[:-1] + 'i' if form.endswith('y') else form
+                stem = stem[:-2] if stem.endswith('le') else stem
+                lexicon[stem + 'ly'] = (*tags['JJ'], True)
+        return lexicon
+    except Exception as e:
+        logger.info(f"TextBlob sentiment lexicon unavailable ({e}); using built-in lexicon")
+        return dict(FALLBACK_LEXICON)
+
+
+class LexiconSentimentModel:
+    """Batched polarity/subjectivity over a compiled word lexicon."""
+
+    def __init__(self, lexicon: Dict[str, Tuple] = None):
+        """
+        Compile the lexicon.
+
+        Args:
+            lexicon: Word -> (polarity, subjectivity[, intensity[, modifier]]);
+                defaults to load_lexicon()
+        """
+        lexicon = lexicon if lexicon is not None else load_lexicon()
+        self.entries: Dict[str, LexiconEntry] = {
+            word: tuple(entry) + (1.0, False)[len(entry) - 2:] for word, entry in lexicon.items()
+        }
+
+    def assessments(self, tokens: List[str]) -> List[Tuple[float, float]]:
+        """
+        (polarity, subjectivity) of each assessment in one document, following
+        TextBlob's Sentiment.assessments for untagged words.
+        """
+        scored: List[List[float]] = []  # [polarity, subjectivity, intensity, negated]
+        modifier = None
+        negation = None
+        for token in tokens:
+            entry = self.entries.get(token)
+            if entry is not None:
+                polarity, subjectivity, intensity, is_modifier = entry
+                if modifier is None:
+                    scored.append([polarity, subjectivity, intensity, False])
+                else:
+                    # "very good": the modifier's intensity scales the word, which joins its assessment
+                    last = scored[-1]
+                    last[0] = max(-1.0, min(polarity * last[2], 1.0))
+                    last[1] = max(-1.0, min(subjectivity * last[2], 1.0))
+                    last[2] = intensity
+                if negation is not None:
+                    scored[-1][2] = 1.0 / scored[-1][2]
+                    scored[-1][3] = True
+                modifier = token if is_modifier else None
+                negation = token if token in NEGATIONS else None
+            else:
+                if token in NEGATIONS:
+                    negation = token
+                elif negation and len(token) > 1:
+                    negation = None  # Negations carry across one-letter words only
+                if negation is not None and modifier is not None and modifier.endswith('ly'):
+                    # "really not good"
+                    scored[-1][3] = True
+                    negation = None
+                elif modifier and len(token) > 2:
+                    modifier = None  # Modifiers carry across short words ("really is a good")
+        return [(polarity * NEGATION_FACTOR if negated else polarity, subjectivity)
+                for polarity, subjectivity, _, negated in scored]
+
+    def score(self, documents: List[List[str]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score tokenized documents.
+
+        Args:
+            documents: Lowercase word tokens per document
+
+        Returns:
+            (polarity, subjectivity) arrays, 0.0 for documents without lexicon hits
+        """
+        n = len(documents)
+        rows: List[int] = []
+        polarities: List[float] = []
+        subjectivities: List[float] = []
+        for row, tokens in enumerate(documents):
+            for polarity, subjectivity in self.assessments(tokens):
+                rows.append(row)
+                polarities.append(polarity)
+                subjectivities.append(subjectivity)
+
+        if not rows:
+            return np.zeros(n), np.zeros(n)
+
+        rows = np.array(rows, dtype=np.int64)
+        counts = np.bincount(rows, minlength=n).astype(float)
+        polarity_sum = np.bincount(rows, weights=np.array(polarities), minlength=n)
+        subjectivity_sum = np.bincount(rows, weights=np.array(subjectivities), minlength=n)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            polarity = np.where(counts > 0, polarity_sum / counts, 0.0)
+            subjectivity = np.where(counts > 0, subjectivity_sum / counts, 0.0)
+        return np.clip(polarity, -1.0, 1.0), np.clip(subjectivity, 0.0, 1.0)
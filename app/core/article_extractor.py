@@ -7,12 +7,16 @@ import asyncio
 import aiohttp
 import logging
 from typing import Dict, Any, Optional, List
-from urllib.parse import urlparse, unquote
+from urllib.parse import urlparse, unquote, urljoin
 import re
 import time
 from dataclasses import dataclass
 import hashlib
 
+from ..scraper.http_client import get_http_client
+from ..aggregator.url_canonicalizer import get_url_canonicalizer
+from .html_stream import ArticleStreamParser, feed_response, is_html_response
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -39,10 +43,23 @@ class ArticleExtractor:
         self.config = config or {}
         self.session = None
         self.cache = {}  # Simple in-memory cache
+        self.metadata_cache = {}  # Head-only metadata, keyed like self.cache
+        self.url_canonicalizer = get_url_canonicalizer()  # Persistent canonical links / resolved redirects
         self.cache_ttl = self.config.get('cache_ttl', 3600)  # 1 hour
         self.max_content_length = self.config.get('max_content_length', 3000)
         self.extraction_timeout = self.config.get('extraction_timeout', 10)
         self.enable_caching = self.config.get('enable_caching', True)
+        self.max_html_bytes = self.config.get('max_html_bytes', 1500000)  # Hard cap on bytes read per page
+        self.stream_chunk_size = self.config.get('stream_chunk_size', 16384)
+        self.max_head_bytes = self.config.get('max_head_bytes', 262144)  # Budget for head-only fetches
+        
+        # Batch scheduling: per-URL timeout and per-host politeness caps
+        self.per_url_timeout = self.config.get('per_url_timeout', 15)
+        self.max_concurrent_per_host = self.config.get('max_concurrent_per_host', 2)
+        self.per_host_limits = self.config.get('per_host_limits', {
+            # Publisher is unknown until the redirect resolves, so don't serialize these
+            'news.google.com': 6
+        })
         
         # User agents for different extraction methods
         self.user_agents = [
@@ -52,19 +69,15 @@ class ArticleExtractor:
         ]
         
     async def setup(self):
-        """Initialize the extractor."""
-        if not self.session:
-            timeout = aiohttp.ClientTimeout(total=self.extraction_timeout)
-            self.session = aiohttp.ClientSession(
-                timeout=timeout,
-                headers={'User-Agent': self.user_agents[0]}
-            )
+        """Attach the extractor to the shared, pooled HTTP session."""
+        if not self.session or self.session.closed:
+            self.session = await get_http_client().session_for('extractor')
+            self.session.headers['User-Agent'] = self.user_agents[0]
+            self.session.timeout = aiohttp.ClientTimeout(total=self.extraction_timeout)
     
     async def cleanup(self):
-        """Clean up resources."""
-        if self.session:
-            await self.session.close()
-            self.session = None
+        """Release the session (the shared pool stays open)."""
+        self.session = None
     
     def _get_cache_key(self, url: str) -> str:
         """Generate cache key for URL."""
@@ -77,6 +90,20 @@ class ArticleExtractor:
         return (time.time() - cache_entry['timestamp']) < self.cache_ttl
     
     async def _resolve_google_news_url(self, google_news_url: str) -> str:
+        """Resolve Google News redirect URL, reusing resolutions learned in earlier runs."""
+        if 'news.google.com' not in google_news_url:
+            return google_news_url
+        
+        known_url = self.url_canonicalizer.resolved(google_news_url)
+        if known_url:
+            return known_url
+        
+        resolved_url = await self._resolve_google_news_url_live(google_news_url)
+        if resolved_url != google_news_url:
+            self.url_canonicalizer.record(google_news_url, resolved_url)
+        return resolved_url
+    
+    async def _resolve_google_news_url_live(self, google_news_url: str) -> str:
         """Resolve Google News redirect URL to actual article URL."""
         try:
             # If it's not a Google News URL, return as-is
@@ -119,19 +146,19 @@ class ArticleExtractor:
                                 'Cache-Control': 'no-cache'
                             }
                             
-                            async with aiohttp.ClientSession(timeout=timeout, headers=headers) as session:
-                                async with session.get(redirect_url, allow_redirects=True, max_redirects=10) as response:
-                                    final_url = str(response.url)
-                                    logger.info(f"Response: {response.status}, Final URL: {final_url}")
+                            await self.setup()
+                            async with self.session.get(redirect_url, allow_redirects=True, max_redirects=10, timeout=timeout, headers=headers) as response:
+                                final_url = str(response.url)
+                                logger.info(f"Response: {response.status}, Final URL: {final_url}")
+                                
+                                # Check if we got a real article URL
+                                if (response.status == 200 and 
+                                    'news.google.com' not in final_url and
+                                    len(final_url) > 20 and
+                                    any(domain in final_url for domain in ['.com', '.org', '.net', '.co.uk', '.au'])):
                                     
-                                    # Check if we got a real article URL
-                                    if (response.status == 200 and 
-                                        'news.google.com' not in final_url and
-                                        len(final_url) > 20 and
-                                        any(domain in final_url for domain in ['.com', '.org', '.net', '.co.uk', '.au'])):
-                                        
-                                        logger.info(f"Successfully resolved via redirect: {final_url}")
-                                        return final_url
+                                    logger.info(f"Successfully resolved via redirect: {final_url}")
+                                    return final_url
                         
                         except Exception as redirect_error:
                             logger.info(f"Redirect attempt failed: {redirect_error}")
@@ -234,17 +261,17 @@ class ArticleExtractor:
                             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
                         }
                         
-                        async with aiohttp.ClientSession(timeout=timeout, headers=headers) as session:
-                            async with session.get(mobile_url, allow_redirects=True, max_redirects=5) as response:
-                                final_url = str(response.url)
+                        await self.setup()
+                        async with self.session.get(mobile_url, allow_redirects=True, max_redirects=5, timeout=timeout, headers=headers) as response:
+                            final_url = str(response.url)
+                            
+                            if (response.status == 200 and 
+                                'google.com' not in final_url and
+                                len(final_url) > 20):
+                                
+                                logger.info(f"Mobile variant resolved: {final_url}")
+                                return final_url
                                 
-                                if (response.status == 200 and 
-                                    'google.com' not in final_url and
-                                    len(final_url) > 20):
-                                    
-                                    logger.info(f"Mobile variant resolved: {final_url}")
-                                    return final_url
-                                    
                     except Exception:
                         continue
                         
@@ -269,11 +296,11 @@ class ArticleExtractor:
                         # Quick test if this domain exists
                         try:
                             timeout = aiohttp.ClientTimeout(total=5)
-                            async with aiohttp.ClientSession(timeout=timeout) as session:
-                                async with session.head(constructed_url) as response:
-                                    if response.status < 400:
-                                        logger.info(f"Domain-based URL works: {constructed_url}")
-                                        return constructed_url
+                            await self.setup()
+                            async with self.session.head(constructed_url, timeout=timeout) as response:
+                                if response.status < 400:
+                                    logger.info(f"Domain-based URL works: {constructed_url}")
+                                    return constructed_url
                         except Exception:
                             continue
                             
@@ -294,15 +321,20 @@ class ArticleExtractor:
             # Resolve Google News URLs first
             resolved_url = await self._resolve_google_news_url(url)
             
-            article = Article(resolved_url)
-            article.download()
-            article.parse()
+            def download_and_parse():
+                article = Article(resolved_url)
+                article.download()
+                article.parse()
+                
+                # Also extract natural language processing features and images
+                try:
+                    article.nlp()
+                except Exception as e:
+                    logger.debug(f"NLP extraction failed for {resolved_url}: {e}")
+                return article
             
-            # Also extract natural language processing features and images
-            try:
-                article.nlp()
-            except Exception as e:
-                logger.debug(f"NLP extraction failed for {resolved_url}: {e}")
+            # newspaper3k downloads and parses synchronously; keep it off the shared event loop
+            article = await asyncio.get_running_loop().run_in_executor(None, download_and_parse)
             
             if article.text and len(article.text) > 100:
                 content = article.text[:self.max_content_length]
@@ -345,7 +377,7 @@ class ArticleExtractor:
             )
     
     async def _extract_with_requests(self, url: str) -> ExtractionResult:
-        """Extract article content using direct HTTP requests and BeautifulSoup."""
+        """Extract article content by streaming the HTML into an incremental parser."""
         try:
             await self.setup()
             
@@ -360,134 +392,78 @@ class ArticleExtractor:
                         error=f"HTTP {response.status}"
                     )
                 
-                html = await response.text()
-                
-                # Use BeautifulSoup to extract content
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(html, 'html.parser')
+                # Reject non-HTML and oversized bodies before reading anything
+                if not is_html_response(response):
+                    return ExtractionResult(
+                        success=False,
+                        content="",
+                        error=f"Unsupported content type: {response.content_type}"
+                    )
                 
-                # Remove unwanted elements
-                for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
-                    element.decompose()
+                if response.content_length and response.content_length > self.max_html_bytes:
+                    return ExtractionResult(
+                        success=False,
+                        content="",
+                        error=f"Response too large: {response.content_length} bytes"
+                    )
                 
-                # Try to find article content using common selectors
-                content_selectors = [
-                    'article',
-                    '.article-content',
-                    '.post-content',
-                    '.entry-content',
-                    '.story-body',
-                    '.content',
-                    'main',
-                    '#main-content'
-                ]
+                # Stop reading once title, meta tags and enough paragraph text are in
+                parser = ArticleStreamParser(target_chars=self.max_content_length)
+                bytes_read = await feed_response(
+                    response, parser, self.max_html_bytes, self.stream_chunk_size
+                )
+            
+            content = parser.content
+            title = parser.best_title
+            
+            if len(content) > 100:
+                content = content[:self.max_content_length]
                 
-                content = ""
-                title = ""
+                # Open Graph image first (often the best quality), then in-article images
+                images = []
+                top_image = parser.meta_content('og:image')
+                if top_image:
+                    images.append(self._absolute_url(top_image, resolved_url))
+                    top_image = images[0]
                 
-                # Extract title
-                title_elem = soup.find('h1') or soup.find('title')
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
+                for src in parser.images:
+                    src = self._absolute_url(src, resolved_url)
+                    if src not in images:
+                        images.append(src)
                 
-                # Extract content
-                for selector in content_selectors:
-                    content_elem = soup.select_one(selector)
-                    if content_elem:
-                        # Get all paragraph text
-                        paragraphs = content_elem.find_all('p')
-                        if paragraphs:
-                            content = ' '.join([p.get_text(strip=True) for p in paragraphs])
-                            break
+                # If we don't have a top image yet, use the first good image
+                if not top_image and images:
+                    top_image = images[0]
                 
-                if not content:
-                    # Fallback: get all paragraph text
-                    paragraphs = soup.find_all('p')
-                    content = ' '.join([p.get_text(strip=True) for p in paragraphs[:10]])  # First 10 paragraphs
+                canonical_link = parser.links.get('canonical', '')
+                favicon = parser.links.get('icon', '')
                 
-                if len(content) > 100:
-                    content = content[:self.max_content_length]
-                    
-                    # Extract images from the article
-                    images = []
-                    top_image = ""
-                    
-                    # Look for Open Graph image first (often the best quality)
-                    og_image = soup.find('meta', attrs={'property': 'og:image'})
-                    if og_image and og_image.get('content'):
-                        top_image = og_image.get('content')
-                        images.append(top_image)
-                    
-                    # Find other images in the article content
-                    img_tags = soup.find_all('img')
-                    for img in img_tags:
-                        src = img.get('src') or img.get('data-src')  # Handle lazy loading
-                        if src and src not in images:
-                            # Make relative URLs absolute
-                            if src.startswith('//'):
-                                src = 'https:' + src
-                            elif src.startswith('/'):
-                                from urllib.parse import urljoin
-                                src = urljoin(resolved_url, src)
-                            
-                            # Filter out small/icon images
-                            width = img.get('width')
-                            height = img.get('height')
-                            if width and height:
-                                try:
-                                    if int(width) < 100 or int(height) < 100:
-                                        continue
-                                except ValueError:
-                                    pass
-                            
-                            # Skip if it looks like an icon or logo
-                            alt_text = img.get('alt', '').lower()
-                            if any(skip_word in alt_text for skip_word in ['logo', 'icon', 'avatar', 'profile']):
-                                continue
-                            
-                            images.append(src)
-                    
-                    # If we don't have a top image yet, use the first good image
-                    if not top_image and images:
-                        top_image = images[0]
-                    
-                    # Extract meta tags for additional info
-                    meta_description = ""
-                    meta_keywords = ""
-                    
-                    meta_desc = soup.find('meta', attrs={'name': 'description'}) or soup.find('meta', attrs={'property': 'og:description'})
-                    if meta_desc:
-                        meta_description = meta_desc.get('content', '')
-                    
-                    meta_kw = soup.find('meta', attrs={'name': 'keywords'})
-                    if meta_kw:
-                        meta_keywords = meta_kw.get('content', '')
-                    
-                    metadata = {
-                        'top_image': top_image,
-                        'images': images[:10],  # Limit to first 10 images
-                        'meta_description': meta_description,
-                        'meta_keywords': meta_keywords,
-                        'keywords': [],
-                        'summary': "",
-                        'canonical_link': "",
-                        'meta_favicon': "",
-                        'resolved_url': resolved_url  # Include the resolved URL for debugging
-                    }
-                    
-                    return ExtractionResult(
-                        success=True,
-                        content=content,
-                        title=title,
-                        extraction_method="requests+beautifulsoup",
-                        metadata=metadata
-                    )
+                metadata = {
+                    'top_image': top_image,
+                    'images': images[:10],  # Limit to first 10 images
+                    'meta_description': parser.meta_content('description', 'og:description'),
+                    'meta_keywords': parser.meta_content('keywords'),
+                    'keywords': [],
+                    'summary': "",
+                    'canonical_link': self._absolute_url(canonical_link, resolved_url) if canonical_link else "",
+                    'meta_favicon': self._absolute_url(favicon, resolved_url) if favicon else "",
+                    'resolved_url': resolved_url,  # Include the resolved URL for debugging
+                    'bytes_read': bytes_read
+                }
                 
                 return ExtractionResult(
-                    success=False,
-                    content="",
-                    error="Insufficient content extracted"
+                    success=True,
+                    content=content,
+                    title=title,
+                    extraction_method="streaming-html",
+                    metadata=metadata
                 )
+            
+            return ExtractionResult(
+                success=False,
+                content="",
+                error="Insufficient content extracted"
+            )
                 
         except Exception as e:
             logger.debug(f"Requests extraction failed for {url}: {e}")
@@ -497,6 +473,14 @@ class ArticleExtractor:
                 error=f"Requests extraction failed: {str(e)}"
             )
     
+    def _absolute_url(self, src: str, base_url: str) -> str:
+        """Make protocol-relative and relative URLs absolute."""
+        if src.startswith('//'):
+            return 'https:' + src
+        if src.startswith('/'):
+            return urljoin(base_url, src)
+        return src
+    
     async def extract_article_content(self, url: str) -> ExtractionResult:
         """Extract full article content from URL with multiple fallback methods."""
         start_time = time.time()
@@ -531,6 +515,8 @@ class ArticleExtractor:
                 result.processing_time = time.time() - start_time
                 
                 if result.success:
+                    self._record_canonical_link(url, result.metadata)
+                    
                     # Cache successful results
                     if self.enable_caching:
                         self.cache[cache_key] = {
@@ -555,6 +541,83 @@ class ArticleExtractor:
         
         return result
     
+    async def extract_metadata(self, url: str) -> Dict[str, Any]:
+        """
+        Fetch only the document head and return link-preview metadata.
+        
+        Reads the response until </head> (or max_head_bytes) and pulls og:image,
+        og:description, twitter:image, the canonical link and favicon. Results are
+        cached per URL and the extractor's session is reused across calls.
+        """
+        cache_key = self._get_cache_key(url)
+        if cache_key in self.metadata_cache and self._is_cache_valid(self.metadata_cache[cache_key]):
+            return self.metadata_cache[cache_key]['metadata']
+        
+        # A full extraction already has everything the head would give us
+        if cache_key in self.cache and self._is_cache_valid(self.cache[cache_key]):
+            result = self.cache[cache_key]['result']
+            if result.metadata.get('top_image'):
+                return result.metadata
+        
+        if self._should_skip_extraction(url):
+            return {}
+        
+        metadata = {}
+        try:
+            await self.setup()
+            resolved_url = await self._resolve_google_news_url(url)
+            
+            async with self.session.get(resolved_url) as response:
+                if response.status == 200 and is_html_response(response):
+                    parser = ArticleStreamParser(head_only=True)
+                    await feed_response(response, parser, self.max_head_bytes, self.stream_chunk_size)
+                    metadata = self._build_head_metadata(parser, resolved_url)
+                    self._record_canonical_link(url, metadata)
+                else:
+                    logger.debug(f"Head fetch skipped for {resolved_url}: HTTP {response.status}, {response.content_type}")
+                    
+        except Exception as e:
+            logger.debug(f"Head-only metadata fetch failed for {url}: {e}")
+        
+        # Cache misses too, so a results page doesn't refetch dead links
+        if self.enable_caching:
+            self.metadata_cache[cache_key] = {
+                'metadata': metadata,
+                'timestamp': time.time()
+            }
+        
+        return metadata
+    
+    def _record_canonical_link(self, url: str, metadata: Dict[str, Any]):
+        """Remember the page's canonical link (or final URL) for URL-based dedup."""
+        canonical_url = metadata.get('canonical_link') or metadata.get('resolved_url')
+        self.url_canonicalizer.record(url, canonical_url)
+        if metadata.get('resolved_url') and metadata['resolved_url'] != url:
+            self.url_canonicalizer.record(metadata['resolved_url'], canonical_url)
+    
+    def _build_head_metadata(self, parser: ArticleStreamParser, resolved_url: str) -> Dict[str, Any]:
+        """Convert parsed head tags into the extractor's metadata format."""
+        og_image = parser.meta_content('og:image', 'og:image:url', 'og:image:secure_url')
+        twitter_image = parser.meta_content('twitter:image', 'twitter:image:src')
+        canonical_link = parser.links.get('canonical', '') or parser.meta_content('og:url')
+        favicon = parser.links.get('icon', '')
+        
+        og_image = self._absolute_url(og_image, resolved_url) if og_image else ""
+        twitter_image = self._absolute_url(twitter_image, resolved_url) if twitter_image else ""
+        top_image = og_image or twitter_image
+        
+        return {
+            'top_image': top_image,
+            'images': list(dict.fromkeys(image for image in (og_image, twitter_image) if image)),
+            'og_image': og_image,
+            'twitter_image': twitter_image,
+            'meta_description': parser.meta_content('og:description', 'description', 'twitter:description'),
+            'canonical_link': self._absolute_url(canonical_link, resolved_url) if canonical_link else "",
+            'meta_favicon': self._absolute_url(favicon, resolved_url) if favicon else "",
+            'title': parser.meta_content('og:title', 'twitter:title') or parser.title,
+            'resolved_url': resolved_url
+        }
+    
     def _should_skip_extraction(self, url: str) -> bool:
         """Determine if URL should be skipped for extraction."""
         try:
@@ -576,62 +639,77 @@ class ArticleExtractor:
             return False
     
     async def enhance_articles_batch(self, articles: List[Dict[str, Any]], max_concurrent: int = 3) -> List[Dict[str, Any]]:
-        """Enhance multiple articles with extracted content in batches."""
+        """
+        Enhance multiple articles with extracted content.
+        
+        Uses a sliding window rather than fixed chunks: a global semaphore caps
+        total in-flight extractions at max_concurrent and per-host semaphores keep
+        us polite to each publisher. Every URL gets its own timeout, so one slow
+        site only holds its own slot. Results are returned in input order.
+        """
         if not articles:
             return articles
         
         await self.setup()
-        enhanced_articles = []
+        global_limit = asyncio.Semaphore(max_concurrent)
+        host_limits: Dict[str, asyncio.Semaphore] = {}
         
-        # Process articles in batches
-        for i in range(0, len(articles), max_concurrent):
-            batch = articles[i:i + max_concurrent]
+        async def enhance(article: Dict[str, Any]) -> Dict[str, Any]:
+            url = article.get('link', '')
+            if not url or not self._should_extract_for_article(article):
+                return article
             
-            # Create extraction tasks
-            tasks = []
-            for article in batch:
-                url = article.get('link', '')
-                if url and self._should_extract_for_article(article):
-                    task = self.extract_article_content(url)
-                    tasks.append((article, task))
-                else:
-                    enhanced_articles.append(article)
+            host = self._host_key(url)
+            if host not in host_limits:
+                host_limits[host] = asyncio.Semaphore(
+                    self.per_host_limits.get(host, self.max_concurrent_per_host)
+                )
             
-            # Execute batch
-            if tasks:
-                try:
-                    results = await asyncio.gather(*[task for _, task in tasks], return_exceptions=True)
-                    
-                    for (article, _), extraction_result in zip(tasks, results):
-                        if isinstance(extraction_result, ExtractionResult) and extraction_result.success:
-                            # Enhance article with extracted content
-                            article['content'] = extraction_result.content
-                            article['metadata'] = article.get('metadata', {})
-                            article['metadata'].update({
-                                'content_enhanced': True,
-                                'extraction_method': extraction_result.extraction_method,
-                                'extraction_time': extraction_result.processing_time,
-                                'original_content_length': len(article.get('content', '')),
-                                'enhanced_content_length': len(extraction_result.content)
-                            })
-                            
-                            # Update title if extracted title is better
-                            if extraction_result.title and len(extraction_result.title) > len(article.get('title', '')):
-                                article['title'] = extraction_result.title
-                        
-                        enhanced_articles.append(article)
-                        
-                except Exception as e:
-                    logger.error(f"Batch extraction failed: {e}")
-                    # Add articles without enhancement
-                    for article, _ in tasks:
-                        enhanced_articles.append(article)
+            # Take the host slot first so a throttled host never holds a global slot
+            async with host_limits[host]:
+                async with global_limit:
+                    try:
+                        extraction_result = await asyncio.wait_for(
+                            self.extract_article_content(url),
+                            timeout=self.per_url_timeout
+                        )
+                    except asyncio.TimeoutError:
+                        logger.debug(f"Extraction timed out after {self.per_url_timeout}s for {url}")
+                        return article
+                    except Exception as e:
+                        logger.error(f"Extraction failed for {url}: {e}")
+                        return article
             
-            # Small delay between batches
-            if i + max_concurrent < len(articles):
-                await asyncio.sleep(0.5)
+            if extraction_result.success:
+                self._apply_extraction(article, extraction_result)
+            return article
+        
+        return list(await asyncio.gather(*(enhance(article) for article in articles)))
+    
+    def _host_key(self, url: str) -> str:
+        """Host used for per-publisher concurrency limits."""
+        try:
+            host = urlparse(url).netloc.lower()
+        except Exception:
+            return ''
+        return host[4:] if host.startswith('www.') else host
+    
+    def _apply_extraction(self, article: Dict[str, Any], extraction_result: ExtractionResult):
+        """Enhance an article in place with extracted content."""
+        original_content_length = len(article.get('content', ''))
+        article['content'] = extraction_result.content
+        article['metadata'] = article.get('metadata', {})
+        article['metadata'].update({
+            'content_enhanced': True,
+            'extraction_method': extraction_result.extraction_method,
+            'extraction_time': extraction_result.processing_time,
+            'original_content_length': original_content_length,
+            'enhanced_content_length': len(extraction_result.content)
+        })
         
-        return enhanced_articles
+        # Update title if extracted title is better
+        if extraction_result.title and len(extraction_result.title) > len(article.get('title', '')):
+            article['title'] = extraction_result.title
     
     def _should_extract_for_article(self, article: Dict[str, Any]) -> bool:
         """Determine if article should have content extracted."""
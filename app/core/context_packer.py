@@ -0,0 +1,209 @@
+"""
+Token-budgeted extractive context for multi-article LLM prompts.
+
+Instead of the first few hundred characters of the first ten articles, the
+packer splits every article into sentences, scores each one for relevance
+(similarity to the query, centrality across the whole result set, lead
+position and article rank) and picks them greedily by maximal marginal
+relevance: a sentence too similar to one already chosen is dropped as
+redundant, so a fact reported by five sources reaches the model once.
+Selection stops when the token budget is full, and the chosen sentences are
+returned whole, in article and reading order.
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..aggregator.text_view import WORD_PATTERN, text_view
+
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these',
+    'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him',
+    'her', 'us', 'them', 'my', 'your', 'his', 'its', 'our', 'their',
+    'from', 'said', 'says', 'also', 'not', 'more', 'than', 'about', 'into'
+})
+
+BOILERPLATE_PREFIXES = ('click', 'read more', 'subscribe', 'sign up', 'follow', 'advertisement')
+
+
+def sentence_terms(text: str) -> List[str]:
+    """Content words of a sentence: lowercase, without stop words and very short tokens."""
+    return [word for word in WORD_PATTERN.findall(text.lower()) if word not in STOP_WORDS and len(word) > 2]
+
+
+def is_boilerplate(sentence: str) -> bool:
+    """Navigation, subscription and copyright lines that carry no news."""
+    lower = sentence.lower()
+    return lower.startswith(BOILERPLATE_PREFIXES) or '©' in sentence or sentence.endswith('...')
+
+
+def tfidf_vectors(documents: Sequence[List[str]],
+                  extra: Sequence[List[str]] = ()) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    L2-normalized TF-IDF rows for term lists, with IDF fitted on the documents.
+
+    Args:
+        documents: Term list per sentence
+        extra: Further term lists (e.g. the query) projected onto the same vocabulary
+
+    Returns:
+        (document matrix, extra matrix); rows without known terms are all zero
+    """
+    vocabulary: Dict[str, int] = {}
+    for terms in documents:
+        for term in terms:
+            vocabulary.setdefault(term, len(vocabulary))
+
+    def counts(term_lists: Sequence[List[str]]) -> np.ndarray:
+        matrix = np.zeros((len(term_lists), len(vocabulary)), dtype=np.float32)
+        for row, terms in enumerate(term_lists):
+            for term in terms:
+                column = vocabulary.get(term)
+                if column is not None:
+                    matrix[row, column] += 1.0
+        return matrix
+
+    doc_counts = counts(documents)
+    document_frequency = (doc_counts > 0).sum(axis=0)
+    idf = np.log((1.0 + len(documents)) / (1.0 + document_frequency)) + 1.0
+
+    def weigh(matrix: np.ndarray) -> np.ndarray:
+        weighted = np.log1p(matrix) * idf
+        norms = np.linalg.norm(weighted, axis=1, keepdims=True)
+        return np.divide(weighted, norms, out=np.zeros_like(weighted), where=norms > 0)
+
+    return weigh(doc_counts), weigh(counts(extra))
+
+
+@dataclass
+class PackedArticle:
+    """One article's share of the packed context."""
+
+    index: int  # Position in the input list
+    article: Dict[str, Any]
+    sentences: List[str] = field(default_factory=list)
+
+
+class ContextPacker:
+    """Selects relevant, non-redundant sentences across articles within a token budget."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the packer.
+
+        Args:
+            config: Packing settings (token_budget, chars_per_token, max_articles,
+                candidates_per_article, max_per_article, redundancy_threshold,
+                novelty_weight, min_words, max_words)
+        """
+        self.config = config or {}
+        self.token_budget = self.config.get('token_budget', 900)
+        self.chars_per_token = self.config.get('chars_per_token', 4.0)
+        self.max_articles = self.config.get('max_articles', 20)
+        self.candidates_per_article = self.config.get('candidates_per_article', 15)
+        self.max_per_article = self.config.get('max_per_article', 3)
+        self.redundancy_threshold = self.config.get('redundancy_threshold', 0.6)
+        self.novelty_weight = self.config.get('novelty_weight', 0.3)  # MMR trade-off; 0 ignores redundancy
+        self.min_words = self.config.get('min_words', 5)
+        self.max_words = self.config.get('max_words', 60)
+
+    def estimate_tokens(self, text: str) -> int:
+        """Rough token count of text (characters per token heuristic)."""
+        return max(1, math.ceil(len(text) / self.chars_per_token))
+
+    @staticmethod
+    def header(article: Dict[str, Any]) -> str:
+        """Per-article prefix that is paid for once an article contributes a sentence."""
+        return f"{article.get('source', 'Unknown')}: {text_view(article).clean_title}"
+
+    def _candidates(self, articles: List[Dict[str, Any]]) -> List[Tuple[int, int, str]]:
+        """(article index, sentence position, sentence) for every usable sentence."""
+        candidates = []
+        for index, article in enumerate(articles[:self.max_articles]):
+            kept = 0
+            for position, sentence in enumerate(text_view(article).sentences):
+                if kept >= self.candidates_per_article:
+                    break
+                sentence = sentence.strip()
+                if not self.min_words <= len(sentence.split()) <= self.max_words or is_boilerplate(sentence):
+                    continue
+                candidates.append((index, position, sentence))
+                kept += 1
+        return candidates
+
+    def pack(self, articles: List[Dict[str, Any]], query: str) -> List[PackedArticle]:
+        """
+        Choose the context for a multi-article prompt.
+
+        Args:
+            articles: Articles in rank order
+            query: Search query the prompt is about
+
+        Returns:
+            Contributing articles in rank order, each with its chosen sentences in
+            reading order; articles without usable sentences contribute their
+            title alone while budget remains
+        """
+        candidates = self._candidates(articles)
+        packed: Dict[int, PackedArticle] = {}
+        used = 0
+
+        if candidates:
+            vectors, query_vectors = tfidf_vectors(
+                [sentence_terms(sentence) for _, _, sentence in candidates], [sentence_terms(query or '')]
+            )
+            query_similarity = vectors @ query_vectors[0]
+            centroid = vectors.sum(axis=0)
+            norm = np.linalg.norm(centroid)
+            centrality = vectors @ (centroid / norm) if norm > 0 else np.zeros(len(candidates), dtype=np.float32)
+            lead = np.array([1.0 / (1.0 + position) for _, position, _ in candidates], dtype=np.float32)
+            rank = np.array([1.0 / (1.0 + 0.1 * index) for index, _, _ in candidates], dtype=np.float32)
+            relevance = (0.5 * query_similarity + 0.3 * centrality + 0.2 * lead) * rank
+
+            selected: List[int] = []
+            per_article: Dict[int, int] = {}
+            max_similarity = np.zeros(len(candidates), dtype=np.float32)
+            available = np.ones(len(candidates), dtype=bool)
+            while available.any():
+                mmr = (1.0 - self.novelty_weight) * relevance - self.novelty_weight * max_similarity
+                best = int(np.argmax(np.where(available, mmr, -np.inf)))
+                available[best] = False
+                index, _, sentence = candidates[best]
+                if per_article.get(index, 0) >= self.max_per_article:
+                    continue
+                if selected and max_similarity[best] >= self.redundancy_threshold:
+                    continue  # Another source already said this
+                cost = self.estimate_tokens(sentence)
+                if index not in packed:
+                    cost += self.estimate_tokens(self.header(articles[index]))
+                if used + cost > self.token_budget:
+                    continue  # A shorter sentence may still fit
+                used += cost
+                selected.append(best)
+                per_article[index] = per_article.get(index, 0) + 1
+                packed.setdefault(index, PackedArticle(index, articles[index]))
+                max_similarity = np.maximum(max_similarity, vectors @ vectors[best])
+
+            for best in sorted(selected, key=lambda i: candidates[i][:2]):
+                packed[candidates[best][0]].sentences.append(candidates[best][2])
+
+        # Title-only articles (headlines, short snippets) still name their story, once
+        with_sentences = {index for index, _, _ in candidates}
+        titles = {text_view(packed_article.article).normalized_title for packed_article in packed.values()}
+        for index, article in enumerate(articles[:self.max_articles]):
+            title = text_view(article).normalized_title
+            if index in with_sentences or not title or title in titles:
+                continue
+            titles.add(title)
+            cost = self.estimate_tokens(self.header(article))
+            if used + cost <= self.token_budget:
+                used += cost
+                packed[index] = PackedArticle(index, article)
+
+        return [packed[index] for index in sorted(packed)]
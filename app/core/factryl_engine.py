@@ -6,7 +6,7 @@ Integrates all scrapers to work for the same keyword and display unified results
 import asyncio
 import logging
 import time
-from typing import Dict, List, Any, Optional
+from typing import AsyncIterator, Callable, Dict, List, Any, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 from datetime import datetime
@@ -16,10 +16,24 @@ from ..analyzer.relevance import RelevanceAnalyzer
 from ..analyzer.sentiment import SentimentAnalyzer
 from ..analyzer.credibility import CredibilityAnalyzer
 from ..analyzer.bias import BiasAnalyzer
+from ..analyzer.analysis_cache import AnalysisCache
 
 from ..aggregator.combiner import ContentCombiner
 from ..aggregator.deduplicator import Deduplicator
+from ..aggregator.story_index import StoryClusterIndex
+from ..aggregator.domain_reputation import get_domain_reputation
+from ..aggregator.entities import get_entity_registry
+from ..aggregator.url_canonicalizer import get_url_canonicalizer
 from ..aggregator.scorer import ContentScorer
+from ..aggregator.timestamps import normalize_timestamps
+from ..aggregator.ranker import StreamingRanker
+from ..aggregator.text_view import strip_html
+
+# Process-wide pooled HTTP client shared by scrapers and the article extractor
+from ..scraper.http_client import get_http_client
+
+# Extractive (non-LLM) summaries
+from .extractive_summarizer import ExtractiveSummarizer
 
 # AI components
 try:
@@ -138,15 +152,35 @@ class FactrylEngine:
         self.config = config or {}
         self.logger = logging.getLogger(__name__)
         
+        # Shared domain reputation, built from the engine config before any analyzer or scraper asks for it
+        self.domain_reputation = get_domain_reputation(self.config.get('domain_reputation', {}))
+        # One entity registry for relevance and scoring
+        self.entity_registry = get_entity_registry(self.config.get('entities'))
+        
         # Initialize components
-        self.relevance_analyzer = RelevanceAnalyzer()
+        self.relevance_analyzer = RelevanceAnalyzer(self.config.get('relevance', {}), entity_registry=self.entity_registry)
         self.sentiment_analyzer = SentimentAnalyzer()
-        self.credibility_analyzer = CredibilityAnalyzer()
+        self.credibility_analyzer = CredibilityAnalyzer(reputation=self.domain_reputation)
         self.bias_analyzer = BiasAnalyzer()
-        
-        self.combiner = ContentCombiner(self.config.get('combiner', {}))
-        self.deduplicator = Deduplicator(self.config.get('deduplicator', {}))
-        self.scorer = ContentScorer(self.config.get('scorer', {}))
+        # Query-independent results (sentiment, bias) are reused across searches
+        self.analysis_cache = AnalysisCache(self.config.get('analysis_cache', {}))
+        
+        self.combiner = ContentCombiner(self.config.get('combiner', {}), reputation=self.domain_reputation)
+        # Cross-query story clusters persist between searches; dedup is a cluster lookup
+        self.story_index = StoryClusterIndex(self.config.get('story_index', {}))
+        self.url_canonicalizer = get_url_canonicalizer(self.config.get('url_canonicalizer', {}))
+        self.deduplicator = Deduplicator(
+            self.config.get('deduplicator', {}),
+            story_index=self.story_index,
+            canonicalizer=self.url_canonicalizer
+        )
+        self.scorer = ContentScorer(self.config.get('scorer', {}), entity_registry=self.entity_registry)
+        
+        # Shared connection pool (first caller configures it)
+        self.http_client = get_http_client(self.config.get('http_client', {}))
+        
+        # TextRank summaries when the LLM is unavailable, overloaded or unusable
+        self.summarizer = ExtractiveSummarizer(self.config.get('summarizer', {}))
         
         # Initialize AI components if available
         self.ai_analyzer = AIAnalyzer() if AI_AVAILABLE else None
@@ -156,7 +190,7 @@ class FactrylEngine:
         self.ollama_analyzer = None
         if OLLAMA_AVAILABLE:
             try:
-                self.ollama_analyzer = OllamaAnalyzer()
+                self.ollama_analyzer = OllamaAnalyzer(config=self.config.get('ollama', {}))
                 if self.ollama_analyzer.is_service_available():
                     print("Ollama LLM integration active - Real AI summarization enabled")
                 else:
@@ -175,7 +209,8 @@ class FactrylEngine:
                     'enable_caching': True,
                     'cache_ttl': 3600,
                     'max_content_length': 3000,
-                    'extraction_timeout': 8
+                    'extraction_timeout': 8,
+                    'max_html_bytes': 1500000
                 })
                 self.article_extractor = ArticleExtractor(extractor_config)
                 print("Article content extraction enabled - Full article content available")
@@ -301,8 +336,17 @@ class FactrylEngine:
         
         self.logger.info(f"Initialized {len(self.scrapers)} scrapers")
     
-    async def search(self, query: str, max_results: int = 40) -> Dict[str, Any]:
-        """Perform a comprehensive search across all available sources."""
+    async def search(self, query: str, max_results: int = 40,
+                     on_ranking: Optional[Callable[[List[Dict[str, Any]], bool], None]] = None) -> Dict[str, Any]:
+        """
+        Perform a comprehensive search across all available sources.
+        
+        Args:
+            query: Search query
+            max_results: Number of ranked results to return
+            on_ranking: Optional callback receiving (ranking, is_final) whenever the
+                provisional ranking changes as scrapers finish, and once at the end
+        """
         start_time = time.time()
         self.logger.info(f"Starting search for: {query}")
         
@@ -315,6 +359,20 @@ class FactrylEngine:
         print(f"Search strategy: Target {max_results} final results from {num_scrapers} scrapers")
         print(f"Collecting {total_target} total articles (~{per_scraper_limit} per scraper) for filtering")
         
+        # Incremental top-k; provisional rankings are published as scrapers finish
+        ranking_config = self.config.get('ranking', {})
+        ranker = StreamingRanker(
+            max_results,
+            max_per_source=ranking_config.get('max_per_source', max(5, max_results // 4))
+        )
+        
+        def publish_ranking(final: bool):
+            if on_ranking:
+                try:
+                    on_ranking(ranker.ranking(), final)
+                except Exception as e:
+                    self.logger.warning(f"Ranking callback failed: {e}")
+        
         # Run scrapers in parallel
         async def run_scraper(name: str, scraper: Any) -> List[Dict[str, Any]]:
             try:
@@ -330,6 +388,15 @@ class FactrylEngine:
                     result['credibility_score'] = round(cred_info['score'] * 100, 1)  # Convert 0.0-1.0 to 0-100 scale
                     result['bias_rating'] = cred_info['bias']
                     result['source_category'] = cred_info['category']
+                
+                # Parse every date format once, so recency downstream is a subtraction
+                normalize_timestamps(results)
+                
+                # Score only this scraper's batch and merge it into the provisional ranking
+                if on_ranking and results:
+                    self.scorer.score_batch(results)
+                    if ranker.offer_many(results).changed:
+                        publish_ranking(final=False)
                 return results
             except Exception as e:
                 self.logger.error(f"Scraper {name} failed: {e}")
@@ -364,35 +431,43 @@ class FactrylEngine:
             except Exception as e:
                 print(f"Content enhancement failed: {e}, continuing with original content")
         
-        # Deduplicate results
-        unique_results = self.deduplicator.deduplicate(combined_results)
+        # Deduplicate results (CPU-bound, so off the shared event loop)
+        unique_results = await asyncio.get_running_loop().run_in_executor(
+            None, self.deduplicator.deduplicate, combined_results
+        )
         print(f"After deduplication: {len(unique_results)} unique articles ({len(combined_results) - len(unique_results)} duplicates removed)")
         
+        # Relevance, sentiment and bias for the whole pool at once (shared text views, batched scoring)
+        relevance_scores = await self.relevance_analyzer.analyze_batch(unique_results, query)
+        sentiment_scores = await self.analysis_cache.analyze_batch(self.sentiment_analyzer, unique_results)
+        bias_scores = await self.analysis_cache.analyze_batch(self.bias_analyzer, unique_results)
+        
+        # Persist cluster assignments, canonical links, corpus statistics and analysis results off the event loop
+        await asyncio.get_running_loop().run_in_executor(None, self._save_indexes)
+        
         # Score and sort results
         scored_results = []
-        for result in unique_results:
-            # Calculate relevance score
-            relevance_score = await self.relevance_analyzer.analyze(result, query)
+        for result, relevance_score, sentiment_score, bias_score in zip(
+                unique_results, relevance_scores, sentiment_scores, bias_scores):
             result['relevance_score'] = relevance_score
-            
-            # Calculate sentiment score
-            sentiment_score = await self.sentiment_analyzer.analyze(result.get('content', ''))
             result['sentiment_score'] = sentiment_score
+            result['bias_analysis'] = bias_score
             
             # Get credibility score from database - convert to 0-100 scale for display
             cred_info = self.get_source_credibility(result['source'])
             raw_credibility = cred_info['score']  # This is 0.0-1.0 range
             result['credibility_score'] = round(raw_credibility * 100, 1)  # Convert to 0-100 scale
             
-            # Calculate composite score
-            score_dict = self.scorer.calculate_score(result)
-            result['composite_score'] = score_dict['composite']
-            
             scored_results.append(result)
         
-        # Sort by composite score
-        scored_results.sort(key=lambda x: x['composite_score'], reverse=True)
-        final_results = scored_results[:max_results]
+        # Composite scores for the whole candidate pool in one vectorized pass; the ranker
+        # drops merged duplicates and only moves items whose score changed
+        self.scorer.score_batch(scored_results)
+        for result in scored_results:
+            result['composite_score'] = result['score']['composite']
+        ranker.sync(scored_results)
+        final_results = ranker.ranking()
+        publish_ranking(final=True)
         
         print(f"Final results: {len(final_results)} articles selected from {len(scored_results)} scored articles")
         print(f"Top 5 articles by score:")
@@ -433,6 +508,21 @@ class FactrylEngine:
             'timestamp': datetime.utcnow().isoformat()
         }
     
+    def _save_indexes(self):
+        """Write the persistent story-cluster index, canonical URL cache, BM25 statistics and analysis cache."""
+        self.story_index.save()
+        self.url_canonicalizer.save()
+        self.relevance_analyzer.bm25.save()
+        self.analysis_cache.save()
+    
+    async def prewarm_connections(self) -> Dict[str, bool]:
+        """Open pooled connections to the most frequently used hosts ahead of the first search."""
+        try:
+            return await self.http_client.prewarm()
+        except Exception as e:
+            self.logger.warning(f"Connection pre-warm failed: {e}")
+            return {}
+    
     def get_available_sources(self) -> List[str]:
         """Get list of available data sources."""
         return list(self.scrapers.keys())
@@ -466,14 +556,7 @@ class FactrylEngine:
             print(f"Summary generation started for '{query}' with {len(articles)} articles")
             
             # First, try to get dictionary definition using simple fallback
-            definition_text = ""
-            if DICTIONARY_AVAILABLE:
-                try:
-                    definition_text = self._get_simple_definition(query)
-                    if definition_text:
-                        print(f"Dictionary definition found: {definition_text[:100]}...")
-                except Exception as e:
-                    print(f"Dictionary lookup failed: {e}")
+            definition_text = self._definition_text(query)
             
             # Priority 1: Use Ollama LLM analyzer if available
             if self.ollama_analyzer and self.ollama_analyzer.is_service_available():
@@ -533,57 +616,13 @@ class FactrylEngine:
     async def generate_article_summary(self, article: Dict[str, Any], max_length: int = 300) -> str:
         """Generate a concise summary for a single article with smart source management."""
         try:
-            # Always try to generate actual content summaries, not just titles
-            content = article.get('content', '')
-            title = article.get('title', '')
-            
-            # Detect generic/poor quality content early but don't give up immediately
-            content_is_generic = self._is_generic_content(content)
-            if content_is_generic:
-                print(f"Generic content detected (length: {len(content)}), will try harder extraction")
-            
-            # Force article extraction for short content or generic content
-            enhanced_article = article
-            should_extract = (
-                self.article_extractor and 
-                not article.get('metadata', {}).get('content_enhanced') and
-                (len(content) < 500 or content_is_generic)  # Increased threshold to 500 chars
-            )
-            
-            if should_extract:
-                try:
-                    print(f"Attempting article extraction for better content (current: {len(content)} chars)")
-                    enhanced_article = await self.enhance_single_article(article)
-                    enhanced_content = enhanced_article.get('content', '')
-                    
-                    # Use enhanced content if it's better quality or longer
-                    if len(enhanced_content) > len(content) and not self._is_generic_content(enhanced_content):
-                        content = enhanced_content
-                        article = enhanced_article  # Use the enhanced article for all processing
-                        print(f"Successfully enhanced article content: {len(content)} chars")
-                    elif not self._is_generic_content(enhanced_content) and len(enhanced_content) > 20:  # Lowered threshold
-                        # Even if not longer, use it if it's higher quality
-                        content = enhanced_content
-                        article = enhanced_article
-                        print(f"Using enhanced content for better quality: {len(content)} chars")
-                    else:
-                        print(f"Enhanced content not significantly better, keeping original")
-                        
-                except Exception as e:
-                    print(f"Article enhancement failed: {e}")
+            article, llm_article = await self._prepare_summary_article(article)
             
             # Try LLM summarization with enhanced article data
-            if (self.ollama_analyzer and 
-                self.ollama_analyzer.is_service_available() and 
-                len(content) > 5):  # Even lower threshold to ensure summaries are attempted
+            if self._ollama_ready() and len(article.get('content', '')) > 5:  # Even lower threshold to ensure summaries are attempted
                 try:
-                    # Add URL info to help LLM understand context when content is poor
-                    article_with_url = enhanced_article.copy()
-                    if article.get('url') or article.get('link'):
-                        url = article.get('url') or article.get('link', '')
-                        article_with_url['url_context'] = self._extract_context_from_url(url)
-                    
-                    summary = self.ollama_analyzer.generate_article_summary(article_with_url, max_length)
+                    # Bounded async client: queued behind the concurrency limit without blocking this loop
+                    summary = await self.ollama_analyzer.generate_article_summary_async(llm_article, max_length)
                     if summary and len(summary.strip()) > 20:  # More lenient validation but ensure some content
                         print(f"LLM summary generated: '{summary[:50]}...' ({len(summary)} chars)")
                         return summary
@@ -592,118 +631,7 @@ class FactrylEngine:
                 except Exception as e:
                     print(f"Ollama article summary failed: {e}")
             
-            # Intelligent content extraction from article content
-            if len(content) > 20:  # Lowered threshold for better coverage
-                # Clean the content
-                clean_content = self._clean_html(content)
-                
-                # Try to extract key information from the content
-                sentences = clean_content.split('. ')
-                
-                # Look for the most informative sentences (skip very short ones)
-                best_sentences = []
-                for i, sentence in enumerate(sentences[:8]):  # Check first 8 sentences for more content
-                    sentence = sentence.strip()
-                    if (len(sentence) > 15 and  # Lowered minimum length
-                        not sentence.lower().startswith(('click', 'read more', 'subscribe', 'sign up', 'follow')) and
-                        not sentence.endswith('...') and
-                        '©' not in sentence and
-                        'advertisement' not in sentence.lower()):
-                        best_sentences.append(sentence)
-                
-                if best_sentences:
-                    # Create a comprehensive summary from the best content
-                    primary_sentence = best_sentences[0]
-                    
-                    # If we have multiple good sentences, try to combine them intelligently
-                    if len(best_sentences) > 1 and len(primary_sentence) < max_length * 2:  # More generous threshold
-                        secondary_sentence = best_sentences[1]
-                        combined = f"{primary_sentence}. {secondary_sentence}"
-                        
-                        # Add third sentence if available and not too long
-                        if len(best_sentences) > 2 and len(combined) < max_length * 2.5:
-                            tertiary_sentence = best_sentences[2]
-                            combined = f"{combined}. {tertiary_sentence}"
-                        
-                        if len(combined) <= max_length * 3:  # Allow longer combined summaries
-                            return combined
-                        else:
-                            # Use just the primary sentence, but be more generous with length
-                            if len(primary_sentence) > max_length * 2:  # Only truncate if much longer
-                                truncated = primary_sentence[:max_length * 2 - 10]  # More generous truncation
-                                last_space = truncated.rfind(' ')
-                                if last_space > len(truncated) * 0.8:  # Find a good word boundary
-                                    truncated = truncated[:last_space]
-                                return truncated + "..."
-                            return primary_sentence
-                    else:
-                        # Use the primary sentence, be more generous with truncation
-                        if len(primary_sentence) > max_length * 2:  # Only truncate if much longer
-                            truncated = primary_sentence[:max_length * 2 - 10]  # More generous truncation
-                            last_space = truncated.rfind(' ')
-                            if last_space > len(truncated) * 0.8:  # Find a good word boundary
-                                truncated = truncated[:last_space]
-                            return truncated + "..."
-                        return primary_sentence
-                
-                # If no good sentences, create an intelligent word-based summary
-                words = clean_content.split()
-                if len(words) > 5:  # Lowered threshold
-                    # Take meaningful portion of content - be more generous
-                    word_count = min(max_length // 3, len(words))  # Estimate ~3 chars per word (more generous)
-                    summary_words = words[:word_count]
-                    summary = ' '.join(summary_words)
-                    
-                    # Ensure it ends at a sentence boundary if possible
-                    if '.' in summary:
-                        last_period = summary.rfind('.')
-                        if last_period > len(summary) * 0.3:  # More lenient threshold
-                            summary = summary[:last_period + 1]
-                    
-                    # Only truncate if significantly longer than desired
-                    if len(summary) > max_length * 3:
-                        summary = summary[:max_length * 3 - 10] + "..."
-                    
-                    return summary
-            
-            # Enhanced title-based fallback
-            if title:
-                clean_title = self._clean_html(title)
-                source = article.get('source', '').title()
-                
-                # Create a more informative summary from the title
-                if len(clean_title) < 40:  # Short titles - enhance them
-                    if source and source not in clean_title and len(source) < 30:
-                        enhanced = f"{clean_title} - Recent reporting from {source} highlights this development"
-                        if len(enhanced) <= max_length:
-                            return enhanced
-                    else:
-                        enhanced = f"{clean_title}. This represents current news and ongoing developments in the area"
-                        if len(enhanced) <= max_length:
-                            return enhanced
-                
-                # For longer titles, use intelligent truncation
-                if len(clean_title) <= max_length:
-                    return clean_title
-                else:
-                    # Try to truncate at meaningful boundaries
-                    truncated = clean_title[:max_length-3]
-                    
-                    # Prefer to end at punctuation
-                    for punct in ['.', ':', ';', ',']:
-                        last_punct = truncated.rfind(punct)
-                        if last_punct > max_length * 0.6:
-                            return truncated[:last_punct + 1]
-                    
-                    # Fallback to word boundary
-                    last_space = truncated.rfind(' ')
-                    if last_space > max_length * 0.7:
-                        truncated = truncated[:last_space]
-                    return truncated + "..."
-            
-            # Final enhanced fallback
-            source = article.get('source', 'Unknown Source').title()
-            return f"Article from {source} - Content available for review"
+            return self._degraded_article_summary(article, max_length)
             
         except Exception as e:
             print(f"Article summary generation failed: {e}")
@@ -713,6 +641,191 @@ class FactrylEngine:
             else:
                 return title[:max_length-3] + "..."
     
+    async def generate_article_summaries(self, articles: List[Dict[str, Any]], max_length: int = 300) -> List[str]:
+        """
+        Summarize several articles (e.g. a page of result tiles) together.
+        
+        Content extraction runs concurrently, and LLM summaries are requested several
+        articles per prompt; unusable results fall back like generate_article_summary.
+        
+        Returns:
+            One summary per article, in order
+        """
+        prepared = await asyncio.gather(
+            *(self._prepare_summary_article(article) for article in articles), return_exceptions=True
+        )
+        prepared = [
+            (article, article) if isinstance(result, BaseException) else result
+            for article, result in zip(articles, prepared)
+        ]
+        
+        summaries: List[Optional[str]] = [None] * len(articles)
+        llm_indexes = [i for i, (article, _) in enumerate(prepared) if len(article.get('content', '')) > 5]
+        if self._ollama_ready() and llm_indexes:
+            try:
+                results = await self.ollama_analyzer.generate_article_summaries_async(
+                    [prepared[i][1] for i in llm_indexes], max_length
+                )
+                for i, summary in zip(llm_indexes, results):
+                    if summary and len(summary.strip()) > 20:
+                        summaries[i] = summary
+                print(f"Batched LLM summaries: {sum(1 for s in summaries if s)}/{len(articles)} articles")
+            except Exception as e:
+                print(f"Ollama batched summaries failed: {e}")
+        
+        missing = [i for i, summary in enumerate(summaries) if summary is None]
+        try:
+            # CPU-bound for large batches: keep it off the shared event loop
+            degraded = await asyncio.get_running_loop().run_in_executor(
+                None, self._degraded_article_summaries, [prepared[i][0] for i in missing], max_length
+            )
+        except Exception as e:
+            print(f"Extractive article summaries failed: {e}")
+            degraded = [self._title_summary(prepared[i][0], max_length) for i in missing]
+        for i, summary in zip(missing, degraded):
+            summaries[i] = summary
+        return summaries
+    
+    async def stream_article_summary(self, article: Dict[str, Any], max_length: int = 300) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streaming variant of generate_article_summary.
+        
+        Yields token events while the LLM generates, then one 'done' event carrying
+        the final (cleaned) summary; without the LLM only the 'done' event is sent.
+        """
+        try:
+            article, llm_article = await self._prepare_summary_article(article)
+            if self._ollama_ready() and len(article.get('content', '')) > 5:
+                async for event in self.ollama_analyzer.stream_article_summary(llm_article, max_length):
+                    if event['type'] == 'done' and len(event['summary'].strip()) <= 20:
+                        event = dict(event, summary=self._degraded_article_summary(article, max_length))
+                    yield event
+                return
+            yield {'type': 'done', 'summary': self._degraded_article_summary(article, max_length), 'cached': False}
+        except Exception as e:
+            print(f"Article summary streaming failed: {e}")
+            title = article.get('title', 'Article')
+            yield {'type': 'done', 'summary': title if len(title) <= max_length else title[:max_length-3] + "...", 'cached': False}
+    
+    async def stream_summary(self, articles: List[Dict[str, Any]], query: str,
+                             max_length: int = 280) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streaming variant of generate_summary.
+        
+        Yields token events while the Ollama LLM generates, then one 'done' event
+        carrying the final summary; other backends only send the 'done' event.
+        """
+        if self._ollama_ready():
+            # Same definition prefix as generate_summary, streamed ahead of the report
+            definition_text = self._definition_text(query)
+            if definition_text:
+                yield {'type': 'token', 'text': f"{definition_text}\n\n"}
+            async for event in self.ollama_analyzer.stream_intelligence_report(articles, query, max_length):
+                if event['type'] == 'done' and definition_text:
+                    event = dict(event, summary=f"{definition_text}\n\n{event['summary']}")
+                yield event
+            return
+        
+        loop = asyncio.get_running_loop()
+        summary = await loop.run_in_executor(None, self.generate_summary, articles, query, max_length)
+        yield {'type': 'done', 'summary': summary, 'cached': False}
+    
+    def _ollama_ready(self) -> bool:
+        return bool(self.ollama_analyzer and self.ollama_analyzer.is_service_available())
+    
+    async def _prepare_summary_article(self, article: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Extract fuller content for an article about to be summarized.
+        
+        Returns:
+            The article to summarize from, and the copy (with URL context) to send to the LLM
+        """
+        # Always try to generate actual content summaries, not just titles
+        content = article.get('content', '')
+        
+        # Detect generic/poor quality content early but don't give up immediately
+        content_is_generic = self._is_generic_content(content)
+        if content_is_generic:
+            print(f"Generic content detected (length: {len(content)}), will try harder extraction")
+        
+        # Force article extraction for short content or generic content
+        enhanced_article = article
+        should_extract = (
+            self.article_extractor and 
+            not article.get('metadata', {}).get('content_enhanced') and
+            (len(content) < 500 or content_is_generic)  # Increased threshold to 500 chars
+        )
+        
+        if should_extract:
+            try:
+                print(f"Attempting article extraction for better content (current: {len(content)} chars)")
+                enhanced_article = await self.enhance_single_article(article)
+                enhanced_content = enhanced_article.get('content', '')
+                
+                # Use enhanced content if it's better quality or longer
+                if len(enhanced_content) > len(content) and not self._is_generic_content(enhanced_content):
+                    content = enhanced_content
+                    article = enhanced_article  # Use the enhanced article for all processing
+                    print(f"Successfully enhanced article content: {len(content)} chars")
+                elif not self._is_generic_content(enhanced_content) and len(enhanced_content) > 20:  # Lowered threshold
+                    # Even if not longer, use it if it's higher quality
+                    content = enhanced_content
+                    article = enhanced_article
+                    print(f"Using enhanced content for better quality: {len(content)} chars")
+                else:
+                    print(f"Enhanced content not significantly better, keeping original")
+                    
+            except Exception as e:
+                print(f"Article enhancement failed: {e}")
+        
+        # Add URL info to help LLM understand context when content is poor
+        article_with_url = enhanced_article.copy()
+        if article.get('url') or article.get('link'):
+            url = article.get('url') or article.get('link', '')
+            article_with_url['url_context'] = self._extract_context_from_url(url)
+        return article, article_with_url
+    
+    def _degraded_article_summary(self, article: Dict[str, Any], max_length: int = 300) -> str:
+        """Extractive article summary used when the LLM is unavailable or its output is unusable."""
+        return self._degraded_article_summaries([article], max_length)[0]
+    
+    def _degraded_article_summaries(self, articles: List[Dict[str, Any]], max_length: int = 300) -> List[str]:
+        """
+        Extractive summaries for several articles in one batch (max_length in words).
+        
+        Articles whose content is generic site text or has no usable sentences
+        are described by their title.
+        """
+        usable = [i for i, article in enumerate(articles)
+                  if not self._is_generic_content(self._clean_html(article.get('content', '')))]
+        extracted = self.summarizer.summarize_batch([articles[i] for i in usable], max_words=max_length)
+        summaries = dict(zip(usable, extracted))
+        return [summaries.get(i) or self._title_summary(article, max_length) for i, article in enumerate(articles)]
+    
+    def _title_summary(self, article: Dict[str, Any], max_length: int) -> str:
+        """The article's title, cut at a word boundary when longer than max_length words."""
+        clean_title = self._clean_html(article.get('title', ''))
+        if not clean_title:
+            source = article.get('source', 'Unknown Source').title()
+            return f"Article from {source} - Content available for review"
+        words = clean_title.split()
+        if len(words) <= max_length:
+            return clean_title
+        return ' '.join(words[:max_length]) + "..."
+    
+    def _definition_text(self, query: str) -> str:
+        """Dictionary definition that prefixes a summary, or an empty string."""
+        if not DICTIONARY_AVAILABLE:
+            return ""
+        try:
+            definition_text = self._get_simple_definition(query)
+            if definition_text:
+                print(f"Dictionary definition found: {definition_text[:100]}...")
+            return definition_text
+        except Exception as e:
+            print(f"Dictionary lookup failed: {e}")
+            return ""
+    
     def _get_simple_definition(self, query: str) -> str:
         """Get a simple definition using the dictionary scraper."""
         try:
@@ -732,19 +845,8 @@ class FactrylEngine:
         
         import re
         
-        # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # Remove HTML entities
-        text = text.replace('&nbsp;', ' ')
-        text = text.replace('&amp;', '&')
-        text = text.replace('&lt;', '<')
-        text = text.replace('&gt;', '>')
-        text = text.replace('&quot;', '"')
-        text = text.replace('&#39;', "'")
-        
-        # Remove multiple spaces and newlines
-        text = re.sub(r'\s+', ' ', text)
+        # Tags, entities and whitespace only; URLs and addresses stay in displayed text
+        text = strip_html(text)
         
         # Remove source attribution patterns
         text = re.sub(r'\s*-\s*[A-Z][a-zA-Z\s]*$', '', text)
@@ -1031,71 +1133,28 @@ Generate the intelligence summary now:
             return self._generate_intelligent_summary(articles, query, max_length)
     
     def _generate_intelligent_summary(self, articles: List[Dict[str, Any]], query: str, max_length: int) -> str:
-        """Generate an intelligent summary using advanced analysis as fallback."""
+        """Generate an extractive summary across the top articles as fallback (max_length in characters)."""
         if not articles:
             return f"No recent developments found for '{query}'."
         
-        print(f"Generating intelligent fallback summary for '{query}' with {len(articles)} articles")
-        
-        # Extract clean titles and content
-        clean_titles = []
-        content_snippets = []
-        sources = set()
-        
-        for article in articles[:8]:  # Use top 8 articles
-            title = self._clean_html(article.get('title', ''))
-            content = self._clean_html(article.get('content', ''))
-            
-            if len(title) > 10 and not title.startswith('<'):
-                clean_titles.append(title)
-                sources.add(article.get('source', 'unknown'))
-                
-                if content and len(content) > 50:
-                    # Extract first meaningful sentence from content
-                    sentences = content.split('. ')
-                    for sentence in sentences[:2]:
-                        if len(sentence) > 30 and len(sentence) < 200:
-                            content_snippets.append(sentence.strip())
-                            break
-        
-        if not clean_titles:
-            return f"Limited information available about {query}."
+        print(f"Generating extractive fallback summary for '{query}' with {len(articles)} articles")
         
-        # Create a natural narrative summary
-        main_story = clean_titles[0]
+        # Sentences central to the result set and relevant to the query, skipping generic site text
+        usable = [article for article in articles[:8]
+                  if not self._is_generic_content(self._clean_html(article.get('content', '')))]
+        summary = self.summarizer.summarize_articles(usable, query, max_chars=max_length)
         
-        # Generate a natural summary based on the content
-        if content_snippets:
-            # Use actual content snippets to create a meaningful summary
-            primary_content = content_snippets[0]
-            
-            # Create a flowing narrative
-            if len(content_snippets) > 1:
-                secondary_content = content_snippets[1]
-                summary = f"{primary_content}. Additional reporting indicates {secondary_content.lower()}. Coverage from multiple sources suggests continued developments in this area."
-            else:
-                summary = f"{primary_content}. This development represents current activity and ongoing interest in {query.lower()}."
-        else:
-            # Fallback to title-based summary
-            if len(clean_titles) > 1:
-                summary = f"{main_story}. Related developments include coverage of similar topics across multiple sources, indicating ongoing interest and activity in {query.lower()}."
-            else:
-                summary = f"{main_story}. This development highlights current activity and interest surrounding {query.lower()}."
-        
-        # Clean up and limit length
-        summary = summary.replace('..', '.').strip()
-        if len(summary) > max_length:
-            # Truncate at sentence boundary if possible
-            sentences = summary.split('. ')
-            result = sentences[0]
-            for sentence in sentences[1:]:
-                if len(result + '. ' + sentence) <= max_length - 20:
-                    result += '. ' + sentence
-                else:
-                    break
-            summary = result + ('.' if not result.endswith('.') else '')
+        if not summary:
+            # No usable content: the leading headline is the best available summary
+            clean_titles = [title for title in (self._clean_html(article.get('title', '')) for article in articles[:8])
+                            if len(title) > 10]
+            if not clean_titles:
+                return f"Limited information available about {query}."
+            summary = clean_titles[0]
+            if len(summary) > max_length:
+                summary = summary[:max_length - 3].rsplit(' ', 1)[0] + "..."
         
-        print(f"Generated natural summary: '{summary[:100]}...'")
+        print(f"Generated extractive summary: '{summary[:100]}...'")
         return summary
     
     async def enhance_single_article(self, article: Dict[str, Any]) -> Dict[str, Any]:
@@ -0,0 +1,309 @@
+"""
+Incremental HTML parsing for byte-budgeted article fetches.
+Feeds response chunks into a streaming parser that stops as soon as it has
+the title, meta tags and enough paragraph text, instead of buffering the
+whole page and building a full BeautifulSoup tree.
+"""
+
+import codecs
+import logging
+import re
+from html.parser import HTMLParser
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+
+# Elements whose text never counts as article content
+SKIP_TAGS = {'script', 'style', 'nav', 'header', 'footer', 'aside', 'noscript', 'template', 'svg'}
+
+# Elements that never have a closing tag and must not be pushed on the stack
+VOID_TAGS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link',
+    'meta', 'param', 'source', 'track', 'wbr'
+}
+
+# Same containers the BeautifulSoup extractor used as content selectors
+CONTENT_TAGS = {'article', 'main'}
+CONTENT_CLASSES = {'article-content', 'post-content', 'entry-content', 'story-body', 'content'}
+CONTENT_IDS = {'main-content'}
+
+IMAGE_SKIP_WORDS = ('logo', 'icon', 'avatar', 'profile')
+
+
+class ArticleStreamParser(HTMLParser):
+    """Streaming HTML parser collecting title, meta tags, images and paragraphs."""
+
+    def __init__(self, target_chars: int = 3000, head_only: bool = False,
+                 max_images: int = 10, max_fallback_paragraphs: int = 10):
+        """
+        Initialize the parser.
+
+        Args:
+            target_chars: Paragraph text needed before parsing can stop early
+            head_only: Stop as soon as the document head has been parsed
+            max_images: Maximum number of in-body images to collect
+            max_fallback_paragraphs: Paragraphs used when no content container is found
+        """
+        super().__init__(convert_charrefs=True)
+        self.target_chars = target_chars
+        self.head_only = head_only
+        self.max_images = max_images
+        self.max_fallback_paragraphs = max_fallback_paragraphs
+
+        self.done = False
+        self.head_complete = False
+        self.title = ""
+        self.h1 = ""
+        self.meta: Dict[str, str] = {}
+        self.links: Dict[str, str] = {}
+        self.images: List[str] = []
+        self.content_paragraphs: List[str] = []
+        self.fallback_paragraphs: List[str] = []
+
+        self._stack: List[tuple] = []  # (tag, is_skip, is_content)
+        self._skip_depth = 0
+        self._content_depth = 0
+        self._seen_content_container = False
+        self._content_chars = 0
+        self._fallback_chars = 0
+        self._text_target: Optional[str] = None  # 'title', 'h1' or 'p'
+        self._text_buffer: List[str] = []
+
+    # ------------------------------------------------------------------
+    # HTMLParser callbacks
+    # ------------------------------------------------------------------
+
+    def handle_starttag(self, tag: str, attrs):
+        if self.done:
+            return
+
+        attributes = {name: (value or '') for name, value in attrs}
+
+        if tag == 'body':
+            self._finish_head()
+            return
+        if tag == 'meta':
+            self._handle_meta(attributes)
+            return
+        if tag == 'link':
+            self._handle_link(attributes)
+            return
+        if tag == 'img':
+            if not self._skip_depth:
+                self._handle_img(attributes)
+            return
+        if tag in VOID_TAGS:
+            return
+
+        if tag == 'p' and self._text_target == 'p':
+            # An opening <p> implicitly closes the previous paragraph
+            self._end_text()
+
+        is_skip = tag in SKIP_TAGS
+        is_content = self._is_content_container(tag, attributes)
+        self._stack.append((tag, is_skip, is_content))
+        if is_skip:
+            self._skip_depth += 1
+        if is_content:
+            self._content_depth += 1
+            self._seen_content_container = True
+
+        if self._text_target is None:
+            if tag == 'title' and not self.title:
+                self._start_text('title')
+            elif tag == 'h1' and not self.h1 and not self._skip_depth:
+                self._start_text('h1')
+            elif tag == 'p' and not self._skip_depth:
+                self._start_text('p')
+
+    def handle_startendtag(self, tag: str, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag: str):
+        if self.done:
+            return
+
+        if tag == 'head':
+            self._finish_head()
+            return
+
+        # Pop up to and including the matching open tag (tolerates unclosed children)
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index][0] == tag:
+                closed = self._stack[index:]
+                if any(open_tag == self._text_target for open_tag, _, _ in closed):
+                    self._end_text()
+                for _, is_skip, is_content in closed:
+                    if is_skip:
+                        self._skip_depth -= 1
+                    if is_content:
+                        self._content_depth -= 1
+                del self._stack[index:]
+                break
+
+        self._check_done()
+
+    def handle_data(self, data: str):
+        if self.done or self._text_target is None:
+            return
+        if self._text_target != 'title' and self._skip_depth:
+            return
+        self._text_buffer.append(data)
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    @property
+    def best_title(self) -> str:
+        """Prefer the first body <h1>, like the BeautifulSoup extractor did."""
+        return self.h1 or self.title
+
+    @property
+    def content(self) -> str:
+        """Paragraph text from content containers, falling back to the first paragraphs."""
+        paragraphs = self.content_paragraphs or self.fallback_paragraphs[:self.max_fallback_paragraphs]
+        return ' '.join(paragraphs)
+
+    def meta_content(self, *keys: str) -> str:
+        """Return the first non-empty meta value for the given name/property keys."""
+        for key in keys:
+            value = self.meta.get(key)
+            if value:
+                return value
+        return ""
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _finish_head(self):
+        if not self.head_complete:
+            self.head_complete = True
+            self._check_done()
+
+    def _handle_meta(self, attributes: Dict[str, str]):
+        key = (attributes.get('property') or attributes.get('name') or '').strip().lower()
+        value = attributes.get('content', '').strip()
+        if key and value and key not in self.meta:
+            self.meta[key] = value
+
+    def _handle_link(self, attributes: Dict[str, str]):
+        rel = attributes.get('rel', '').strip().lower()
+        href = attributes.get('href', '').strip()
+        if not rel or not href:
+            return
+        if rel == 'canonical':
+            self.links.setdefault('canonical', href)
+        elif rel in ('icon', 'shortcut icon', 'apple-touch-icon'):
+            self.links.setdefault('icon', href)
+
+    def _handle_img(self, attributes: Dict[str, str]):
+        if len(self.images) >= self.max_images:
+            return
+        src = attributes.get('src') or attributes.get('data-src')  # Handle lazy loading
+        if not src or src in self.images:
+            return
+
+        # Filter out small/icon images
+        width = attributes.get('width')
+        height = attributes.get('height')
+        if width and height:
+            try:
+                if int(width) < 100 or int(height) < 100:
+                    return
+            except ValueError:
+                pass
+
+        alt_text = attributes.get('alt', '').lower()
+        if any(skip_word in alt_text for skip_word in IMAGE_SKIP_WORDS):
+            return
+
+        self.images.append(src)
+
+    def _is_content_container(self, tag: str, attributes: Dict[str, str]) -> bool:
+        if tag in CONTENT_TAGS:
+            return True
+        classes = set(attributes.get('class', '').split())
+        if classes & CONTENT_CLASSES:
+            return True
+        return attributes.get('id', '') in CONTENT_IDS
+
+    def _start_text(self, target: str):
+        self._text_target = target
+        self._text_buffer = []
+
+    def _end_text(self):
+        text = re.sub(r'\s+', ' ', ''.join(self._text_buffer)).strip()
+        target = self._text_target
+        self._text_target = None
+        self._text_buffer = []
+        if not text:
+            return
+
+        if target == 'title':
+            self.title = text
+        elif target == 'h1':
+            self.h1 = text
+        elif target == 'p':
+            if self._content_depth:
+                self.content_paragraphs.append(text)
+                self._content_chars += len(text) + 1
+            if len(self.fallback_paragraphs) < self.max_fallback_paragraphs:
+                self.fallback_paragraphs.append(text)
+                self._fallback_chars += len(text) + 1
+
+    def _check_done(self):
+        if not self.head_complete:
+            return
+        if self.head_only:
+            self.done = True
+        elif self._content_chars >= self.target_chars:
+            self.done = True
+        elif (not self._seen_content_container and
+              len(self.fallback_paragraphs) >= self.max_fallback_paragraphs and
+              self._fallback_chars >= self.target_chars):
+            # No article container so far and the fallback budget is already full
+            self.done = True
+
+
+def is_html_response(response) -> bool:
+    """Check whether an aiohttp response declares an HTML body (missing header is allowed)."""
+    if 'Content-Type' not in response.headers:
+        return True
+    return response.content_type in HTML_CONTENT_TYPES
+
+
+async def feed_response(response, parser: ArticleStreamParser, max_bytes: int,
+                        chunk_size: int = 16384) -> int:
+    """
+    Stream an aiohttp response body into the parser until it is done or the
+    byte budget is spent.
+
+    Returns:
+        Number of body bytes read
+    """
+    charset = response.charset or 'utf-8'
+    try:
+        decoder = codecs.getincrementaldecoder(charset)(errors='replace')
+    except LookupError:
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+    bytes_read = 0
+    async for chunk in response.content.iter_chunked(chunk_size):
+        bytes_read += len(chunk)
+        parser.feed(decoder.decode(chunk))
+        if parser.done:
+            break
+        if bytes_read >= max_bytes:
+            logger.debug(f"Byte budget of {max_bytes} reached for {response.url}")
+            break
+    else:
+        parser.feed(decoder.decode(b'', final=True))
+
+    parser.close()
+    return bytes_read
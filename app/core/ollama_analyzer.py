@@ -3,36 +3,85 @@ Ollama LLM Analyzer for Factryl
 Provides real LLM integration for article summarization using Ollama + Llama 3.1
 """
 
+import asyncio
 import ollama
 import logging
 import json
 import time
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, AsyncIterator, Optional, Tuple
 from datetime import datetime
 
+from .context_packer import ContextPacker
+from .extractive_summarizer import ExtractiveSummarizer
+from .ollama_client import OllamaClient
+from .ollama_health import OllamaHealthProber, has_model, model_names
+from .summary_cache import SummaryCache
+
 logger = logging.getLogger(__name__)
 
+# Bump when a prompt template changes so cached summaries generated from the old one are not served
+ARTICLE_PROMPT_VERSION = 2
+BATCH_PROMPT_VERSION = 1
+REPORT_PROMPT_VERSION = 2
+
+# Reports are told to open with this phrase; validation checks for it
+REPORT_OPENING = "Current developments regarding"
+
 class OllamaAnalyzer:
     """LLM analyzer using Ollama for intelligent article summarization."""
     
-    def __init__(self, model_name: str = "llama3.1", base_url: str = None):
-        """Initialize the Ollama analyzer with specified model."""
+    def __init__(self, model_name: str = "llama3.1", base_url: str = None, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the Ollama analyzer with specified model.
+        
+        Args:
+            model_name: Ollama model to generate with
+            base_url: Ollama server URL (library default when None)
+            config: Client settings (max_concurrency, max_queue, timeout, queue_timeout, keep_alive),
+                batching settings (batch_size, batch_content_chars, batch_token_budget,
+                min_tokens_per_second), health probing settings
+                (health_interval, preload), and 'summary_cache', 'context' and 'summarizer' sections
+        """
         self.model_name = model_name
         self.base_url = base_url
-        self.client = None
-        self.is_available = False
+        self.config = config or {}
+        # All generations share one bounded, non-blocking client
+        self.client = OllamaClient(base_url, self.config)
+        # Generated summaries and reports persist on disk, shared by all workers
+        self.summary_cache = SummaryCache(self.config.get('summary_cache', {}))
+        # Tile summaries are requested several articles per prompt, fewer as summaries get longer
+        self.batch_size = self.config.get('batch_size', 5)
+        self.batch_content_chars = self.config.get('batch_content_chars', 1200)
+        self.batch_token_budget = self.config.get('batch_token_budget', 1600)
+        # Slowest generation rate a batch is given time for (tokens per second)
+        self.min_tokens_per_second = self.config.get('min_tokens_per_second', 10)
+        # Report prompts carry the most relevant, non-redundant sentences within a token budget
+        self.context_packer = ContextPacker(self.config.get('context', {}))
+        # Long articles are compressed to their central sentences rather than cut off; also the fallback summarizer
+        self.summarizer = ExtractiveSummarizer(self.config.get('summarizer', {}))
+        # Availability is kept current by a background prober rather than decided once
+        self.health = OllamaHealthProber(model_name, base_url, self.config)
         
         # Initialize connection
         self._initialize_connection()
+        self.health.start()
+    
+    @property
+    def is_available(self) -> bool:
+        """Availability as of the last health probe."""
+        return self.health.available
+    
+    @is_available.setter
+    def is_available(self, available: bool):
+        self.health.set_available(available)
     
     def _initialize_connection(self):
         """Initialize connection to Ollama service."""
         try:
             # Check if Ollama is running and model is available
-            models = ollama.list()
-            available_models = [model['name'] for model in models['models']]
+            available_models = model_names(ollama.list())
             
-            if self.model_name in available_models:
+            if has_model(available_models, self.model_name):
                 self.is_available = True
                 logger.info(f"Ollama connection established with model: {self.model_name}")
             else:
@@ -52,7 +101,7 @@ class OllamaAnalyzer:
             self.is_available = False
     
     def is_service_available(self) -> bool:
-        """Check if Ollama service is available."""
+        """Check if Ollama service is available (cached; refreshed in the background)."""
         return self.is_available
     
     def generate_article_summary(self, article: Dict[str, Any], max_words: int = 300) -> str:
@@ -66,29 +115,279 @@ class OllamaAnalyzer:
         Returns:
             A concise, engaging summary highlighting key information
         """
+        cache_key = self.summary_cache.article_key(article, ARTICLE_PROMPT_VERSION, self.model_name, max_words)
+        cached = self.summary_cache.get(cache_key)
+        if cached:
+            return cached
+        
         if not self.is_available:
             return self._fallback_summary(article, max_words)
         
         try:
-            title = article.get('title', '').strip()
-            content = article.get('content', '').strip()
-            source = article.get('source', 'Unknown').title()
-            url_context = article.get('url_context', '')
-            
-            # Debug logging to see what content we're working with
-            logger.info(f"Article summary request - Title: {title[:100]}...")
-            logger.info(f"Article summary request - Content length: {len(content)} chars")
-            logger.info(f"Article summary request - Content preview: {content[:200]}...")
-            logger.info(f"Article summary request - Source: {source}")
-            
-            # Create comprehensive article analysis prompt
-            prompt = f"""
+            response = self.client.chat_sync(
+                self.model_name, self._article_messages(article, max_words), self._article_options(max_words)
+            )
+            return self._finish_article_summary(article, response['message']['content'], max_words, cache_key)
+        except Exception as e:
+            logger.error(f"LLM summary generation failed: {e}")
+            return self._fallback_summary(article, max_words)
+    
+    async def generate_article_summary_async(self, article: Dict[str, Any], max_words: int = 300) -> str:
+        """
+        Async variant of generate_article_summary; waits for the Ollama client without blocking the loop.
+        
+        Args:
+            article: Article data containing title, content, source, etc.
+            max_words: Maximum words for the summary
+        
+        Returns:
+            A concise, engaging summary highlighting key information
+        """
+        cache_key = self.summary_cache.article_key(article, ARTICLE_PROMPT_VERSION, self.model_name, max_words)
+        cached = await asyncio.to_thread(self.summary_cache.get, cache_key)
+        if cached:
+            return cached
+        
+        if not self.is_available:
+            return self._fallback_summary(article, max_words)
+        
+        try:
+            response = await self.client.chat(
+                self.model_name, self._article_messages(article, max_words), self._article_options(max_words)
+            )
+            return await asyncio.to_thread(
+                self._finish_article_summary, article, response['message']['content'], max_words, cache_key
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"LLM summary generation failed: {e}")
+            return self._fallback_summary(article, max_words)
+    
+    async def stream_article_summary(self, article: Dict[str, Any], max_words: int = 300) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streaming variant of generate_article_summary.
+        
+        Args:
+            article: Article data containing title, content, source, etc.
+            max_words: Maximum words for the summary
+        
+        Yields:
+            {'type': 'token', 'text': ...} events as the model produces them, then one
+            {'type': 'done', 'summary': ...} event with the cleaned (or fallback) summary
+        """
+        cache_key = self.summary_cache.article_key(article, ARTICLE_PROMPT_VERSION, self.model_name, max_words)
+        cached = await asyncio.to_thread(self.summary_cache.get, cache_key)
+        if cached:
+            yield {'type': 'done', 'summary': cached, 'cached': True}
+            return
+        
+        if not self.is_available:
+            yield {'type': 'done', 'summary': self._fallback_summary(article, max_words), 'cached': False}
+            return
+        
+        parts = []
+        try:
+            async for text in self.client.stream_chat(
+                self.model_name, self._article_messages(article, max_words), self._article_options(max_words)
+            ):
+                parts.append(text)
+                yield {'type': 'token', 'text': text}
+            summary = await asyncio.to_thread(
+                self._finish_article_summary, article, ''.join(parts), max_words, cache_key
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"LLM summary streaming failed: {e}")
+            summary = self._fallback_summary(article, max_words)
+        yield {'type': 'done', 'summary': summary, 'cached': False}
+    
+    async def generate_article_summaries_async(self, articles: List[Dict[str, Any]], max_words: int = 120) -> List[str]:
+        """
+        Summarize several articles with one prompt per batch instead of one per article.
+        
+        Batches ask for structured JSON output; every summary is parsed and validated,
+        and articles whose summary is missing or unusable fall back to individual calls.
+        A cached single-article summary is served when there is one; batch output is
+        cached under its own prompt template's keys.
+        
+        Args:
+            articles: Article data containing title, content, source, etc.
+            max_words: Maximum words per summary
+        
+        Returns:
+            One summary per article, in order
+        """
+        keys = [self.summary_cache.article_key(article, BATCH_PROMPT_VERSION, self.model_name, max_words, kind='batch')
+                for article in articles]
+        single_keys = [self.summary_cache.article_key(article, ARTICLE_PROMPT_VERSION, self.model_name, max_words)
+                       for article in articles]
+        summaries: List[Optional[str]] = await asyncio.to_thread(lambda: [
+            self.summary_cache.get(single_key) or self.summary_cache.get(key)
+            for single_key, key in zip(single_keys, keys)
+        ])
+        pending = [i for i, summary in enumerate(summaries) if not summary]
+        
+        if not self.is_available:
+            for i in pending:
+                summaries[i] = self._fallback_summary(articles[i], max_words)
+            return summaries
+        
+        size = self._effective_batch_size(max_words)
+        batches = [pending[start:start + size] for start in range(0, len(pending), size)]
+        results = await asyncio.gather(
+            *(self._summarize_batch([articles[i] for i in batch], max_words) for batch in batches),
+            return_exceptions=True
+        )
+        
+        retry = []
+        fresh = []
+        for batch, result in zip(batches, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Batched summary request failed, summarizing {len(batch)} articles individually: {result}")
+                result = [None] * len(batch)
+            for i, summary in zip(batch, result):
+                if summary:
+                    summaries[i] = summary
+                    fresh.append(i)
+                else:
+                    retry.append(i)
+        if fresh:
+            await asyncio.to_thread(self._cache_batch_summaries, [(keys[i], summaries[i]) for i in fresh])
+        
+        if retry:
+            logger.info(f"Summarizing {len(retry)} articles individually after batch parsing")
+            individual = await asyncio.gather(
+                *(self.generate_article_summary_async(articles[i], max_words) for i in retry)
+            )
+            for i, summary in zip(retry, individual):
+                summaries[i] = summary
+        return summaries
+    
+    def _cache_batch_summaries(self, entries: List[Tuple[str, str]]):
+        """Store batch summaries under the batch template's keys (file I/O; run off the event loop)."""
+        for key, summary in entries:
+            self.summary_cache.put(key, summary, {'model': self.model_name, 'kind': 'batch'})
+    
+    def _effective_batch_size(self, max_words: int) -> int:
+        """Articles per batch prompt, so that one batch's output stays within the token budget."""
+        per_article = self._batch_options(1, max_words)['num_predict']
+        return max(1, min(self.batch_size, self.batch_token_budget // per_article))
+    
+    async def _summarize_batch(self, articles: List[Dict[str, Any]], max_words: int) -> List[Optional[str]]:
+        """One structured-output request for a batch; None for each article without a valid summary."""
+        if len(articles) == 1:
+            return [None]  # Nothing to amortize; the individual prompt does better
+        options = self._batch_options(len(articles), max_words)
+        response = await self.client.chat(
+            self.model_name,
+            self._batch_messages(articles, max_words),
+            options,
+            # Longer batches get proportionally longer, never less than a single request
+            timeout=max(self.client.timeout, options['num_predict'] / self.min_tokens_per_second),
+            format='json'
+        )
+        return self._parse_batch_summaries(response['message']['content'], len(articles), max_words)
+    
+    def _batch_messages(self, articles: List[Dict[str, Any]], max_words: int) -> List[Dict[str, str]]:
+        """Build the chat messages for a batch of tile summaries."""
+        sections = []
+        for i, article in enumerate(articles, 1):
+            lines = [
+                f"[{i}] Title: {article.get('title', '').strip()}",
+                f"Source: {article.get('source', 'Unknown').title()}"
+            ]
+            if article.get('url_context'):
+                lines.append(f"URL Context: {article['url_context']}")
+            content = self.summarizer.compress(article.get('content', '').strip(), self.batch_content_chars)
+            lines.append(f"Content: {content}")
+            sections.append('\n'.join(lines))
+        articles_text = '\n\n'.join(sections)
+        
+        prompt = f"""
+You are an expert news analyst. Summarize each of the {len(articles)} numbered articles below independently in at most {max_words} words.
+
+For each article:
+- State the main event and the key people, organizations, numbers, dates and locations
+- Use only facts from that article; never mix details between articles
+- Ignore generic website text (navigation, cookie notices, merchandise links); if the content is only generic text, summarize what the title reports
+
+ARTICLES:
+{articles_text}
+
+Respond with JSON only, in exactly this form, with one entry per article:
+{{"summaries": [{{"id": 1, "summary": "..."}}, {{"id": 2, "summary": "..."}}]}}
+"""
+        
+        return [{
+            'role': 'user',
+            'content': prompt
+        }]
+    
+    def _batch_options(self, count: int, max_words: int) -> Dict[str, Any]:
+        """Generation options for a batch of summaries."""
+        return {
+            'temperature': 0.3,
+            'top_p': 0.9,
+            'num_predict': count * (max_words * 2 + 20)  # Per-article buffer plus JSON framing
+        }
+    
+    def _parse_batch_summaries(self, raw: str, count: int, max_words: int) -> List[Optional[str]]:
+        """
+        Parse and validate a structured batch response.
+        
+        Returns:
+            Cleaned summary per article id (1..count), None where missing or unusable
+        """
+        summaries: List[Optional[str]] = [None] * count
+        try:
+            text = raw.strip()
+            start, end = text.find('{'), text.rfind('}')
+            data = json.loads(text[start:end + 1] if start >= 0 and end > start else text)
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Could not parse batched summaries: {e}")
+            return summaries
+        
+        entries = data.get('summaries', []) if isinstance(data, dict) else data
+        if not isinstance(entries, list):
+            return summaries
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                index = int(entry.get('id')) - 1
+            except (TypeError, ValueError):
+                continue
+            summary = entry.get('summary')
+            if not 0 <= index < count or summaries[index] is not None or not isinstance(summary, str):
+                continue
+            summary = self._clean_summary(summary.strip(), max_words)
+            if len(summary) > 10:
+                summaries[index] = summary
+        return summaries
+    
+    def _article_messages(self, article: Dict[str, Any], max_words: int) -> List[Dict[str, str]]:
+        """Build the chat messages for a single-article summary."""
+        title = article.get('title', '').strip()
+        content = article.get('content', '').strip()
+        source = article.get('source', 'Unknown').title()
+        url_context = article.get('url_context', '')
+        
+        # Debug logging to see what content we're working with
+        logger.info(f"Article summary request - Title: {title[:100]}...")
+        logger.info(f"Article summary request - Content length: {len(content)} chars")
+        logger.info(f"Article summary request - Content preview: {content[:200]}...")
+        logger.info(f"Article summary request - Source: {source}")
+        
+        # Create comprehensive article analysis prompt
+        prompt = f"""
 You are an expert news analyst creating a comprehensive summary that captures ALL the key points from an article. Your goal is to extract every important detail and present a complete picture of the story.
 
 ARTICLE DATA:
 Title: {title}
 Source: {source}
-Content: {content[:3000]}
+Content: {self.summarizer.compress(content, 3000)}
 {f"URL Context: {url_context}" if url_context else ""}
 
 YOUR MISSION:
@@ -134,33 +433,34 @@ CRITICAL INSTRUCTIONS:
 Write your comprehensive news summary covering all key points:
 """
 
-            response = ollama.chat(
-                model=self.model_name,
-                messages=[{
-                    'role': 'user',
-                    'content': prompt
-                }],
-                options={
-                    'temperature': 0.3,  # More focused, less creative
-                    'top_p': 0.9,
-                    'num_predict': max_words * 2  # Give some buffer for word count
-                }
-            )
-            
-            summary = response['message']['content'].strip()
-            
-            # Clean and validate summary
-            summary = self._clean_summary(summary, max_words)
-            
-            if len(summary) > 10:  # Much more lenient validation - just check if we have content
-                logger.info(f"Generated LLM summary: {summary[:50]}...")
-                return summary
-            else:
-                logger.warning(f"LLM summary too short, using fallback")
-                return self._fallback_summary(article, max_words)
-                
-        except Exception as e:
-            logger.error(f"LLM summary generation failed: {e}")
+        return [{
+            'role': 'user',
+            'content': prompt
+        }]
+    
+    def _article_options(self, max_words: int) -> Dict[str, Any]:
+        """Generation options for article summaries."""
+        return {
+            'temperature': 0.3,  # More focused, less creative
+            'top_p': 0.9,
+            'num_predict': max_words * 2  # Give some buffer for word count
+        }
+    
+    def _finish_article_summary(self, article: Dict[str, Any], raw_summary: str, max_words: int,
+                                cache_key: Optional[str] = None) -> str:
+        """Clean and validate a generated article summary (caching it), falling back when it is unusable."""
+        summary = raw_summary.strip()
+        
+        # Clean and validate summary
+        summary = self._clean_summary(summary, max_words)
+        
+        if len(summary) > 10:  # Much more lenient validation - just check if we have content
+            logger.info(f"Generated LLM summary: {summary[:50]}...")
+            if cache_key:
+                self.summary_cache.put(cache_key, summary, {'model': self.model_name, 'kind': 'article'})
+            return summary
+        else:
+            logger.warning(f"LLM summary too short, using fallback")
             return self._fallback_summary(article, max_words)
     
     def generate_intelligence_report(self, articles: List[Dict[str, Any]], query: str, max_words: int = 280) -> str:
@@ -175,28 +475,113 @@ Write your comprehensive news summary covering all key points:
         Returns:
             Comprehensive intelligence analysis
         """
+        cache_key = self.summary_cache.report_key(articles, query, REPORT_PROMPT_VERSION, self.model_name, max_words)
+        cached = self.summary_cache.get(cache_key)
+        if cached:
+            return cached
+        
         if not self.is_available:
             return self._fallback_intelligence_report(articles, query, max_words)
         
         try:
-            # Prepare article data for analysis
-            article_summaries = []
-            sources = set()
-            
-            for i, article in enumerate(articles[:10], 1):
-                title = article.get('title', '').strip()
-                content = article.get('content', '').strip()
-                source = article.get('source', 'Unknown')
-                sources.add(source)
-                
-                article_summaries.append(f"""
-Article {i} ({source}):
-Title: {title}
-Content: {content[:300]}...
-""")
-            
-            # Create enhanced news analysis prompt
-            prompt = f"""
+            response = self.client.chat_sync(
+                self.model_name, self._report_messages(articles, query, max_words), self._report_options(max_words)
+            )
+            return self._finish_intelligence_report(articles, query, response['message']['content'], max_words, cache_key)
+        except Exception as e:
+            logger.error(f"Intelligence report generation failed: {e}")
+            return self._fallback_intelligence_report(articles, query, max_words)
+    
+    async def generate_intelligence_report_async(self, articles: List[Dict[str, Any]], query: str,
+                                                 max_words: int = 280) -> str:
+        """
+        Async variant of generate_intelligence_report; waits for the Ollama client without blocking the loop.
+        
+        Args:
+            articles: List of article data
+            query: Search query/topic
+            max_words: Maximum words for the report
+        
+        Returns:
+            Comprehensive intelligence analysis
+        """
+        cache_key = self.summary_cache.report_key(articles, query, REPORT_PROMPT_VERSION, self.model_name, max_words)
+        cached = await asyncio.to_thread(self.summary_cache.get, cache_key)
+        if cached:
+            return cached
+        
+        if not self.is_available:
+            return self._fallback_intelligence_report(articles, query, max_words)
+        
+        try:
+            response = await self.client.chat(
+                self.model_name, self._report_messages(articles, query, max_words), self._report_options(max_words)
+            )
+            return await asyncio.to_thread(
+                self._finish_intelligence_report, articles, query, response['message']['content'], max_words, cache_key
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Intelligence report generation failed: {e}")
+            return self._fallback_intelligence_report(articles, query, max_words)
+    
+    async def stream_intelligence_report(self, articles: List[Dict[str, Any]], query: str,
+                                         max_words: int = 280) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streaming variant of generate_intelligence_report.
+        
+        Args:
+            articles: List of article data
+            query: Search query/topic
+            max_words: Maximum words for the report
+        
+        Yields:
+            {'type': 'token', 'text': ...} events as the model produces them, then one
+            {'type': 'done', 'summary': ...} event with the cleaned (or fallback) report
+        """
+        cache_key = self.summary_cache.report_key(articles, query, REPORT_PROMPT_VERSION, self.model_name, max_words)
+        cached = await asyncio.to_thread(self.summary_cache.get, cache_key)
+        if cached:
+            yield {'type': 'done', 'summary': cached, 'cached': True}
+            return
+        
+        if not self.is_available:
+            yield {'type': 'done', 'summary': self._fallback_intelligence_report(articles, query, max_words), 'cached': False}
+            return
+        
+        parts = []
+        try:
+            async for text in self.client.stream_chat(
+                self.model_name, self._report_messages(articles, query, max_words), self._report_options(max_words)
+            ):
+                parts.append(text)
+                yield {'type': 'token', 'text': text}
+            report = await asyncio.to_thread(
+                self._finish_intelligence_report, articles, query, ''.join(parts), max_words, cache_key
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Intelligence report streaming failed: {e}")
+            report = self._fallback_intelligence_report(articles, query, max_words)
+        yield {'type': 'done', 'summary': report, 'cached': False}
+    
+    def _report_messages(self, articles: List[Dict[str, Any]], query: str, max_words: int) -> List[Dict[str, str]]:
+        """Build the chat messages for a multi-article intelligence report."""
+        # Prepare article data for analysis: relevant sentences across all articles, duplicates removed
+        article_summaries = []
+        
+        for i, packed in enumerate(self.context_packer.pack(articles, query), 1):
+            title = packed.article.get('title', '').strip()
+            source = packed.article.get('source', 'Unknown')
+            lines = [f"Article {i} ({source}):", f"Title: {title}"]
+            if packed.sentences:
+                lines.append(f"Content: {' '.join(packed.sentences)}")
+            article_summaries.append('\n' + '\n'.join(lines) + '\n')
+        
+        # Create enhanced news analysis prompt
+        prompt = f"""
 You are a senior journalist and news analyst creating a comprehensive overview of current developments regarding: "{query}"
 
 AVAILABLE SOURCES:
@@ -229,38 +614,40 @@ CREDIBILITY STANDARDS:
 - Avoid speculation beyond what sources reasonably suggest
 - Don't manufacture quotes or specific details not in sources
 
-Begin your analysis with: "Current developments regarding {query}..."
+Begin your analysis with: "{REPORT_OPENING} {query}..."
 
 Write your comprehensive {max_words}-word news analysis:
 """
 
-            response = ollama.chat(
-                model=self.model_name,
-                messages=[{
-                    'role': 'user',
-                    'content': prompt
-                }],
-                options={
-                    'temperature': 0.2,  # Very focused for intelligence reports
-                    'top_p': 0.85,
-                    'num_predict': max_words * 2
-                }
-            )
-            
-            report = response['message']['content'].strip()
-            
-            # Clean and validate report
-            report = self._clean_summary(report, max_words)
-            
-            if len(report) > 100 and "Intelligence Analysis:" in report:
-                logger.info(f"Generated intelligence report: {len(report)} chars")
-                return report
-            else:
-                logger.warning("Intelligence report failed validation, using fallback")
-                return self._fallback_intelligence_report(articles, query, max_words)
-                
-        except Exception as e:
-            logger.error(f"Intelligence report generation failed: {e}")
+        return [{
+            'role': 'user',
+            'content': prompt
+        }]
+    
+    def _report_options(self, max_words: int) -> Dict[str, Any]:
+        """Generation options for intelligence reports."""
+        return {
+            'temperature': 0.2,  # Very focused for intelligence reports
+            'top_p': 0.85,
+            'num_predict': max_words * 2
+        }
+    
+    def _finish_intelligence_report(self, articles: List[Dict[str, Any]], query: str, raw_report: str,
+                                    max_words: int, cache_key: Optional[str] = None) -> str:
+        """Clean and validate a generated report (caching it), falling back when it is unusable."""
+        report = raw_report.strip()
+        
+        # Clean and validate report
+        report = self._clean_summary(report, max_words)
+        
+        # The opening the prompt asks for, allowing for a short preamble before it
+        if len(report) > 100 and REPORT_OPENING.lower() in report[:200].lower():
+            logger.info(f"Generated intelligence report: {len(report)} chars")
+            if cache_key:
+                self.summary_cache.put(cache_key, report, {'model': self.model_name, 'kind': 'report', 'query': query})
+            return report
+        else:
+            logger.warning("Intelligence report failed validation, using fallback")
             return self._fallback_intelligence_report(articles, query, max_words)
     
     def _clean_summary(self, summary: str, max_words: int) -> str:
@@ -289,6 +676,11 @@ Write your comprehensive {max_words}-word news analysis:
         content = article.get('content', '').strip()
         source = article.get('source', 'Unknown').title()
         
+        # Extractive summary of the content when it has usable sentences
+        summary = self.summarizer.summarize(article, max_words=max_words) if content else ''
+        if summary:
+            return summary
+        
         if not title:
             return "Article content available for review."
         
@@ -326,40 +718,41 @@ Write your comprehensive {max_words}-word news analysis:
         sources = set(article.get('source', 'unknown') for article in articles)
         main_title = articles[0].get('title', '') if articles else ''
         
+        # Prefer what the sources actually say: sentences central to the set and relevant to the query
+        extract = self.summarizer.summarize_articles(articles, query, max_chars=max_words * 6)
+        if extract:
+            return f"Intelligence Analysis: {query}. Current reporting from {len(sources)} sources: {extract}"
+        
         return f"Intelligence Analysis: {query}. Current reporting from {len(sources)} sources indicates ongoing developments. {main_title.rstrip('.')} represents recent activity in this area. Analysis of available sources suggests continued interest and activity surrounding {query}. Further monitoring recommended as situation develops."
     
-    def health_check(self) -> Dict[str, Any]:
-        """Perform health check on Ollama service."""
+    def health_check(self, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Report Ollama health from the background prober's cached status.
+        
+        Args:
+            refresh: Also start a background probe; the cached status is returned without waiting for it
+        
+        Returns:
+            Status, model, probe latency, whether the model is loaded, the age of
+            the status in seconds and the client's queue metrics
+        """
         try:
-            if not self.is_available:
-                return {
-                    'status': 'unavailable',
-                    'model': self.model_name,
-                    'error': 'Service not initialized'
-                }
-            
-            # Test with simple query
-            start_time = time.time()
-            response = ollama.chat(
-                model=self.model_name,
-                messages=[{
-                    'role': 'user', 
-                    'content': 'Test response. Reply with: OK'
-                }],
-                options={'temperature': 0.1}
-            )
-            response_time = time.time() - start_time
-            
+            if refresh:
+                self.health.refresh()
+            health = self.health.status()
             return {
-                'status': 'healthy',
+                'status': health['status'],
                 'model': self.model_name,
-                'response_time': round(response_time, 2),
-                'test_response': response['message']['content'][:50]
+                'response_time': health['latency'],
+                'loaded': health['loaded'],
+                'age': health['age'],
+                'error': health['error'],
+                'queue': self.client.metrics()
             }
-            
         except Exception as e:
             return {
                 'status': 'error',
                 'model': self.model_name,
-                'error': str(e)
-            } 
\ No newline at end of file
+                'error': str(e),
+                'queue': self.client.metrics()
+            }
@@ -0,0 +1,254 @@
+"""
+Bounded, non-blocking client for the local Ollama server.
+
+Every generation goes through one asyncio client running on a dedicated
+event-loop thread, so async callers never block their own loop, synchronous
+callers (Flask handlers) can use the same client, and one concurrency limit
+protects the Ollama server from all of them. Requests beyond the concurrency
+limit wait in a bounded queue; when the queue is full they are rejected at
+once so the caller can fall back instead of piling up. Streamed generations
+hold their slot until the last token, and hand tokens to the caller's loop as
+they arrive.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Dict, Any, AsyncIterator, Awaitable, Callable, List, Optional
+
+import ollama
+
+logger = logging.getLogger(__name__)
+
+
+class OllamaBusyError(RuntimeError):
+    """Raised when the request queue is full or a request waited too long for a slot."""
+
+
+class OllamaClient:
+    """Async Ollama chat client with a concurrency limit, a bounded queue, timeouts and metrics."""
+
+    def __init__(self, host: Optional[str] = None, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the client; its event-loop thread starts on first use.
+
+        Args:
+            host: Ollama server URL (library default when None)
+            config: Client settings (max_concurrency, max_queue, timeout,
+                queue_timeout, in seconds; keep_alive, how long Ollama keeps the
+                model loaded after a request)
+        """
+        self.host = host
+        self.config = config or {}
+        self.max_concurrency = self.config.get('max_concurrency', 2)
+        self.max_queue = self.config.get('max_queue', 16)
+        self.timeout = self.config.get('timeout', 120.0)
+        self.queue_timeout = self.config.get('queue_timeout', 30.0)
+        self.keep_alive = self.config.get('keep_alive', '30m')
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client: Optional[ollama.AsyncClient] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._start_lock = threading.Lock()
+
+        self._waiting = 0
+        self._in_flight = 0
+        self._stats = {
+            'completed': 0,
+            'failed': 0,
+            'timeouts': 0,
+            'cancelled': 0,
+            'rejected': 0,
+            'total_wait': 0.0,
+            'max_wait': 0.0,
+            'last_wait': 0.0,
+            'total_duration': 0.0
+        }
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the client's event-loop thread once."""
+        if self._loop is not None:
+            return self._loop
+        with self._start_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name='ollama-client-loop', daemon=True).start()
+                self._loop = loop
+        return self._loop
+
+    async def _acquire_slot(self):
+        """Wait in the bounded queue for a generation slot."""
+        if self._client is None:
+            self._client = ollama.AsyncClient(host=self.host)
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+
+        if not self._slots.locked():
+            # A slot is free and nobody is queued: take it without waiting
+            await self._slots.acquire()
+            self._stats['last_wait'] = 0.0
+            self._in_flight += 1
+            return
+
+        if self._waiting >= self.max_queue:
+            self._stats['rejected'] += 1
+            raise OllamaBusyError(f"Ollama queue is full ({self._waiting} waiting)")
+
+        self._waiting += 1
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._stats['rejected'] += 1
+            raise OllamaBusyError(f"No Ollama slot free within {self.queue_timeout}s")
+        finally:
+            self._waiting -= 1
+            waited = time.perf_counter() - start
+            self._stats['last_wait'] = waited
+            self._stats['total_wait'] += waited
+            self._stats['max_wait'] = max(self._stats['max_wait'], waited)
+        self._in_flight += 1
+
+    def _release_slot(self):
+        self._in_flight -= 1
+        self._slots.release()
+
+    async def _generate(self, request: Callable[[], Awaitable[Any]], timeout: Optional[float]) -> Any:
+        """Runs on the client loop: queue for a slot, then run the request under the timeout."""
+        await self._acquire_slot()
+        start = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(request(), timeout or self.timeout)
+            self._stats['completed'] += 1
+            return result
+        except asyncio.TimeoutError:
+            self._stats['timeouts'] += 1
+            raise
+        except asyncio.CancelledError:
+            self._stats['cancelled'] += 1
+            raise
+        except Exception:
+            self._stats['failed'] += 1
+            raise
+        finally:
+            self._stats['total_duration'] += time.perf_counter() - start
+            self._release_slot()
+
+    async def _chat(self, model: str, messages: List[Dict[str, str]], options: Dict[str, Any],
+                    timeout: Optional[float], **kwargs) -> Dict[str, Any]:
+        kwargs.setdefault('keep_alive', self.keep_alive)
+        return await self._generate(
+            lambda: self._client.chat(model=model, messages=messages, options=options, **kwargs), timeout
+        )
+
+    async def _stream(self, model: str, messages: List[Dict[str, str]], options: Dict[str, Any],
+                      timeout: Optional[float], emit: Callable[[str], None], **kwargs):
+        """Runs on the client loop: stream a chat completion, passing each chunk's text to emit."""
+        kwargs.setdefault('keep_alive', self.keep_alive)
+        async def consume():
+            stream = await self._client.chat(model=model, messages=messages, options=options, stream=True, **kwargs)
+            async for chunk in stream:
+                text = chunk['message']['content']
+                if text:
+                    emit(text)
+
+        await self._generate(consume, timeout)
+
+    async def chat(self, model: str, messages: List[Dict[str, str]], options: Optional[Dict[str, Any]] = None,
+                   timeout: Optional[float] = None, **kwargs) -> Dict[str, Any]:
+        """
+        Chat completion from any event loop without blocking it.
+
+        Cancelling the awaiting task cancels the request on the Ollama side.
+
+        Args:
+            model: Model name
+            messages: Chat messages
+            options: Ollama generation options
+            timeout: Generation timeout in seconds (default from config)
+
+        Returns:
+            The Ollama chat response
+
+        Raises:
+            OllamaBusyError: The queue is full or no slot freed up in time
+            asyncio.TimeoutError: Generation exceeded the timeout
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self._chat(model, messages, options or {}, timeout, **kwargs), self._ensure_loop()
+        )
+        return await asyncio.wrap_future(future)
+
+    def chat_sync(self, model: str, messages: List[Dict[str, str]], options: Optional[Dict[str, Any]] = None,
+                  timeout: Optional[float] = None, **kwargs) -> Dict[str, Any]:
+        """Blocking chat completion for synchronous callers, under the same limits as chat()."""
+        future = asyncio.run_coroutine_threadsafe(
+            self._chat(model, messages, options or {}, timeout, **kwargs), self._ensure_loop()
+        )
+        try:
+            # Allow for queueing on top of the generation timeout before giving up on the result
+            return future.result((timeout or self.timeout) + self.queue_timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    async def stream_chat(self, model: str, messages: List[Dict[str, str]], options: Optional[Dict[str, Any]] = None,
+                          timeout: Optional[float] = None, **kwargs) -> AsyncIterator[str]:
+        """
+        Streamed chat completion from any event loop: yields text chunks as the model produces them.
+
+        The stream holds one generation slot until it finishes; closing the
+        iterator early cancels the request and frees the slot.
+
+        Args:
+            model: Model name
+            messages: Chat messages
+            options: Ollama generation options
+            timeout: Timeout for the whole generation in seconds (default from config)
+
+        Raises:
+            OllamaBusyError: The queue is full or no slot freed up in time
+            asyncio.TimeoutError: Generation exceeded the timeout
+        """
+        caller_loop = asyncio.get_running_loop()
+        chunks: asyncio.Queue = asyncio.Queue()
+        finished = object()
+
+        def emit(text: str):
+            caller_loop.call_soon_threadsafe(chunks.put_nowait, text)
+
+        future = asyncio.run_coroutine_threadsafe(
+            self._stream(model, messages, options or {}, timeout, emit, **kwargs), self._ensure_loop()
+        )
+        # Scheduled after every emitted chunk, so it always arrives last
+        future.add_done_callback(lambda _: caller_loop.call_soon_threadsafe(chunks.put_nowait, finished))
+        try:
+            while True:
+                text = await chunks.get()
+                if text is finished:
+                    break
+                yield text
+            future.result()  # Re-raise errors from the client loop
+        finally:
+            future.cancel()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Queue depth, concurrency and wait-time statistics."""
+        stats = self._stats
+        started = stats['completed'] + stats['failed'] + stats['timeouts'] + stats['cancelled']
+        admitted = started + self._in_flight
+        return {
+            'queue_depth': self._waiting,
+            'in_flight': self._in_flight,
+            'max_concurrency': self.max_concurrency,
+            'max_queue': self.max_queue,
+            'completed': stats['completed'],
+            'failed': stats['failed'],
+            'timeouts': stats['timeouts'],
+            'cancelled': stats['cancelled'],
+            'rejected': stats['rejected'],
+            'avg_wait': round(stats['total_wait'] / admitted, 3) if admitted else 0.0,
+            'max_wait': round(stats['max_wait'], 3),
+            'last_wait': round(stats['last_wait'], 3),
+            'avg_duration': round(stats['total_duration'] / started, 3) if started else 0.0
+        }
@@ -0,0 +1,204 @@
+"""
+Background health prober for the local Ollama server.
+
+Availability used to be decided once at startup, and health checks ran a
+full chat completion on every request. The prober instead polls the cheap
+model-list endpoint on an interval from a daemon thread, so availability
+follows Ollama going down or coming back, and health requests read the
+cached result. When the model is installed but not resident, it is
+pre-loaded with a keep-alive so the first real request doesn't pay the
+model load cost.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, Any, List, Optional
+
+import ollama
+
+logger = logging.getLogger(__name__)
+
+
+def model_names(listing: Any) -> List[str]:
+    """Model names from an Ollama list/ps response (old 'name' and new 'model' fields)."""
+    names = []
+    for model in listing.get('models', []) or []:
+        name = model.get('model') or model.get('name')
+        if name:
+            names.append(name)
+    return names
+
+
+def has_model(names: List[str], model_name: str) -> bool:
+    """Whether a model is among names; an untagged name matches its ':latest' tag."""
+    wanted = {model_name, f"{model_name}:latest"} if ':' not in model_name else {model_name}
+    return any(name in wanted for name in names)
+
+
+class OllamaHealthProber:
+    """Periodically refreshed Ollama availability, with model pre-loading."""
+
+    def __init__(self, model_name: str, host: Optional[str] = None, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the prober; probing starts with start().
+
+        Args:
+            model_name: Model that must be installed for the service to count as available
+            host: Ollama server URL (library default when None)
+            config: Prober settings (health_interval in seconds, 0 disables
+                background probing; keep_alive; preload; probe_timeout and
+                preload_timeout, the HTTP timeouts in seconds for status calls
+                and for loading the model)
+        """
+        self.model_name = model_name
+        self.host = host
+        self.config = config or {}
+        self.interval = self.config.get('health_interval', 30.0)
+        self.keep_alive = self.config.get('keep_alive', '30m')
+        self.preload = self.config.get('preload', True)
+        self.probe_timeout = self.config.get('probe_timeout', 10.0)
+        self.preload_timeout = self.config.get('preload_timeout', 120.0)
+
+        self._client: Optional[ollama.Client] = None
+        self._preload_client: Optional[ollama.Client] = None
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._status: Dict[str, Any] = {
+            'status': 'unknown',
+            'available': False,
+            'model': model_name,
+            'loaded': False,
+            'latency': None,
+            'error': None,
+            'checked_at': None
+        }
+
+    @property
+    def available(self) -> bool:
+        """Availability as of the last probe."""
+        return self._status['available']
+
+    def set_available(self, available: bool, error: Optional[str] = None):
+        """Record an availability result obtained elsewhere (e.g. the startup connection check)."""
+        self._update({
+            'status': 'healthy' if available else 'unavailable',
+            'available': available,
+            'error': error
+        })
+
+    def _update(self, fields: Dict[str, Any]):
+        with self._lock:
+            self._status = {**self._status, **fields, 'checked_at': time.time()}
+
+    def status(self) -> Dict[str, Any]:
+        """The cached status, with its age in seconds."""
+        with self._lock:
+            status = dict(self._status)
+        checked_at = status['checked_at']
+        status['age'] = round(time.time() - checked_at, 1) if checked_at else None
+        return status
+
+    def _get_client(self) -> ollama.Client:
+        if self._client is None:
+            self._client = ollama.Client(host=self.host, timeout=self.probe_timeout)
+        return self._client
+
+    def _get_preload_client(self) -> ollama.Client:
+        # Loading a model from disk takes far longer than a status call
+        if self._preload_client is None:
+            self._preload_client = ollama.Client(host=self.host, timeout=self.preload_timeout)
+        return self._preload_client
+
+    def probe(self) -> Dict[str, Any]:
+        """
+        Check the server now: model list, whether the model is resident, and pre-load it if not.
+
+        Returns:
+            The refreshed status
+        """
+        start = time.perf_counter()
+        try:
+            client = self._get_client()
+            installed = has_model(model_names(client.list()), self.model_name)
+            latency = round(time.perf_counter() - start, 3)
+        except Exception as e:
+            if self.available:
+                logger.warning(f"Ollama became unreachable: {e}")
+            self._update({'status': 'unreachable', 'available': False, 'loaded': False,
+                          'latency': None, 'error': str(e)})
+            return self.status()
+
+        if not installed:
+            self._update({'status': 'model_missing', 'available': False, 'loaded': False,
+                          'latency': latency, 'error': f"Model {self.model_name} is not installed"})
+            return self.status()
+
+        if not self.available:
+            logger.info(f"Ollama is available with model {self.model_name}")
+        self._update({'status': 'healthy', 'available': True, 'latency': latency, 'error': None,
+                      'loaded': self._ensure_loaded(client)})
+        return self.status()
+
+    def refresh(self) -> bool:
+        """
+        Start a probe in the background, for callers that must not wait on it (e.g. a web request).
+
+        Returns:
+            True when a probe was started, False when one is already running
+        """
+        with self._lock:
+            if self._refresh_thread and self._refresh_thread.is_alive():
+                return False
+            self._refresh_thread = threading.Thread(target=self._refresh, name='ollama-health-refresh', daemon=True)
+            self._refresh_thread.start()
+        return True
+
+    def _refresh(self):
+        try:
+            self.probe()
+        except Exception as e:
+            logger.error(f"Ollama health refresh failed: {e}")
+
+    def _ensure_loaded(self, client: ollama.Client) -> bool:
+        """Whether the model is resident in memory, loading it with a keep-alive when preloading is on."""
+        try:
+            if has_model(model_names(client.ps()), self.model_name):
+                return True
+        except Exception as e:
+            logger.debug(f"Could not list running Ollama models: {e}")
+        if not self.preload:
+            return False
+        try:
+            # An empty prompt only loads the model; keep_alive keeps it resident between requests
+            start = time.perf_counter()
+            self._get_preload_client().generate(model=self.model_name, prompt='', keep_alive=self.keep_alive)
+            logger.info(f"Pre-loaded Ollama model {self.model_name} in {time.perf_counter() - start:.1f}s")
+            return True
+        except Exception as e:
+            logger.warning(f"Could not pre-load Ollama model {self.model_name}: {e}")
+            return False
+
+    def start(self):
+        """Start background probing (no-op when disabled or already running)."""
+        if self.interval <= 0 or (self._thread and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='ollama-health-prober', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop background probing."""
+        self._stop.set()
+
+    def _run(self):
+        # Pre-load right away when the startup check found the model; then refresh on the interval
+        if self.available and self.preload:
+            self._update({'loaded': self._ensure_loaded(self._get_client())})
+        while not self._stop.wait(self.interval):
+            try:
+                self.probe()
+            except Exception as e:
+                logger.error(f"Ollama health probe failed: {e}")
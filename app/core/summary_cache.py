@@ -0,0 +1,149 @@
+"""
+Disk cache for LLM-generated summaries and intelligence reports.
+
+Generating a summary costs seconds of CPU, and the same article (or the same
+result set) is summarized again on every page view. Entries are keyed by a
+hash of everything that determines the output (article content, prompt
+template version, model name, word limit) and stored one JSON file per
+entry, written atomically, so several worker processes can share the
+directory without coordinating.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Any, Iterable, List, Optional
+
+from ..aggregator.text_view import text_view
+
+logger = logging.getLogger(__name__)
+
+
+def article_hash(article: Dict[str, Any]) -> str:
+    """Hash of the article fields a summary prompt is built from."""
+    parts = (
+        text_view(article).content_hash,
+        article.get('source', ''),
+        article.get('url_context', '')
+    )
+    return hashlib.md5(json.dumps(parts).encode('utf-8')).hexdigest()
+
+
+class SummaryCache:
+    """One-file-per-entry summary cache under data/cache/summaries/."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            config: Cache settings (enabled, directory, ttl in seconds, max_entries)
+        """
+        self.config = config or {}
+        self.enabled = self.config.get('enabled', True)
+        self.directory = self.config.get('directory', os.path.join('data', 'cache', 'summaries'))
+        self.ttl = self.config.get('ttl', 7 * 24 * 3600)
+        self.max_entries = self.config.get('max_entries', 20000)
+        self.prune_every = self.config.get('prune_every', 200)  # Writes between size checks
+
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._prune_thread: Optional[threading.Thread] = None
+        self.stats = {'hits': 0, 'misses': 0, 'writes': 0}
+
+    @staticmethod
+    def _digest(parts: Iterable[Any]) -> str:
+        return hashlib.sha256(json.dumps(list(parts)).encode('utf-8')).hexdigest()
+
+    def article_key(self, article: Dict[str, Any], prompt_version: Any, model: str, max_words: int,
+                    kind: str = 'article') -> str:
+        """Key for one article's summary; kind separates prompt templates ('article', 'batch')."""
+        return self._digest((kind, article_hash(article), prompt_version, model, max_words))
+
+    def report_key(self, articles: List[Dict[str, Any]], query: str, prompt_version: Any,
+                   model: str, max_words: int) -> str:
+        """Key for an intelligence report: the ordered article hashes plus the query."""
+        hashes = [article_hash(article) for article in articles]
+        return self._digest(('report', hashes, query.strip().lower(), prompt_version, model, max_words))
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached text, or None when missing, expired or unreadable."""
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            if self.ttl and time.time() - entry.get('created', 0) > self.ttl:
+                self.stats['misses'] += 1
+                return None
+            self.stats['hits'] += 1
+            return entry.get('text')
+        except FileNotFoundError:
+            self.stats['misses'] += 1
+            return None
+        except Exception as e:
+            logger.warning(f"Could not read cached summary {path}: {e}")
+            self.stats['misses'] += 1
+            return None
+
+    def put(self, key: str, text: str, metadata: Optional[Dict[str, Any]] = None):
+        """Store text under the key; the write is atomic, so concurrent workers never see partial files."""
+        if not self.enabled or not text:
+            return
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'text': text, 'created': time.time(), **(metadata or {})}, f)
+            os.replace(temp_path, path)
+            self.stats['writes'] += 1
+        except Exception as e:
+            logger.warning(f"Could not cache summary to {path}: {e}")
+            return
+
+        with self._lock:
+            self._writes += 1
+            if self._writes % self.prune_every != 0 or (self._prune_thread and self._prune_thread.is_alive()):
+                return
+            # Pruning walks the whole directory; never do it on the caller's (possibly event-loop) thread
+            self._prune_thread = threading.Thread(target=self.prune, name='summary-cache-prune', daemon=True)
+            self._prune_thread.start()
+
+    def prune(self):
+        """Delete expired entries, then the oldest ones beyond max_entries (put() runs this in a background thread)."""
+        if not os.path.isdir(self.directory):
+            return
+        entries = []
+        now = time.time()
+        for root, _, files in os.walk(self.directory):
+            for filename in files:
+                if not filename.endswith('.json'):
+                    continue
+                path = os.path.join(root, filename)
+                try:
+                    mtime = os.path.getmtime(path)
+                except OSError:
+                    continue
+                if self.ttl and now - mtime > self.ttl:
+                    self._remove(path)
+                else:
+                    entries.append((mtime, path))
+        if len(entries) > self.max_entries:
+            entries.sort()
+            for _, path in entries[:len(entries) - self.max_entries]:
+                self._remove(path)
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -1,19 +1,22 @@
 """Base scraper class for web-based scrapers."""
 
 from typing import List, Dict, Any, Optional
-import aiohttp
 import asyncio
 import logging
 from bs4 import BeautifulSoup
 import time
 import feedparser
 from abc import ABC, abstractmethod
+from .http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
 class WebBasedScraper(ABC):
     """Base class for all web-based scrapers."""
     
+    # Source profile on the shared HTTP client; defaults to the class name
+    http_source = None
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize the scraper with configuration."""
         self.config = config or {}
@@ -31,23 +34,19 @@ class WebBasedScraper(ABC):
         await self.close()
         
     async def setup(self):
-        """Set up the scraper session."""
+        """Attach the scraper to the shared, pooled HTTP session."""
         try:
             # Check if session exists and is not closed
             if not self.session or self.session.closed:
-                if self.session and self.session.closed:
-                    self.session = None
-                self.session = aiohttp.ClientSession()
+                source = self.http_source or self.__class__.__name__.replace('Scraper', '').lower()
+                self.session = await get_http_client().session_for(source)
         except Exception as e:
             logger.error(f"Error setting up session: {e}")
-            # Force create a new session
-            self.session = aiohttp.ClientSession()
+            self.session = None
             
     async def close(self):
-        """Close the scraper session."""
-        if self.session:
-            await self.session.close()
-            self.session = None
+        """Release the scraper's session (the shared pool stays open)."""
+        self.session = None
             
     async def _rate_limit(self):
         """Implement rate limiting between requests."""
@@ -69,6 +68,15 @@ class WebBasedScraper(ABC):
             logger.error(f"Error fetching {url}: {e}")
             return BeautifulSoup("", 'html.parser')
             
+    async def fetch_feed(self, rss_url: str):
+        """Fetch an RSS/Atom feed over the shared session and parse it."""
+        await self.setup()
+        async with self.session.get(rss_url) as response:
+            response.raise_for_status()
+            body = await response.read()
+            headers = {key.lower(): value for key, value in response.headers.items()}
+        return feedparser.parse(body, response_headers=headers)
+            
     def _extract_text(self, container: BeautifulSoup, selector: str) -> str:
         """Extract text from element using selector."""
         try:
@@ -135,6 +143,8 @@ class WebBasedScraper(ABC):
 class RSSBasedScraper(WebBasedScraper):
     """Base class for RSS-based scrapers."""
     
+    http_source = 'rss'
+    
     def __init__(self, rss_urls: List[str], config: Optional[Dict[str, Any]] = None):
         """Initialize RSS scraper with feed URLs."""
         super().__init__(config)
@@ -150,7 +160,7 @@ class RSSBasedScraper(WebBasedScraper):
                 await self._rate_limit()
                 
                 # Parse RSS feed
-                feed = feedparser.parse(rss_url)
+                feed = await self.fetch_feed(rss_url)
                 
                 for entry in feed.entries[:self.max_entries]:
                     processed_entry = self.process_entry(entry)
@@ -1,11 +1,11 @@
 """Reddit scraper for community discussions and content."""
 
 from ..base import WebBasedScraper
+from ..http_client import get_http_client
 from typing import List, Dict, Any, Optional
 import re
 import time
 import logging
-import aiohttp
 import asyncio
 from datetime import datetime, timedelta
 import json
@@ -32,8 +32,8 @@ class RedditScraper(WebBasedScraper):
         self.session = None
 
     async def _init_session(self):
-        """Initialize aiohttp session"""
-        if self.session is None:
+        """Attach to the shared HTTP session with Reddit API headers"""
+        if self.session is None or self.session.closed:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
                 'Accept': 'application/json',
@@ -42,7 +42,8 @@ class RedditScraper(WebBasedScraper):
                 'DNT': '1',
                 'Cache-Control': 'no-cache'
             }
-            self.session = aiohttp.ClientSession(headers=headers)
+            self.session = await get_http_client().session_for('reddit')
+            self.session.headers.update(headers)
 
     async def _search_reddit(self, query: str, subreddit: str = None) -> List[Dict]:
         """
@@ -231,8 +232,10 @@ class RedditScraper(WebBasedScraper):
             logger.error(f"Error in Reddit scraping: {e}")
         finally:
             # Clean up
+            # This loop's pooled session must be closed before the loop is
             if self.session:
-                loop.run_until_complete(self.session.close())
+                self.session = None
+                loop.run_until_complete(get_http_client().close())
             loop.close()
         
         logger.info(f"Total posts found: {len(all_posts)}")
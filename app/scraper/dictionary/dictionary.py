@@ -4,12 +4,13 @@ Fetches word definitions and meanings from multiple dictionary sources.
 """
 
 import asyncio
-import aiohttp
 import logging
 import re
 from typing import List, Dict, Any, Optional
 from urllib.parse import quote
 
+from ..http_client import get_http_client
+
 logger = logging.getLogger(__name__)
 
 class DictionaryScraper:
@@ -24,17 +25,15 @@ class DictionaryScraper:
             'merriam_webster': 'https://www.merriam-webster.com/dictionary/'
         }
         self.session = None
-        self.timeout = aiohttp.ClientTimeout(total=10)
     
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession(timeout=self.timeout)
+        self.session = await get_http_client().session_for('dictionary')
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self.session:
-            await self.session.close()
+        await self.close()
     
     async def search(self, query: str, max_results: int = 5) -> List[Dict[str, Any]]:
         """
@@ -49,8 +48,8 @@ class DictionaryScraper:
         """
         logger.info(f"Dictionary lookup for: {query}")
         
-        if not self.session:
-            self.session = aiohttp.ClientSession(timeout=self.timeout)
+        if not self.session or self.session.closed:
+            self.session = await get_http_client().session_for('dictionary')
         
         results = []
         
@@ -290,21 +289,8 @@ class DictionaryScraper:
         return unique_results
     
     async def close(self):
-        """Close the session."""
-        if self.session:
-            await self.session.close()
-    
-    def __del__(self):
-        """Destructor to ensure session is closed."""
-        if hasattr(self, 'session') and self.session:
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    loop.create_task(self.session.close())
-                else:
-                    loop.run_until_complete(self.session.close())
-            except:
-                pass  # Ignore errors during cleanup
+        """Release the session (the shared pool stays open)."""
+        self.session = None
     
     async def _search_partial_matches(self, query: str) -> List[Dict[str, Any]]:
         """Search for partial word matches using word root extraction."""
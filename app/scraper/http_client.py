@@ -0,0 +1,219 @@
+"""
+Process-wide shared HTTP client for scrapers and the article extractor.
+
+One aiohttp ClientSession per event loop, backed by a tuned TCPConnector (pool
+and per-host limits, DNS cache, keep-alive), replaces the per-scraper sessions. Scrapers get
+a SourceSession view that applies per-source default headers and timeouts.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Any, Optional, List
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5'
+}
+
+# Per-source defaults layered over DEFAULT_HEADERS; request headers still win
+SOURCE_PROFILES = {
+    'default': {'timeout': 15},
+    'extractor': {'timeout': 10},
+    'rss': {
+        'timeout': 10,
+        'headers': {'Accept': 'application/rss+xml, application/atom+xml, application/xml;q=0.9, */*;q=0.8'}
+    },
+    'duckduckgo': {'timeout': 10},
+    'bing': {'timeout': 10},
+    'safari': {'timeout': 10},
+    'edge': {'timeout': 10},
+    'dictionary': {'timeout': 10, 'headers': {'Accept': 'application/json, text/html;q=0.9'}},
+    'reddit': {'timeout': 10, 'headers': {'Accept': 'application/json'}},
+    'youtube': {'timeout': 10, 'headers': {'Accept': 'application/json'}},
+    'twitter': {'timeout': 10}
+}
+
+# Hosts every search touches; connections are opened ahead of the first query
+DEFAULT_PREWARM_HOSTS = [
+    'feeds.bbci.co.uk',
+    'techcrunch.com',
+    'news.google.com',
+    'html.duckduckgo.com',
+    'duckduckgo.com',
+    'www.bing.com',
+    'api.dictionaryapi.dev'
+]
+
+
+class SourceSession:
+    """Session view that applies one source's default headers and timeout."""
+
+    def __init__(self, session: aiohttp.ClientSession, source: str, profile: Dict[str, Any]):
+        self._session = session
+        self.source = source
+        self.headers = profile['headers']
+        self.timeout = profile['timeout']
+
+    def _request_kwargs(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        headers = dict(self.headers)
+        headers.update(kwargs.pop('headers', None) or {})
+        kwargs['headers'] = headers
+        kwargs.setdefault('timeout', self.timeout)
+        return kwargs
+
+    def get(self, url, **kwargs):
+        return self._session.get(url, **self._request_kwargs(kwargs))
+
+    def post(self, url, **kwargs):
+        return self._session.post(url, **self._request_kwargs(kwargs))
+
+    def head(self, url, **kwargs):
+        return self._session.head(url, **self._request_kwargs(kwargs))
+
+    def request(self, method: str, url, **kwargs):
+        return self._session.request(method, url, **self._request_kwargs(kwargs))
+
+    @property
+    def closed(self) -> bool:
+        return self._session.closed
+
+    async def close(self):
+        """No-op: the pooled session is owned by the shared client."""
+        pass
+
+
+class SharedHTTPClient:
+    """Owns the pooled aiohttp session (one per event loop) and its connector."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the shared client.
+
+        Args:
+            config: Connection pool, timeout, source profile and pre-warm settings
+        """
+        self.config = config or {}
+        self.limit = self.config.get('limit', 100)
+        self.limit_per_host = self.config.get('limit_per_host', 8)
+        self.ttl_dns_cache = self.config.get('ttl_dns_cache', 300)
+        self.keepalive_timeout = self.config.get('keepalive_timeout', 30)
+        self.prewarm_hosts = self.config.get('prewarm_hosts', DEFAULT_PREWARM_HOSTS)
+        self.prewarm_timeout = self.config.get('prewarm_timeout', 5)
+
+        self.source_profiles = {name: dict(profile) for name, profile in SOURCE_PROFILES.items()}
+        for name, profile in self.config.get('sources', {}).items():
+            self.source_profiles.setdefault(name, {}).update(profile)
+
+        # aiohttp sessions are bound to the loop they were created on, so the
+        # app's long-lived loop and any short-lived per-call loops get their own
+        self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self._closers: Dict[asyncio.AbstractEventLoop, asyncio.Task] = {}
+
+    def profile(self, source: str) -> Dict[str, Any]:
+        """Resolve headers and timeout for a source."""
+        default = self.source_profiles['default']
+        profile = self.source_profiles.get(source, {})
+
+        headers = dict(DEFAULT_HEADERS)
+        headers.update(default.get('headers', {}))
+        headers.update(profile.get('headers', {}))
+
+        timeout = profile.get('timeout', default.get('timeout', 15))
+        if not isinstance(timeout, aiohttp.ClientTimeout):
+            timeout = aiohttp.ClientTimeout(total=timeout)
+
+        return {'headers': headers, 'timeout': timeout}
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled session for the running loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is not None and not session.closed:
+            return session
+
+        # Forget sessions whose loops are gone; one still open here was closed without shutting down its tasks
+        for stale_loop in [l for l in self._sessions if l.is_closed()]:
+            stale = self._sessions.pop(stale_loop)
+            self._closers.pop(stale_loop, None)
+            if not stale.closed:
+                logger.warning("HTTP session's event loop was closed before the session; its connections leaked")
+
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.ttl_dns_cache,
+            keepalive_timeout=self.keepalive_timeout
+        )
+        session = aiohttp.ClientSession(
+            connector=connector,
+            headers=DEFAULT_HEADERS,
+            timeout=self.profile('default')['timeout']
+        )
+        self._sessions[loop] = session
+        # Loops shut down by asyncio.run cancel their remaining tasks first; that closes the session in time
+        self._closers[loop] = loop.create_task(self._close_on_shutdown(session))
+        return session
+
+    @staticmethod
+    async def _close_on_shutdown(session: aiohttp.ClientSession):
+        """Wait until cancelled (loop shutdown or close()), then close the session on its own loop."""
+        try:
+            await asyncio.get_running_loop().create_future()
+        finally:
+            if not session.closed:
+                await session.close()
+
+    async def session_for(self, source: str = 'default') -> SourceSession:
+        """Return a session view with the source's default headers and timeout."""
+        session = await self.get_session()
+        return SourceSession(session, source, self.profile(source))
+
+    async def prewarm(self, hosts: Optional[List[str]] = None) -> Dict[str, bool]:
+        """
+        Resolve DNS and open keep-alive connections to the given hosts.
+
+        Returns:
+            Mapping of host to whether a connection was established
+        """
+        session = await self.get_session()
+        hosts = hosts or self.prewarm_hosts
+        timeout = aiohttp.ClientTimeout(total=self.prewarm_timeout)
+
+        async def warm(host: str) -> bool:
+            try:
+                async with session.head(f"https://{host}/", timeout=timeout, allow_redirects=False):
+                    return True
+            except Exception as e:
+                logger.debug(f"Pre-warm failed for {host}: {e}")
+                return False
+
+        results = await asyncio.gather(*(warm(host) for host in hosts))
+        warmed = dict(zip(hosts, results))
+        logger.info(f"Pre-warmed connections to {sum(results)}/{len(hosts)} hosts")
+        return warmed
+
+    async def close(self):
+        """Close the running loop's pooled session (call before that loop shuts down)."""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.pop(loop, None)
+        closer = self._closers.pop(loop, None)
+        if closer is not None:
+            closer.cancel()
+        if session is not None and not session.closed:
+            await session.close()
+
+
+_shared_client: Optional[SharedHTTPClient] = None
+
+
+def get_http_client(config: Optional[Dict[str, Any]] = None) -> SharedHTTPClient:
+    """Return the process-wide HTTP client, creating it on first use."""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = SharedHTTPClient(config)
+    return _shared_client
@@ -5,7 +5,6 @@ from typing import List, Dict, Any
 import re
 import time
 import logging
-import aiohttp
 import json
 from datetime import datetime, timedelta
 
@@ -61,23 +60,24 @@ class TwitchScraper(WebBasedScraper):
             return None
             
         try:
-            async with aiohttp.ClientSession() as session:
-                url = "https://id.twitch.tv/oauth2/token"
-                data = {
-                    'client_id': self.client_id,
-                    'client_secret': self.client_secret,
-                    'grant_type': 'client_credentials'
-                }
-                
-                async with session.post(url, data=data) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        self.access_token = result.get('access_token')
-                        return self.access_token
-                    else:
-                        logger.error(f"Failed to get Twitch access token: {response.status}")
-                        return None
-                        
+            await self.setup()
+            session = self.session
+            url = "https://id.twitch.tv/oauth2/token"
+            data = {
+                'client_id': self.client_id,
+                'client_secret': self.client_secret,
+                'grant_type': 'client_credentials'
+            }
+            
+            async with session.post(url, data=data) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    self.access_token = result.get('access_token')
+                    return self.access_token
+                else:
+                    logger.error(f"Failed to get Twitch access token: {response.status}")
+                    return None
+                    
         except Exception as e:
             logger.error(f"Error getting Twitch access token: {e}")
             return None
@@ -96,71 +96,72 @@ class TwitchScraper(WebBasedScraper):
             streams = []
             
             # Search for live streams
-            async with aiohttp.ClientSession() as session:
-                # Get streams by game/category
-                for category in self.categories:
-                    # First get game ID
-                    game_url = f"https://api.twitch.tv/helix/games?name={category}"
-                    async with session.get(game_url, headers=headers) as response:
-                        if response.status == 200:
-                            games_data = await response.json()
-                            if games_data.get('data'):
-                                game_id = games_data['data'][0]['id']
-                                
-                                # Get streams for this game
-                                streams_url = f"https://api.twitch.tv/helix/streams?game_id={game_id}&first=20"
-                                async with session.get(streams_url, headers=headers) as stream_response:
-                                    if stream_response.status == 200:
-                                        streams_data = await stream_response.json()
-                                        
-                                        for stream in streams_data.get('data', []):
-                                            # Filter by query and viewer count
-                                            if (stream['viewer_count'] >= self.min_viewers and
-                                                query.lower() in stream['title'].lower()):
-                                                
-                                                # Get user info
-                                                user_url = f"https://api.twitch.tv/helix/users?id={stream['user_id']}"
-                                                async with session.get(user_url, headers=headers) as user_response:
-                                                    user_data = {}
-                                                    if user_response.status == 200:
-                                                        user_result = await user_response.json()
-                                                        if user_result.get('data'):
-                                                            user_data = user_result['data'][0]
-                                                
-                                                # Calculate credibility based on followers, views, etc.
-                                                credibility_score = self._calculate_stream_credibility(stream, user_data)
-                                                
-                                                stream_info = {
-                                                    'title': stream['title'],
-                                                    'link': f"https://twitch.tv/{stream['user_login']}",
+            await self.setup()
+            session = self.session
+            # Get streams by game/category
+            for category in self.categories:
+                # First get game ID
+                game_url = f"https://api.twitch.tv/helix/games?name={category}"
+                async with session.get(game_url, headers=headers) as response:
+                    if response.status == 200:
+                        games_data = await response.json()
+                        if games_data.get('data'):
+                            game_id = games_data['data'][0]['id']
+                            
+                            # Get streams for this game
+                            streams_url = f"https://api.twitch.tv/helix/streams?game_id={game_id}&first=20"
+                            async with session.get(streams_url, headers=headers) as stream_response:
+                                if stream_response.status == 200:
+                                    streams_data = await stream_response.json()
+                                    
+                                    for stream in streams_data.get('data', []):
+                                        # Filter by query and viewer count
+                                        if (stream['viewer_count'] >= self.min_viewers and
+                                            query.lower() in stream['title'].lower()):
+                                            
+                                            # Get user info
+                                            user_url = f"https://api.twitch.tv/helix/users?id={stream['user_id']}"
+                                            async with session.get(user_url, headers=headers) as user_response:
+                                                user_data = {}
+                                                if user_response.status == 200:
+                                                    user_result = await user_response.json()
+                                                    if user_result.get('data'):
+                                                        user_data = user_result['data'][0]
+                                            
+                                            # Calculate credibility based on followers, views, etc.
+                                            credibility_score = self._calculate_stream_credibility(stream, user_data)
+                                            
+                                            stream_info = {
+                                                'title': stream['title'],
+                                                'link': f"https://twitch.tv/{stream['user_login']}",
+                                                'streamer': stream['user_name'],
+                                                'game_name': stream['game_name'],
+                                                'viewer_count': stream['viewer_count'],
+                                                'language': stream['language'],
+                                                'started_at': stream['started_at'],
+                                                'thumbnail_url': stream['thumbnail_url'],
+                                                'is_live': True,
+                                                'source': 'twitch',
+                                                'source_name': 'Twitch',
+                                                'type': 'Live Stream',
+                                                'source_detail': f"Twitch - {stream['user_name']}",
+                                                'credibility_info': {
+                                                    'score': credibility_score,
+                                                    'category': 'Live Content',
+                                                    'bias': 'real-time'
+                                                },
+                                                'metadata': {
+                                                    'platform': 'Twitch',
                                                     'streamer': stream['user_name'],
-                                                    'game_name': stream['game_name'],
-                                                    'viewer_count': stream['viewer_count'],
+                                                    'game': stream['game_name'],
+                                                    'viewers': stream['viewer_count'],
                                                     'language': stream['language'],
                                                     'started_at': stream['started_at'],
-                                                    'thumbnail_url': stream['thumbnail_url'],
-                                                    'is_live': True,
-                                                    'source': 'twitch',
-                                                    'source_name': 'Twitch',
-                                                    'type': 'Live Stream',
-                                                    'source_detail': f"Twitch - {stream['user_name']}",
-                                                    'credibility_info': {
-                                                        'score': credibility_score,
-                                                        'category': 'Live Content',
-                                                        'bias': 'real-time'
-                                                    },
-                                                    'metadata': {
-                                                        'platform': 'Twitch',
-                                                        'streamer': stream['user_name'],
-                                                        'game': stream['game_name'],
-                                                        'viewers': stream['viewer_count'],
-                                                        'language': stream['language'],
-                                                        'started_at': stream['started_at'],
-                                                        'stream_type': 'live'
-                                                    },
-                                                    'scraped_at': time.time()
-                                                }
-                                                streams.append(stream_info)
+                                                    'stream_type': 'live'
+                                                },
+                                                'scraped_at': time.time()
+                                            }
+                                            streams.append(stream_info)
             
             return streams
             
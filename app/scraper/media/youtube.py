@@ -2,11 +2,12 @@
 YouTube scraper module for fetching video information.
 """
 
-import aiohttp
 import asyncio
 from datetime import datetime
 from typing import List, Dict, Any
 
+from ..http_client import get_http_client
+
 class YouTubeScraper:
     """YouTube scraper for fetching video information."""
 
@@ -20,17 +21,14 @@ class YouTubeScraper:
         self.max_results = self.apis.get('max_results', 10)
 
     async def _init_session(self):
-        """Initialize aiohttp session if not already created."""
+        """Attach to the shared, pooled HTTP session if not already attached."""
         if not hasattr(self, 'session') or self.session is None:
-            if self._session is None:
-                self._session = aiohttp.ClientSession()
+            self._session = await get_http_client().session_for('youtube')
             self.session = self._session
 
     async def close(self):
-        """Close the aiohttp session."""
-        if self._session:
-            await self._session.close()
-            self._session = None
+        """Release the session (the shared pool stays open)."""
+        self._session = None
         if hasattr(self, 'session'):
             self.session = None
 
@@ -8,7 +8,6 @@ from datetime import datetime, timedelta
 import asyncio
 from newspaper import Article, Config
 from bs4 import BeautifulSoup
-import aiohttp
 from loguru import logger
 import hashlib
 import json
@@ -17,6 +16,7 @@ import feedparser
 import time
 
 from app.scraper.plugin_loader import BaseScraper
+from app.scraper.http_client import get_http_client
 
 class NewsScraper(BaseScraper):
     """News scraper that aggregates articles from multiple sources."""
@@ -229,10 +229,9 @@ class NewsScraper(BaseScraper):
             logger.warning(f"Cache storage failed: {e}")
 
     async def _init_session(self):
-        """Initialize aiohttp session if not already created."""
+        """Attach to the shared, pooled HTTP session if not already attached."""
         if not hasattr(self, 'session') or self.session is None:
-            if self._session is None:
-                self._session = aiohttp.ClientSession()
+            self._session = await get_http_client().session_for('news')
             self.session = self._session
 
     async def _rate_limit_wait(self):
@@ -524,9 +523,8 @@ class NewsScraper(BaseScraper):
         return 'news'
 
     async def close(self):
-        """Close the aiohttp session."""
-        if self._session:
-            await self._session.close()
-            self._session = None
+        """Release the session (the shared pool stays open) and the cache connection."""
+        self._session = None
+        self.session = None
         if self.redis:
             await self.redis.close()
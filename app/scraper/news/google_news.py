@@ -251,9 +251,8 @@ class GoogleNewsScraper(RSSBasedScraper):
             try:
                 await self._rate_limit()
                 
-                # Parse RSS feed
-                import feedparser
-                feed = feedparser.parse(rss_url)
+                # Fetch and parse RSS feed over the shared session
+                feed = await self.fetch_feed(rss_url)
                 
                 for entry in feed.entries[: (max_results or self.max_entries)]:
                     processed_entry = self.process_entry(entry)
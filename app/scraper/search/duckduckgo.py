@@ -8,6 +8,7 @@ import urllib.parse
 import re
 from bs4 import BeautifulSoup
 from ..base import WebBasedScraper
+from ...aggregator.domain_reputation import get_domain_reputation, in_domains
 
 class DuckDuckGoScraper(WebBasedScraper):
     """DuckDuckGo search scraper for any topic."""
@@ -17,6 +18,7 @@ class DuckDuckGoScraper(WebBasedScraper):
         super().__init__(config)
         self.source_name = "DuckDuckGo Search"
         self.credibility_base = 82.0  # Search engine aggregated results
+        self.reputation = get_domain_reputation()
         self.search_url = "https://duckduckgo.com/html/"
         self.max_entries = self.config.get('max_entries', 15)
         
@@ -154,19 +156,18 @@ class DuckDuckGoScraper(WebBasedScraper):
         # Domain-based adjustments
         domain = self._extract_domain(url).lower()
         
-        # High credibility domains
-        high_cred_domains = ['wikipedia.org', 'britannica.com', 'gov', 'edu', 'nature.com', 'science.org', 'bbc.com', 'reuters.com', 'cnn.com', 'nytimes.com']
-        if any(hcd in domain for hcd in high_cred_domains):
+        # High credibility domains come from the shared reputation service,
+        # medium credibility domains from this engine's own list
+        med_cred_domains = ['forbes.com', 'bloomberg.com', 'washingtonpost.com', 'theguardian.com', 'techcrunch.com', 'wired.com']
+        if self.reputation.is_trusted(url):
             base_score += 8
-            
-        # Medium credibility domains
-        med_cred_domains = ['forbes.com', 'bloomberg.com', 'washingtonpost.com', 'guardian.com', 'techcrunch.com', 'wired.com']
-        if any(mcd in domain for mcd in med_cred_domains):
+        elif in_domains(url, med_cred_domains):
             base_score += 5
             
         # Lower credibility indicators
-        low_cred_indicators = ['blog', 'forum', 'reddit.com', 'yahoo.answers', 'quora.com']
-        if any(lci in domain for lci in low_cred_indicators):
+        low_cred_domains = ['reddit.com', 'quora.com', 'answers.yahoo.com']
+        low_cred_indicators = ['blog', 'forum']
+        if in_domains(url, low_cred_domains) or any(lci in domain for lci in low_cred_indicators):
             base_score -= 3
             
         # Content quality indicators
@@ -8,6 +8,7 @@ import urllib.parse
 import re
 from bs4 import BeautifulSoup
 from ..base import WebBasedScraper
+from ...aggregator.domain_reputation import get_domain_reputation, in_domains
 
 class EdgeScraper(WebBasedScraper):
     """Microsoft Edge search scraper (uses Bing backend)."""
@@ -17,6 +18,7 @@ class EdgeScraper(WebBasedScraper):
         super().__init__(config)
         self.source_name = "Microsoft Edge Search"
         self.credibility_base = 86.0  # Edge with enhanced security
+        self.reputation = get_domain_reputation()
         self.search_url = "https://www.bing.com/search"
         self.max_entries = self.config.get('max_entries', 15)
         
@@ -151,16 +153,13 @@ class EdgeScraper(WebBasedScraper):
         """Calculate credibility score with Edge's enhanced security."""
         base_score = self.credibility_base
         
-        domain = self._extract_domain(url).lower()
-        
-        # High credibility domains (Edge security standards)
-        high_cred_domains = ['microsoft.com', 'windows.com', 'office.com', 'wikipedia.org', 'britannica.com', 'gov', 'edu', 'nature.com', 'science.org', 'bbc.com', 'reuters.com']
-        if any(hcd in domain for hcd in high_cred_domains):
+        # High credibility domains (shared reputation service, plus Edge's own)
+        if self.reputation.is_trusted(url) or in_domains(url, ['microsoft.com', 'windows.com', 'office.com']):
             base_score += 8
             
         # Microsoft ecosystem bonus
         ms_domains = ['microsoft.com', 'office.com', 'windows.com', 'xbox.com', 'msn.com', 'outlook.com']
-        if any(msd in domain for msd in ms_domains):
+        if in_domains(url, ms_domains):
             base_score += 5
             
         # Security-verified domains
@@ -8,6 +8,7 @@ import urllib.parse
 import re
 from bs4 import BeautifulSoup
 from ..base import WebBasedScraper
+from ...aggregator.domain_reputation import get_domain_reputation, in_domains
 
 class SafariScraper(WebBasedScraper):
     """Safari search scraper (uses DuckDuckGo backend)."""
@@ -17,6 +18,7 @@ class SafariScraper(WebBasedScraper):
         super().__init__(config)
         self.source_name = "Safari Search"
         self.credibility_base = 85.0  # Safari with privacy focus
+        self.reputation = get_domain_reputation()
         self.search_url = "https://duckduckgo.com/html/"
         self.max_entries = self.config.get('max_entries', 15)
         
@@ -140,16 +142,13 @@ class SafariScraper(WebBasedScraper):
         """Calculate credibility score with Safari's privacy standards."""
         base_score = self.credibility_base
         
-        domain = self._extract_domain(url).lower()
-        
-        # High credibility domains (Safari prioritizes these)
-        high_cred_domains = ['wikipedia.org', 'britannica.com', 'gov', 'edu', 'nature.com', 'science.org', 'bbc.com', 'reuters.com', 'cnn.com', 'nytimes.com', 'apple.com']
-        if any(hcd in domain for hcd in high_cred_domains):
+        # High credibility domains (shared reputation service, plus Apple's own)
+        if self.reputation.is_trusted(url) or in_domains(url, ['apple.com']):
             base_score += 10
             
         # Privacy-respecting domains get bonus
         privacy_domains = ['duckduckgo.com', 'startpage.com', 'searx.org']
-        if any(pd in domain for pd in privacy_domains):
+        if in_domains(url, privacy_domains):
             base_score += 5
             
         # Content quality indicators
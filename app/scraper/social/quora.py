@@ -12,9 +12,9 @@ import redis.asyncio as redis
 from playwright.async_api import async_playwright, Page, TimeoutError as PlaywrightTimeoutError
 import urllib.parse
 import random
-import aiohttp
 
 from .plugin_loader import BaseScraper, rate_limited
+from ..http_client import get_http_client
 
 class QuoraScraper(BaseScraper):
     """Quora scraper implementation with fallback mechanisms."""
@@ -95,17 +95,16 @@ class QuoraScraper(BaseScraper):
                 raise
 
     async def _init_http_client(self):
-        """Initialize aiohttp client for API requests."""
-        if self.http_client is None:
-            self.http_client = aiohttp.ClientSession(
-                headers={
-                    'User-Agent': random.choice(self.mobile_user_agents),
-                    'Accept': 'application/json',
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Origin': 'https://www.quora.com',
-                    'Referer': 'https://www.quora.com/'
-                }
-            )
+        """Attach to the shared HTTP session with Quora API headers."""
+        if self.http_client is None or self.http_client.closed:
+            self.http_client = await get_http_client().session_for('quora')
+            self.http_client.headers.update({
+                'User-Agent': random.choice(self.mobile_user_agents),
+                'Accept': 'application/json',
+                'Accept-Language': 'en-US,en;q=0.9',
+                'Origin': 'https://www.quora.com',
+                'Referer': 'https://www.quora.com/'
+            })
 
     async def _handle_login_wall(self) -> bool:
         """Handle Quora login wall if present."""
@@ -474,8 +473,8 @@ class QuoraScraper(BaseScraper):
         if self.redis:
             await self.redis.close()
             
-        if self.http_client:
-            await self.http_client.close()
+        # The pooled session is shared; just drop the reference
+        self.http_client = None
             
         if self.page:
             await self.page.close()
@@ -9,13 +9,13 @@ from loguru import logger
 import hashlib
 import json
 import redis.asyncio as redis
-import aiohttp
 import feedparser
 import html
 from bs4 import BeautifulSoup
 from urllib.parse import quote_plus
 
 from ..plugin_loader import BaseScraper, rate_limited
+from ..http_client import get_http_client
 
 class RedditScraper(BaseScraper):
     """Reddit scraper implementation using RSS feeds."""
@@ -42,9 +42,9 @@ class RedditScraper(BaseScraper):
         self.session = None
 
     async def _init_session(self):
-        """Initialize aiohttp session."""
-        if self.session is None:
-            self.session = aiohttp.ClientSession()
+        """Attach to the shared, pooled HTTP session."""
+        if self.session is None or self.session.closed:
+            self.session = await get_http_client().session_for('reddit')
 
     async def _get_subreddit_feed(self, subreddit: str) -> List[Dict]:
         """Get posts from a subreddit's RSS feed."""
@@ -190,8 +190,8 @@ class RedditScraper(BaseScraper):
         """Clean up resources."""
         if self.redis:
             await self.redis.close()
-        if self.session:
-            await self.session.close()
+        # The pooled session is shared; just drop the reference
+        self.session = None
 
     async def _init_cache(self):
         """Initialize Redis cache connection."""
@@ -10,10 +10,10 @@ import re
 from typing import Dict, List, Any, Optional
 from loguru import logger
 import redis.asyncio as redis
-import aiohttp
 from bs4 import BeautifulSoup
 
 from ..plugin_loader import BaseScraper, rate_limited
+from ..http_client import get_http_client
 
 class TwitterScraper(BaseScraper):
     """Twitter scraper implementation using web interface."""
@@ -40,9 +40,9 @@ class TwitterScraper(BaseScraper):
         self.session = None
 
     async def _init_session(self):
-        """Initialize aiohttp session."""
-        if self.session is None:
-            self.session = aiohttp.ClientSession()
+        """Attach to the shared, pooled HTTP session."""
+        if self.session is None or self.session.closed:
+            self.session = await get_http_client().session_for('twitter')
 
     async def _init_cache(self):
         """Initialize Redis cache connection."""
@@ -322,5 +322,5 @@ class TwitterScraper(BaseScraper):
         """Clean up resources."""
         if self.redis:
             await self.redis.close()
-        if self.session:
-            await self.session.close()
+        # The pooled session is shared; just drop the reference
+        self.session = None
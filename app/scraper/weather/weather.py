@@ -2,11 +2,12 @@
 Weather scraper module for fetching weather data from multiple providers.
 """
 
-import aiohttp
 import asyncio
 from datetime import datetime
 from typing import List, Dict, Any
 
+from ..http_client import get_http_client
+
 class WeatherScraper:
     """Weather scraper that aggregates data from multiple weather providers."""
 
@@ -19,17 +20,14 @@ class WeatherScraper:
         self.last_request_time = None
 
     async def _init_session(self):
-        """Initialize aiohttp session if not already created."""
+        """Attach to the shared, pooled HTTP session if not already attached."""
         if not hasattr(self, 'session') or self.session is None:
-            if self._session is None:
-                self._session = aiohttp.ClientSession()
+            self._session = await get_http_client().session_for('weather')
             self.session = self._session
 
     async def close(self):
-        """Close the aiohttp session."""
-        if self._session:
-            await self._session.close()
-            self._session = None
+        """Release the session (the shared pool stays open)."""
+        self._session = None
         if hasattr(self, 'session'):
             self.session = None
 
@@ -0,0 +1,88 @@
+"""
+Unit tests for the two-tier analysis cache.
+"""
+
+import pytest
+
+from app.analyzer.analysis_cache import AnalysisCache
+from app.analyzer.bias import BiasAnalyzer
+
+
+class CountingAnalyzer:
+    """Query-independent analyzer stub that records what it was asked to analyze."""
+
+    cache_name = 'counting'
+
+    def __init__(self, version=1):
+        self.cache_version = version
+        self.calls = []
+
+    def cache_key(self, content):
+        return content['content']
+
+    async def analyze_batch(self, contents):
+        self.calls.append([content['content'] for content in contents])
+        return [{'length': len(content['content'])} for content in contents]
+
+
+@pytest.mark.asyncio
+async def test_misses_are_analyzed_once_and_survive_restart(tmp_path):
+    """Duplicates share one analysis; a new cache instance reads results back from disk."""
+    items = [{'content': 'abc'}, {'content': 'abcd'}, {'content': 'abc'}]
+    analyzer = CountingAnalyzer()
+    cache = AnalysisCache({'directory': str(tmp_path)})
+
+    results = await cache.analyze_batch(analyzer, items)
+    cache.save()
+
+    assert results == [{'length': 3}, {'length': 4}, {'length': 3}]
+    assert analyzer.calls == [['abc', 'abcd']]
+
+    restarted = AnalysisCache({'directory': str(tmp_path)})
+    assert await restarted.analyze_batch(analyzer, items) == results
+    assert analyzer.calls == [['abc', 'abcd']]
+    assert restarted.stats['disk_hits'] == 2
+
+
+@pytest.mark.asyncio
+async def test_version_bump_invalidates_entries(tmp_path):
+    """A new analyzer version reanalyzes and drops the old shard."""
+    cache = AnalysisCache({'directory': str(tmp_path)})
+    await cache.analyze_batch(CountingAnalyzer(version=1), [{'content': 'abc'}])
+    cache.save()
+
+    bumped = CountingAnalyzer(version=2)
+    await AnalysisCache({'directory': str(tmp_path)}).analyze_batch(bumped, [{'content': 'abc'}])
+
+    assert bumped.calls == [['abc']]
+    assert [path.name for path in tmp_path.iterdir()] == []
+
+
+@pytest.mark.asyncio
+async def test_cached_results_match_direct_analysis(tmp_path):
+    """Results served from the cache equal the analyzer's own, and are not shared objects."""
+    analyzer = BiasAnalyzer()
+    item = {'title': 'Radical plan', 'content': 'In my opinion it is obviously a disaster.'}
+    cache = AnalysisCache({'directory': str(tmp_path)})
+
+    first = await cache.analyze_batch(analyzer, [item])
+    second = await cache.analyze_batch(analyzer, [dict(item, source='elsewhere')])
+
+    assert first == second == await analyzer.analyze_batch([item])
+    assert first[0] is not second[0]
+
+
+@pytest.mark.asyncio
+async def test_saves_are_throttled_unless_forced(tmp_path):
+    """Changed shards are written once per save interval; force writes them anyway."""
+    analyzer = CountingAnalyzer()
+    cache = AnalysisCache({'directory': str(tmp_path)})
+
+    await cache.analyze_batch(analyzer, [{'content': 'abc'}])
+    cache.save()
+    await cache.analyze_batch(analyzer, [{'content': 'abcd'}])
+    cache.save()
+    assert AnalysisCache({'directory': str(tmp_path)}).get('counting', '1', 'abcd') is None
+
+    cache.save(force=True)
+    assert AnalysisCache({'directory': str(tmp_path)}).get('counting', '1', 'abcd') == {'length': 4}
@@ -0,0 +1,73 @@
+"""
+Unit tests for article extractor batch scheduling.
+"""
+
+import asyncio
+import pytest
+from app.core.article_extractor import ArticleExtractor, ExtractionResult
+
+
+class RecordingExtractor(ArticleExtractor):
+    """Extractor that simulates fetches and records per-host concurrency."""
+
+    def __init__(self, config=None, delays=None):
+        super().__init__(config)
+        self.delays = delays or {}
+        self.in_flight = {}
+        self.max_in_flight = {}
+        self.max_total = 0
+
+    async def setup(self):
+        pass
+
+    async def extract_article_content(self, url):
+        host = self._host_key(url)
+        self.in_flight[host] = self.in_flight.get(host, 0) + 1
+        self.max_in_flight[host] = max(self.max_in_flight.get(host, 0), self.in_flight[host])
+        self.max_total = max(self.max_total, sum(self.in_flight.values()))
+        try:
+            await asyncio.sleep(self.delays.get(url, 0.01))
+            return ExtractionResult(success=True, content=f"Full content of {url}", title="")
+        finally:
+            self.in_flight[host] -= 1
+
+
+def _articles(urls):
+    return [{'title': f'Article {i}', 'link': url, 'content': ''} for i, url in enumerate(urls)]
+
+
+@pytest.mark.asyncio
+async def test_batch_preserves_input_order():
+    """Test that results come back in input order even when fetches finish out of order."""
+    urls = [f'https://site{i}.com/story' for i in range(6)]
+    delays = {url: 0.05 - i * 0.008 for i, url in enumerate(urls)}
+    extractor = RecordingExtractor(delays=delays)
+
+    enhanced = await extractor.enhance_articles_batch(_articles(urls), max_concurrent=3)
+
+    assert [a['link'] for a in enhanced] == urls
+    assert all(a['metadata']['content_enhanced'] for a in enhanced)
+    assert extractor.max_total <= 3
+
+
+@pytest.mark.asyncio
+async def test_per_host_limit_is_enforced():
+    """Test that a single publisher never gets more than its per-host cap."""
+    urls = [f'https://www.example.com/story-{i}' for i in range(6)]
+    extractor = RecordingExtractor({'max_concurrent_per_host': 2})
+
+    await extractor.enhance_articles_batch(_articles(urls), max_concurrent=5)
+
+    assert extractor.max_in_flight['example.com'] <= 2
+
+
+@pytest.mark.asyncio
+async def test_slow_url_times_out_without_blocking_others():
+    """Test that a URL exceeding its timeout is returned unenhanced."""
+    urls = ['https://slow.com/a', 'https://fast.com/b']
+    extractor = RecordingExtractor({'per_url_timeout': 0.05}, delays={urls[0]: 1.0})
+
+    enhanced = await extractor.enhance_articles_batch(_articles(urls), max_concurrent=2)
+
+    assert 'metadata' not in enhanced[0]
+    assert enhanced[1]['metadata']['content_enhanced']
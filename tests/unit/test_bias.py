@@ -0,0 +1,39 @@
+"""
+Unit tests for the bias analyzer and the multi-pattern term matcher.
+"""
+
+import pytest
+
+from app.analyzer.bias import BiasAnalyzer
+from app.aggregator.multi_pattern import TermMatcher
+
+
+def test_matcher_finds_overlapping_phrases_in_one_pass():
+    """Phrases, nested phrases and repeated single words are all reported per category."""
+    matcher = TermMatcher({
+        'phrases': {'wealth inequality', 'inequality', 'in my opinion'},
+        'pronouns': {'my', 'i'}
+    })
+
+    hits = matcher.scan('in my opinion wealth inequality is i think my concern'.split())
+
+    assert hits['phrases'] == {'in my opinion': 1, 'wealth inequality': 1, 'inequality': 1}
+    assert hits['pronouns'] == {'my': 2, 'i': 1}
+
+
+@pytest.mark.asyncio
+async def test_analyze_counts_categories():
+    """Bias components come from the matcher hits."""
+    analyzer = BiasAnalyzer()
+
+    result = await analyzer.analyze({
+        'title': 'I think the radical plan is a disaster',
+        'content': 'Climate change and gun control. He said she said. In my opinion it is obviously corrupt.'
+    })
+
+    components = result['components']
+    assert components['political']['indicators'] == {'left_count': 2, 'right_count': 0}
+    assert components['emotional']['loaded_language'] == 3
+    assert components['source']['opinion_markers'] == 2
+    assert components['source']['first_person_count'] == 2
+    assert (components['gender']['he_count'], components['gender']['she_count']) == (1, 1)
@@ -0,0 +1,55 @@
+"""
+Unit tests for the token-budgeted context packer.
+"""
+
+from app.core.context_packer import ContextPacker
+
+RATES = 'The central bank raised interest rates by half a point on Tuesday.'
+
+ARTICLES = [
+    {
+        'title': 'Central bank raises rates',
+        'source': 'reuters',
+        'content': f"{RATES} Inflation has stayed above target for two years running. "
+                   "Click here to subscribe to our newsletter today for free."
+    },
+    {
+        'title': 'Rates go up again',
+        'source': 'bbc',
+        'content': f"{RATES} Mortgage holders will see monthly payments rise from next month."
+    },
+    {
+        'title': 'Local team wins the cup',
+        'source': 'espn',
+        'content': 'The local team won the cup final after a dramatic penalty shootout.'
+    },
+    {'title': 'Markets react to rate decision', 'source': 'cnbc', 'content': ''}
+]
+
+
+def test_redundant_and_boilerplate_sentences_are_dropped():
+    """A sentence shared by two sources is packed once; boilerplate never; order is preserved."""
+    packed = ContextPacker().pack(ARTICLES, 'interest rates')
+
+    sentences = [sentence for article in packed for sentence in article.sentences]
+    assert sentences.count(RATES) == 1
+    assert not any('subscribe' in sentence for sentence in sentences)
+    assert 'Mortgage holders will see monthly payments rise from next month.' in sentences
+    assert [article.index for article in packed] == sorted(article.index for article in packed)
+
+    # The headline-only article still contributes its title
+    assert packed[-1].index == 3 and packed[-1].sentences == []
+
+
+def test_budget_limits_the_context_and_prefers_the_query():
+    """A tight budget keeps the query-relevant sentence and nothing beyond the budget."""
+    packer = ContextPacker({'token_budget': 30})
+    packed = packer.pack(ARTICLES, 'interest rates')
+
+    used = sum(
+        packer.estimate_tokens(packer.header(article.article))
+        + sum(packer.estimate_tokens(sentence) for sentence in article.sentences)
+        for article in packed
+    )
+    assert used <= 30
+    assert packed[0].sentences == [RATES]
@@ -0,0 +1,152 @@
+"""
+Unit tests for the deduplicator and its MinHash/LSH index.
+"""
+
+import pytest
+
+from app.aggregator.deduplicator import Deduplicator
+from app.aggregator.minhash import MinHasher, LSHIndex, shingle
+from app.aggregator.story_index import StoryClusterIndex
+from app.aggregator.url_canonicalizer import URLCanonicalizer
+
+
+@pytest.fixture
+def deduplicator():
+    """Fixture to create a deduplicator with default thresholds."""
+    return Deduplicator()
+
+
+def test_near_duplicates_are_merged(deduplicator):
+    """Near-identical items collapse into the first one, keeping merge metadata."""
+    items = [
+        {
+            'id': 1,
+            'title': 'Central bank raises interest rates by half a point',
+            'content': 'The central bank raised its benchmark rate on Tuesday, citing persistent inflation.',
+            'url': 'https://news.example.com/economy/rates-rise',
+            'source_type': 'news',
+            'tags': ['economy']
+        },
+        {
+            'id': 2,
+            'title': 'Central bank raises interest rates by half a point',
+            'content': 'The central bank raised its benchmark rate on Tuesday citing persistent inflation!',
+            'url': 'https://wire.example.org/story/123',
+            'source_type': 'wire',
+            'tags': ['rates']
+        },
+        {
+            'id': 3,
+            'title': 'Local team wins championship after dramatic final',
+            'content': 'Fans celebrated late into the night after the final whistle.',
+            'url': 'https://sports.example.com/final',
+            'source_type': 'news'
+        }
+    ]
+
+    unique = deduplicator.deduplicate(items)
+
+    assert [item['id'] for item in unique] == [1, 3]
+    assert set(unique[0]['tags']) == {'economy', 'rates'}
+    assert unique[0]['duplicate_sources'] == [
+        {'source_type': 'wire', 'url': 'https://wire.example.org/story/123', 'id': 2}
+    ]
+
+
+def test_same_url_is_duplicate_even_with_different_text(deduplicator):
+    """Matching normalized URLs are always candidates and pass the URL threshold."""
+    items = [
+        {'id': 1, 'title': 'First headline', 'content': 'Some text', 'url': 'https://www.example.com/a?utm_source=x'},
+        {'id': 2, 'title': 'Edited headline', 'content': 'Rewritten body', 'url': 'https://example.com/a/'}
+    ]
+
+    assert [item['id'] for item in deduplicator.deduplicate(items)] == [1]
+
+
+def test_lsh_finds_similar_signatures_only():
+    """Similar texts share a band; unrelated texts do not."""
+    hasher = MinHasher(128)
+    index = LSHIndex(128, 32)
+    base = 'the quick brown fox jumps over the lazy dog near the river bank'
+    index.insert('base', hasher.signature(shingle(base)))
+
+    similar = hasher.signature(shingle(base.replace('lazy', 'sleepy')))
+    unrelated = hasher.signature(shingle('quarterly earnings beat analyst expectations by wide margin'))
+
+    assert index.query(similar) == ['base']
+    assert index.query(unrelated) == []
+
+
+def test_story_index_clusters_across_queries(tmp_path):
+    """A story seen in an earlier search keeps its cluster ID and siblings after reload."""
+    path = str(tmp_path / 'clusters.json')
+    story = 'Scientists report a breakthrough in solid state battery chemistry that could double range'
+
+    first = Deduplicator(story_index=StoryClusterIndex({'path': path}))
+    first_results = first.deduplicate([
+        {'title': story, 'content': story, 'link': 'https://bbc.example.com/battery', 'source': 'bbc_news'},
+        {'title': story, 'content': story + '.', 'link': 'https://news.example.org/battery', 'source': 'google_news'}
+    ])
+    first.story_index.save()
+
+    assert len(first_results) == 1
+    cluster_id = first_results[0]['story_cluster_id']
+    assert [s['source'] for s in first_results[0]['cluster_sources']] == ['google_news']
+
+    # A later query, in a new process, finds the same story through another engine
+    second = Deduplicator(story_index=StoryClusterIndex({'path': path}))
+    second_results = second.deduplicate([
+        {'title': story, 'content': story + '!', 'link': 'https://search.example.net/r/1', 'source': 'duckduckgo'}
+    ])
+
+    assert second_results[0]['story_cluster_id'] == cluster_id
+    assert {s['source'] for s in second_results[0]['cluster_sources']} == {'bbc_news', 'google_news'}
+
+
+def test_redirect_and_amp_variants_match_in_exact_pass():
+    """Wrapped, AMP and mobile URLs for one article collapse without similarity checks."""
+    canonicalizer = URLCanonicalizer({'path': None})
+    deduplicator = Deduplicator(canonicalizer=canonicalizer)
+    items = [
+        {'id': 1, 'title': 'A', 'content': 'first', 'link': 'https://www.example.com/world/story-1?utm_source=rss'},
+        {'id': 2, 'title': 'B', 'content': 'second',
+         'link': 'https://duckduckgo.com/l/?uddg=https%3A%2F%2Fm.example.com%2Fworld%2Fstory-1&rut=x'},
+        {'id': 3, 'title': 'C', 'content': 'third', 'link': 'https://www.google.com/amp/s/www.example.com/world/story-1.amp'},
+        {'id': 4, 'title': 'D', 'content': 'fourth', 'link': 'https://news.google.com/rss/articles/CBMiXYZ?oc=5'}
+    ]
+
+    # Extraction learned where the Google News link points
+    canonicalizer.record(items[3]['link'], 'https://www.example.com/world/story-1')
+
+    unique = deduplicator.deduplicate(items)
+
+    assert [item['id'] for item in unique] == [1]
+    assert [source['id'] for source in unique[0]['duplicate_sources']] == [2, 3, 4]
+
+
+def test_story_index_honors_thresholds_and_skips_empty_items(tmp_path):
+    """A shared cluster alone does not remove an item; text-less items are never clustered."""
+    index = StoryClusterIndex({'path': str(tmp_path / 'clusters.json')})
+    deduplicator = Deduplicator({'similarity_threshold': 0.99}, story_index=index)
+    story = 'Scientists report a breakthrough in solid state battery chemistry that could double range'
+
+    unique = deduplicator.deduplicate([
+        {'title': story, 'content': story, 'link': 'https://a.example.com/battery', 'source': 'bbc_news'},
+        {'title': story, 'content': story + ' for electric cars', 'link': 'https://b.example.com/battery',
+         'source': 'google_news'},
+        {'title': '', 'content': '', 'link': 'https://c.example.com/1', 'source': 'reddit'},
+        {'title': '', 'content': '', 'link': 'https://d.example.com/2', 'source': 'reddit'}
+    ])
+
+    assert [item['source'] for item in unique] == ['bbc_news', 'google_news', 'reddit', 'reddit']
+    assert unique[0]['story_cluster_id'] == unique[1]['story_cluster_id']
+    assert 'story_cluster_id' not in unique[2]
+    assert len(index.clusters) == 1
+
+    # A changed index is written once per interval unless forced
+    index.save()
+    index.assign(['extra-key'], deduplicator._fingerprint(unique[0]).signature, unique[0])
+    index.save()
+    assert index._dirty
+    index.save(force=True)
+    assert not index._dirty
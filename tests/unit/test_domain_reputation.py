@@ -0,0 +1,70 @@
+"""
+Unit tests for the domain reputation service.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from app.aggregator.combiner import ContentCombiner
+from app.analyzer.credibility import CredibilityAnalyzer
+from app.aggregator.domain_reputation import DomainReputation, in_domains, registrable_domain
+
+
+def test_registrable_domain_respects_public_suffixes():
+    """Multi-label suffixes and hosting platforms keep one label below the suffix."""
+    assert registrable_domain('https://news.bbc.co.uk/world') == 'bbc.co.uk'
+    assert registrable_domain('https://a.b.example.com:8080/x') == 'example.com'
+    assert registrable_domain('alice.github.io') == 'alice.github.io'
+    assert registrable_domain('localhost') == 'localhost'
+
+
+def test_subdomains_inherit_the_most_specific_score():
+    """Scores come from the deepest trusted entry covering the host."""
+    reputation = DomainReputation({'trusted_domains': {'gov': 0.9, 'com': 0.6, 'bbc.com': 0.95}})
+
+    assert reputation.score('https://www.bbc.com/news') == 0.95
+    assert reputation.score('https://sport.bbc.com/') == 0.95
+    assert reputation.score('https://www.cdc.gov/flu') == 0.9
+    assert reputation.score('https://notbbc.com/') == 0.6
+    assert reputation.score('https://example.net/') == 0.5
+    assert reputation.score('http://') == 0.3
+
+
+def test_hosted_sites_do_not_inherit_the_platform_score():
+    """A trusted hosting platform does not vouch for its users' subdomains; the memo is per host."""
+    reputation = DomainReputation({'trusted_domains': {'medium.com': 0.6, 'bbc.co.uk': 0.95}})
+
+    assert reputation.score('https://medium.com/@alice/post') == 0.6
+    assert reputation.score('https://alice.medium.com/post') == 0.5
+    assert reputation.score('https://news.bbc.co.uk/world') == 0.95
+    assert reputation.is_trusted('https://news.bbc.co.uk/sport')
+    assert list(reputation._scores) == ['medium.com', 'alice.medium.com', 'news.bbc.co.uk']
+
+
+def test_in_domains_matches_labels_not_substrings():
+    """TLD and domain entries match whole labels only."""
+    domains = ['gov', 'cnn.com']
+
+    assert in_domains('https://edition.cnn.com/2024', domains)
+    assert in_domains('https://data.census.gov', domains)
+    assert not in_domains('https://notcnn.com/', domains)
+    assert not in_domains('https://govtrack.us/', domains)
+
+
+def test_memo_stays_bounded_under_concurrent_lookups():
+    """Executor threads can share one service without corrupting the LRU memo."""
+    reputation = DomainReputation({'trusted_domains': {'com': 0.6}, 'cache_size': 16})
+    urls = [f'https://site{i % 64}.com/page' for i in range(2000)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        scores = list(pool.map(reputation.score, urls))
+
+    assert set(scores) == {0.6}
+    assert len(reputation._scores) <= 16
+
+
+def test_injected_service_is_used_by_analyzers():
+    """Components built with an explicit service do not fall back to the shared one."""
+    reputation = DomainReputation({'trusted_domains': {'example.org': 0.99}})
+
+    assert CredibilityAnalyzer(reputation=reputation).reputation is reputation
+    assert ContentCombiner(reputation=reputation).reputation is reputation
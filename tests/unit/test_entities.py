@@ -0,0 +1,62 @@
+"""
+Unit tests for the entity registry and its use in relevance and scoring.
+"""
+
+import pytest
+
+from app.aggregator.entities import EntityRegistry, get_entity_registry
+from app.aggregator.scorer import ContentScorer
+from app.aggregator.text_view import text_view
+from app.analyzer.relevance import RelevanceAnalyzer
+
+
+@pytest.fixture
+def registry():
+    """Fixture to create a small in-memory registry."""
+    return EntityRegistry({'entities': {
+        'bts': {'type': 'k-pop', 'aliases': ['bangtan boys'], 'related_terms': ['k-pop'], 'members': ['jimin']},
+        'twice': {'type': 'k-pop'},
+        'apple': {'type': 'tech'},
+        'nba': {'type': 'sports'}
+    }})
+
+
+def test_lookup_and_scan_resolve_whole_terms(registry):
+    """Queries resolve by name, alias or member; scans match whole words and phrases."""
+    assert registry.lookup('Bangtan Boys') == 'bts'
+    assert registry.lookup('jimin') == 'bts'
+    assert registry.lookup('k-pop') is None
+
+    hits = registry.scan(text_view('BTS and the Bangtan Boys lead K-pop; pineapple sales up').words)
+
+    assert hits.roles('bts')['aliases'] == {'bangtan boys': 1}
+    assert hits.roles('bts')['related_terms'] == {'k pop': 1}
+    assert hits.named('bts') and 'apple' not in hits
+
+
+def test_type_counts_use_distinct_named_entities(registry):
+    """Only entities mentioned by name or alias count toward their type."""
+    hits = registry.scan(text_view('BTS, BTS and Twice on tour; the NBA finals').words)
+
+    assert registry.type_counts(hits) == {'k-pop': 2, 'sports': 1}
+
+
+def test_shipped_registry_feeds_relevance_and_scoring():
+    """The default file provides the entities both consumers used to hard-code."""
+    registry = get_entity_registry()
+    assert registry.lookup('방탄소년단') == 'bts'
+    assert ContentScorer().entity_types['tech'] == ['apple', 'google', 'microsoft', 'meta', 'amazon']
+
+    analyzer = RelevanceAnalyzer({'bm25': {'path': None}, 'semantic': {'enabled': False}})
+    view = text_view({'title': 'BTS comeback', 'content': 'Jimin and the Bangtan Boys return to K-pop charts'})
+    assert analyzer._calculate_entity_score('bts', view, 'bts') == 1.0
+
+
+def test_injected_registry_is_shared_by_relevance_and_scoring(registry):
+    """Both consumers use the registry they are given instead of the shared default."""
+    analyzer = RelevanceAnalyzer({'bm25': {'path': None}, 'semantic': {'enabled': False}}, entity_registry=registry)
+    scorer = ContentScorer(entity_registry=registry)
+
+    assert analyzer.entity_registry is registry and scorer.entity_registry is registry
+    assert scorer.entity_types == registry.entity_types()
+    assert 'google' not in analyzer.known_entities
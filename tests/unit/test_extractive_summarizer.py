@@ -0,0 +1,70 @@
+"""
+Unit tests for the TextRank extractive summarizer.
+"""
+
+from app.aggregator.text_view import SENTENCE_PATTERN
+from app.core.extractive_summarizer import ExtractiveSummarizer
+
+ARTICLE = {
+    'title': 'Central bank raises rates',
+    'source': 'reuters',
+    'content': (
+        "The central bank raised interest rates by half a point on Tuesday. "
+        "Officials said inflation had stayed above the bank's target for two years. "
+        "The rate decision was expected by most economists surveyed last week. "
+        "Click here to subscribe to our free daily newsletter. "
+        "Mortgage holders will see payments rise after the bank raised interest rates. "
+        "The weather in the capital was mild for the time of year."
+    )
+}
+
+OTHER = {
+    'title': 'Team wins the cup',
+    'source': 'espn',
+    'content': (
+        "The local team won the cup final after a penalty shootout. "
+        "The team's captain scored the winning penalty in the final. "
+        "Fans celebrated the cup win in the city centre until late."
+    )
+}
+
+
+def test_summary_keeps_central_sentences_in_order_within_budget():
+    """Summaries are whole, non-boilerplate sentences in reading order, within the word budget."""
+    summarizer = ExtractiveSummarizer()
+    summary = summarizer.summarize(ARTICLE, max_words=30)
+
+    assert summary.startswith('The central bank raised interest rates')
+    assert 'subscribe' not in summary
+    assert len(summary.split()) <= 30
+    sentences = summarizer.sentences(ARTICLE)
+    positions = [sentences.index(sentence) for sentence in SENTENCE_PATTERN.split(summary)]
+    assert positions == sorted(positions)
+
+    # A budget smaller than any sentence trims the best one at a word boundary
+    assert summarizer.summarize(ARTICLE, max_words=5).endswith('...')
+    assert summarizer.summarize({'title': 'Headline only', 'content': ''}, max_words=30) == ''
+
+
+def test_batch_matches_single_and_keeps_articles_apart():
+    """Batch mode summarizes each article from its own sentences only."""
+    summarizer = ExtractiveSummarizer()
+    batch = summarizer.summarize_batch([ARTICLE, OTHER, 'Too short.'], max_words=25)
+
+    assert 'cup' not in batch[0] and 'bank' not in batch[1]
+    assert batch[1] == summarizer.summarize(OTHER, max_words=25)
+    assert batch[2] == ''
+
+
+def test_result_set_summary_and_compression():
+    """Across articles the query steers selection; compression fits the budget with whole sentences."""
+    summarizer = ExtractiveSummarizer()
+    summary = summarizer.summarize_articles([OTHER, ARTICLE], 'interest rates', max_chars=200)
+    assert 'interest rates' in summary
+    assert len(summary) <= 200
+
+    text = ARTICLE['content']
+    assert summarizer.compress(text, 10000) == text
+    compressed = summarizer.compress(text, 150)
+    assert len(compressed) <= 150
+    assert all(sentence in summarizer.sentences(ARTICLE) for sentence in SENTENCE_PATTERN.split(compressed))
@@ -0,0 +1,57 @@
+"""
+Unit tests for the streaming HTML parser used by the article extractor.
+"""
+
+from app.core.html_stream import ArticleStreamParser
+
+PAGE = """<html><head><title>Page Title</title>
+<meta property="og:image" content="https://example.com/og.jpg">
+<meta name="description" content="Short description">
+<link rel="canonical" href="https://example.com/story"></head>
+<body><header><h1>Site Name</h1><p>Navigation text</p></header>
+<script>var markup = "<p>not content</p>";</script>
+<article><h1>Story Headline</h1><p>First paragraph.</p><p>Second paragraph.</p></article>
+<img src="/photo.jpg"><img src="/logo.png" alt="Site logo">
+</body></html>"""
+
+
+def test_extracts_title_meta_and_article_paragraphs():
+    """Test that the parser keeps article text and skips boilerplate regions."""
+    parser = ArticleStreamParser(target_chars=3000)
+    parser.feed(PAGE)
+    parser.close()
+
+    assert parser.best_title == 'Story Headline'
+    assert parser.content == 'First paragraph. Second paragraph.'
+    assert parser.meta_content('og:image') == 'https://example.com/og.jpg'
+    assert parser.links['canonical'] == 'https://example.com/story'
+    assert parser.images == ['/photo.jpg'], "Should skip logo images"
+
+
+def test_chunked_feed_matches_single_feed():
+    """Test that splitting the body into small chunks gives the same result."""
+    parser = ArticleStreamParser(target_chars=3000)
+    for i in range(0, len(PAGE), 5):
+        parser.feed(PAGE[i:i + 5])
+    parser.close()
+
+    assert parser.content == 'First paragraph. Second paragraph.'
+
+
+def test_stops_once_target_reached():
+    """Test that the parser reports done once enough paragraph text is collected."""
+    parser = ArticleStreamParser(target_chars=10)
+    parser.feed(PAGE)
+
+    assert parser.done
+    assert parser.content.startswith('First paragraph.')
+
+
+def test_head_only_mode_stops_after_head():
+    """Test that head-only parsing finishes before any body content."""
+    parser = ArticleStreamParser(head_only=True)
+    parser.feed(PAGE)
+
+    assert parser.done
+    assert parser.meta_content('description') == 'Short description'
+    assert parser.content == ''
@@ -0,0 +1,53 @@
+"""
+Unit tests for the shared HTTP client.
+"""
+
+import asyncio
+
+import pytest
+
+from app.scraper.http_client import SharedHTTPClient
+
+
+def test_profile_merges_source_headers_and_timeout():
+    """Source profiles layer over the defaults and config overrides win."""
+    client = SharedHTTPClient({'sources': {'rss': {'timeout': 4}, 'custom': {'headers': {'X-Test': '1'}}}})
+
+    rss = client.profile('rss')
+    assert rss['timeout'].total == 4
+    assert 'rss' in rss['headers']['Accept']
+    assert 'User-Agent' in rss['headers']
+
+    custom = client.profile('custom')
+    assert custom['headers']['X-Test'] == '1'
+    assert custom['timeout'].total == 15
+
+
+@pytest.mark.asyncio
+async def test_session_is_shared_per_loop():
+    """Every source view on one loop reuses the same pooled session."""
+    client = SharedHTTPClient()
+    try:
+        news = await client.session_for('news')
+        reddit = await client.session_for('reddit')
+        assert news._session is reddit._session
+        assert reddit.headers['Accept'] == 'application/json'
+
+        # Closing a view must not close the pool
+        await news.close()
+        assert not reddit.closed
+    finally:
+        await client.close()
+    assert reddit.closed
+
+
+def test_sessions_close_with_their_loop():
+    """A short-lived loop's session is closed while the loop shuts down, and then forgotten."""
+    client = SharedHTTPClient()
+
+    first = asyncio.run(client.get_session())
+    assert first.closed
+
+    second = asyncio.run(client.get_session())
+    assert second is not first and second.closed
+    assert len(client._sessions) == 1
@@ -0,0 +1,146 @@
+"""
+Unit tests for batched and streamed generation in the Ollama analyzer.
+"""
+
+import json
+
+import pytest
+
+from app.core import ollama_analyzer
+from app.core.ollama_analyzer import OllamaAnalyzer
+
+
+class FakeClient:
+    """Stand-in for OllamaClient that answers batch prompts with canned JSON."""
+
+    timeout = 120.0
+
+    def __init__(self, batch_reply):
+        self.batch_reply = batch_reply
+        self.calls = []
+        self.timeouts = []
+
+    async def chat(self, model, messages, options=None, timeout=None, **kwargs):
+        self.calls.append(kwargs.get('format'))
+        self.timeouts.append(timeout)
+        if kwargs.get('format') == 'json':
+            return {'message': {'content': self.batch_reply}}
+        return {'message': {'content': 'An individually generated summary of the article.'}}
+
+
+@pytest.fixture
+def analyzer(monkeypatch, tmp_path):
+    """Fixture for an analyzer that believes its model is installed."""
+    monkeypatch.setattr(ollama_analyzer.ollama, 'list', lambda: {'models': [{'name': 'llama3.1'}]})
+    return OllamaAnalyzer(config={
+        'batch_size': 3, 'health_interval': 0, 'summary_cache': {'directory': str(tmp_path)}
+    })
+
+
+def articles(count):
+    return [
+        {'title': f'Story {i}', 'content': f'Details of story number {i}.', 'source': 'reuters'}
+        for i in range(1, count + 1)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batch_results_are_parsed_and_invalid_entries_retried(analyzer):
+    """Valid entries come from the batch; missing or empty ones fall back to single calls."""
+    reply = json.dumps({'summaries': [
+        {'id': 1, 'summary': 'Story one is summarized in the batch.'},
+        {'id': '3', 'summary': ''},
+        {'id': 9, 'summary': 'Out of range id is ignored.'}
+    ]})
+    analyzer.client = FakeClient(reply)
+
+    summaries = await analyzer.generate_article_summaries_async(articles(3), 50)
+
+    assert summaries[0] == 'Story one is summarized in the batch.'
+    assert summaries[1] == summaries[2] == 'An individually generated summary of the article.'
+    assert analyzer.client.calls == ['json', None, None]
+
+    # Everything is cached now: batch output under its own template's key, retries under the single-article key
+    analyzer.client = FakeClient('not json')
+    assert await analyzer.generate_article_summaries_async(articles(3), 50) == summaries
+    assert analyzer.client.calls == []
+
+    # A single-article request never gets the batch template's output
+    assert await analyzer.generate_article_summary_async(articles(1)[0], 50) != summaries[0]
+    assert analyzer.client.calls == [None]
+
+
+@pytest.mark.asyncio
+async def test_unparseable_batch_falls_back_to_individual_calls(analyzer):
+    """A batch whose reply is not JSON is summarized one article at a time."""
+    analyzer.client = FakeClient('Sure! Here are your summaries: ...')
+
+    summaries = await analyzer.generate_article_summaries_async(articles(4), 50)
+
+    # Batches of 3 and 1; a single-article batch goes straight to the individual prompt
+    assert analyzer.client.calls.count('json') == 1
+    assert summaries == ['An individually generated summary of the article.'] * 4
+
+
+@pytest.mark.asyncio
+async def test_long_summaries_use_smaller_batches_with_longer_timeouts(analyzer):
+    """Batch size shrinks as max_words grows, and the timeout grows with the requested tokens."""
+    analyzer.batch_size = 5
+    analyzer.client = FakeClient('not json')
+
+    await analyzer.generate_article_summaries_async(articles(4), 300)
+
+    # 620 tokens per 300-word summary fit twice in the 1600-token budget
+    assert analyzer._effective_batch_size(300) == 2
+    assert analyzer._effective_batch_size(50) == 5
+    assert analyzer.client.calls.count('json') == 2
+    assert analyzer.client.timeouts[0] == 1240 / analyzer.min_tokens_per_second
+
+
+class StreamingClient:
+    """Stand-in for OllamaClient that streams a canned reply in word chunks."""
+
+    def __init__(self, reply):
+        self.reply = reply
+
+    async def stream_chat(self, model, messages, options=None, **kwargs):
+        for word in self.reply.split(' '):
+            yield word + ' '
+
+
+@pytest.mark.asyncio
+async def test_streamed_report_survives_the_done_event(analyzer):
+    """A report following the prompt's opening is kept (cleaned), not replaced by the fallback."""
+    reply = ("Current developments regarding interest rates show the **central bank** raising rates "
+             "by half a point, with officials citing inflation that has stayed above target for two years")
+    analyzer.client = StreamingClient(reply)
+
+    events = [event async for event in analyzer.stream_intelligence_report(articles(2), 'interest rates', 280)]
+
+    tokens = ''.join(event['text'] for event in events if event['type'] == 'token')
+    assert tokens.strip() == reply
+    done = events[-1]
+    assert done['type'] == 'done' and not done['cached']
+    assert done['summary'] == analyzer._clean_summary(reply, 280)
+    assert not done['summary'].startswith('Intelligence Analysis:')
+
+
+@pytest.mark.asyncio
+async def test_valid_llm_report_is_cached(analyzer):
+    """A report that passes validation is stored and served without calling the model again."""
+    reply = ("Current developments regarding interest rates show the central bank raising rates by half "
+             "a point, with officials citing inflation that has stayed above target for two years.")
+
+    class ReportClient:
+        calls = 0
+
+        async def chat(self, model, messages, options=None, **kwargs):
+            ReportClient.calls += 1
+            return {'message': {'content': reply}}
+
+    analyzer.client = ReportClient()
+    first = await analyzer.generate_intelligence_report_async(articles(2), 'interest rates')
+    second = await analyzer.generate_intelligence_report_async(articles(2), 'interest rates')
+
+    assert first == second == reply
+    assert ReportClient.calls == 1
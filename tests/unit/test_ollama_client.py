@@ -0,0 +1,110 @@
+"""
+Unit tests for the bounded Ollama client.
+"""
+
+import asyncio
+
+import pytest
+
+from app.core import ollama_client
+from app.core.ollama_client import OllamaBusyError, OllamaClient
+
+
+class SlowServer:
+    """Stand-in for ollama.AsyncClient that tracks concurrent generations."""
+
+    active = 0
+    peak = 0
+    delay = 0.05
+
+    def __init__(self, host=None):
+        pass
+
+    async def chat(self, model, messages, options, stream=False, **kwargs):
+        if stream:
+            return self._stream(messages[0]['content'])
+        SlowServer.active += 1
+        SlowServer.peak = max(SlowServer.peak, SlowServer.active)
+        try:
+            await asyncio.sleep(SlowServer.delay)
+            return {'message': {'content': messages[0]['content'].upper()}}
+        finally:
+            SlowServer.active -= 1
+
+    async def _stream(self, content):
+        SlowServer.active += 1
+        SlowServer.peak = max(SlowServer.peak, SlowServer.active)
+        try:
+            for word in content.split():
+                await asyncio.sleep(SlowServer.delay)
+                yield {'message': {'content': word.upper() + ' '}}
+        finally:
+            SlowServer.active -= 1
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """Fixture to route the client to the slow in-process server."""
+    monkeypatch.setattr(ollama_client.ollama, 'AsyncClient', SlowServer)
+    SlowServer.active = SlowServer.peak = 0
+    SlowServer.delay = 0.05
+    return SlowServer
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_and_queue_bound(server):
+    """At most max_concurrency generations run; requests beyond the queue bound are rejected."""
+    client = OllamaClient(config={'max_concurrency': 2, 'max_queue': 2})
+    messages = [{'role': 'user', 'content': 'hi'}]
+
+    results = await asyncio.gather(
+        *(client.chat('m', messages) for _ in range(5)), return_exceptions=True
+    )
+
+    assert server.peak == 2
+    assert sum(isinstance(result, OllamaBusyError) for result in results) == 1
+    assert [r for r in results if isinstance(r, dict)][0]['message']['content'] == 'HI'
+    metrics = client.metrics()
+    assert (metrics['completed'], metrics['rejected'], metrics['queue_depth']) == (4, 1, 0)
+    assert metrics['max_wait'] > 0
+
+
+@pytest.mark.asyncio
+async def test_timeout_and_cancellation_free_the_slot(server):
+    """Timed-out and cancelled requests release their slot for the next caller."""
+    server.delay = 0.5
+    client = OllamaClient(config={'max_concurrency': 1})
+    messages = [{'role': 'user', 'content': 'hi'}]
+
+    with pytest.raises(asyncio.TimeoutError):
+        await client.chat('m', messages, timeout=0.05)
+
+    task = asyncio.ensure_future(client.chat('m', messages))
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    server.delay = 0.0
+    assert client.chat_sync('m', messages)['message']['content'] == 'HI'
+    metrics = client.metrics()
+    assert (metrics['timeouts'], metrics['cancelled'], metrics['in_flight']) == (1, 1, 0)
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_chunks_and_early_close_frees_the_slot(server):
+    """Chunks arrive as they are generated; closing the stream early releases its slot."""
+    server.delay = 0.01
+    client = OllamaClient(config={'max_concurrency': 1})
+    messages = [{'role': 'user', 'content': 'one two three'}]
+
+    chunks = [chunk async for chunk in client.stream_chat('m', messages)]
+    assert chunks == ['ONE ', 'TWO ', 'THREE ']
+
+    stream = client.stream_chat('m', messages)
+    assert await stream.__anext__() == 'ONE '
+    await stream.aclose()
+
+    assert client.chat_sync('m', [{'role': 'user', 'content': 'hi'}])['message']['content'] == 'HI'
+    metrics = client.metrics()
+    assert (metrics['completed'], metrics['cancelled'], metrics['in_flight']) == (2, 1, 0)
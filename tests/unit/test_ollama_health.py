@@ -0,0 +1,96 @@
+"""
+Unit tests for the background Ollama health prober.
+"""
+
+import threading
+
+import pytest
+
+from app.core import ollama_health
+from app.core.ollama_health import OllamaHealthProber, has_model
+
+
+class FakeServer:
+    """Stand-in for ollama.Client with a switchable up/down state."""
+
+    up = True
+    installed = ['llama3.1:latest']
+    running = []
+    loads = []
+    timeouts = []
+    gate = None
+
+    def __init__(self, host=None, timeout=None):
+        FakeServer.timeouts.append(timeout)
+
+    def list(self):
+        if FakeServer.gate:
+            FakeServer.gate.wait(5)
+        if not FakeServer.up:
+            raise ConnectionError('connection refused')
+        return {'models': [{'model': name} for name in FakeServer.installed]}
+
+    def ps(self):
+        return {'models': [{'model': name} for name in FakeServer.running]}
+
+    def generate(self, model, prompt, keep_alive=None):
+        FakeServer.loads.append((model, keep_alive))
+        FakeServer.running.append(f"{model}:latest")
+        return {'response': ''}
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """Fixture to route the prober to the fake server."""
+    monkeypatch.setattr(ollama_health.ollama, 'Client', FakeServer)
+    FakeServer.up = True
+    FakeServer.installed = ['llama3.1:latest']
+    FakeServer.running = []
+    FakeServer.loads = []
+    FakeServer.timeouts = []
+    FakeServer.gate = None
+    return FakeServer
+
+
+def test_model_name_matching():
+    """Untagged names match the ':latest' tag only."""
+    assert has_model(['llama3.1:latest'], 'llama3.1')
+    assert has_model(['llama3.1:8b'], 'llama3.1:8b')
+    assert not has_model(['llama3.1:8b'], 'llama3.1')
+
+
+def test_probe_tracks_outages_and_preloads_once(server):
+    """Availability follows the server; the model is pre-loaded with a keep-alive only when not resident."""
+    prober = OllamaHealthProber('llama3.1', config={'keep_alive': '10m'})
+    assert prober.status()['age'] is None
+
+    status = prober.probe()
+    assert (status['status'], status['available'], status['loaded']) == ('healthy', True, True)
+    assert status['age'] is not None
+    assert server.loads == [('llama3.1', '10m')]
+
+    server.up = False
+    assert prober.probe()['status'] == 'unreachable'
+    assert not prober.available
+
+    server.up = True
+    assert prober.probe()['available']
+    assert len(server.loads) == 1  # Still resident, no second load
+
+    server.installed = []
+    assert prober.probe()['status'] == 'model_missing'
+
+
+def test_refresh_probes_in_the_background_with_client_timeouts(server):
+    """refresh() returns at once, runs one probe at a time, and every client has a timeout."""
+    prober = OllamaHealthProber('llama3.1', config={'probe_timeout': 5, 'preload_timeout': 60})
+    server.gate = threading.Event()
+
+    assert prober.refresh()
+    assert not prober.refresh()  # Already probing
+    assert prober.status()['status'] == 'unknown'
+
+    server.gate.set()
+    prober._refresh_thread.join(5)
+    assert prober.status()['status'] == 'healthy'
+    assert server.timeouts == [5, 60]
@@ -0,0 +1,68 @@
+"""
+Unit tests for the streaming top-k ranker.
+"""
+
+from app.aggregator.ranker import StreamingRanker
+
+
+def make_item(item_id, score, source='news'):
+    return {'id': item_id, 'source': source, 'composite_score': score}
+
+
+def ids(ranking):
+    return [item['id'] for item in ranking]
+
+
+def test_keeps_best_k_and_reports_changes():
+    """Offers beyond k displace the weakest item and report the swap."""
+    ranker = StreamingRanker(2)
+    ranker.offer_many([make_item(1, 0.5), make_item(2, 0.7)])
+
+    update = ranker.offer(make_item(3, 0.9))
+
+    assert ids(ranker.ranking()) == [3, 2]
+    assert update.entered == ['id:3'] and update.left == ['id:1']
+    assert not ranker.offer(make_item(4, 0.1)).changed
+
+
+def test_source_quota_and_refill_on_remove():
+    """A source cannot exceed its quota; removals promote the best eligible reserve item."""
+    ranker = StreamingRanker(3, max_per_source=2)
+    ranker.offer_many([
+        make_item(1, 0.9, 'reddit'), make_item(2, 0.8, 'reddit'), make_item(3, 0.85, 'reddit'),
+        make_item(4, 0.2, 'bbc'), make_item(5, 0.1, 'cnn')
+    ])
+
+    assert ids(ranker.ranking()) == [1, 3, 4]
+
+    update = ranker.remove('id:1')
+    assert ids(ranker.ranking()) == [3, 2, 4]
+    assert update.entered == ['id:2']
+
+
+def test_quota_shortfall_is_backfilled_in_score_order():
+    """When other sources run out, free slots go to the best over-quota items."""
+    ranker = StreamingRanker(40, max_per_source=10)
+    for source in ('bbc', 'cnn', 'reddit'):
+        ranker.offer_many([make_item(f"{source}-{i}", 0.5 + i / 100, source) for i in range(30)])
+
+    ranking = ranker.ranking()
+    assert len(ranking) == 40
+    scores = [item['composite_score'] for item in ranking[30:]]
+    assert scores == sorted(scores, reverse=True)
+    assert all(item['composite_score'] == 0.69 for item in ranking[30:33])
+
+    # A new eligible source still takes a slot ahead of the backfill
+    ranker.offer(make_item('ap-0', 0.1, 'ap'))
+    assert 'ap-0' in ids(ranker.ranking())
+    assert len(ranker.ranking()) == 40
+
+
+def test_sync_rescores_and_drops_missing_items():
+    """The final sync applies new scores and removes items merged away."""
+    ranker = StreamingRanker(2)
+    ranker.offer_many([make_item(1, 0.9), make_item(2, 0.5), make_item(3, 0.4)])
+
+    ranker.sync([make_item(2, 0.95), make_item(3, 0.4)])
+
+    assert ids(ranker.ranking()) == [2, 3]
@@ -0,0 +1,143 @@
+"""
+Unit tests for relevance analysis and the BM25 index.
+"""
+
+import numpy as np
+import pytest
+
+from app.aggregator.text_view import text_view
+from app.analyzer.bm25 import BM25Index
+from app.analyzer.relevance import RelevanceAnalyzer
+from app.analyzer.semantic import EmbeddingCache, SemanticScorer
+
+
+@pytest.fixture
+def analyzer(tmp_path):
+    """Fixture to create an analyzer with a temporary IDF table."""
+    return RelevanceAnalyzer({'bm25': {'path': str(tmp_path / 'idf.json')}, 'semantic': {'enabled': False}})
+
+
+def test_idf_table_persists_and_counts_documents_once(tmp_path):
+    """Re-ingesting a document does not inflate document frequencies."""
+    path = str(tmp_path / 'idf.json')
+    index = BM25Index({'path': path})
+    assert index.add_document(['solar', 'panel', 'prices'], 'a')
+    assert not index.add_document(['solar', 'panel', 'prices'], 'a')
+    index.add_document(['solar', 'storage'], 'b')
+    index.save()
+
+    reloaded = BM25Index({'path': path})
+    assert reloaded.num_docs == 2
+    assert reloaded.doc_freq['solar'] == 2
+    assert reloaded.idf('storage') > reloaded.idf('solar')
+
+
+def test_vocabulary_is_capped_and_saves_are_throttled(tmp_path):
+    """The rarest terms are dropped past max_terms; a changed table is written once per interval."""
+    path = tmp_path / 'idf.json'
+    index = BM25Index({'path': str(path), 'max_terms': 10})
+    for i in range(12):
+        index.add_document(['common', f'rare{i}'], str(i))
+
+    assert len(index.doc_freq) <= 11
+    assert index.doc_freq['common'] == 12
+    assert 'rare10' not in index.doc_freq and index.idf('rare10') == index.idf('never-seen')
+
+    index.save()
+    written = path.stat().st_mtime_ns
+    index.add_document(['late'], 'late')
+    index.save()
+    assert path.stat().st_mtime_ns == written and index._dirty
+    index.save(force=True)
+    assert not index._dirty and BM25Index({'path': str(path)}).num_docs == 13
+
+
+def test_batch_scores_match_rare_terms_higher(tmp_path):
+    """Rare query terms weigh more, and scores stay within 0-1."""
+    index = BM25Index({'path': None})
+    docs = [['fusion', 'reactor', 'news'], ['market', 'news'], ['news', 'weather'], ['sports', 'news']]
+    for doc in docs:
+        index.add_document(doc)
+
+    scores = index.score_batch(['fusion', 'news'], docs)
+
+    assert scores[0] == max(scores)
+    assert all(0 <= score <= 1 for score in scores)
+
+
+@pytest.mark.asyncio
+async def test_analyze_batch_matches_single_analysis(analyzer):
+    """Batch analysis gives the same result as analyzing an item on its own."""
+    items = [
+        {'title': 'Fusion reactor milestone', 'content': 'Researchers report a fusion energy milestone.'},
+        {'title': 'Weather update', 'content': 'Rain expected across the region.'}
+    ]
+
+    batch = await analyzer.analyze_batch(items, 'fusion energy')
+    single = await analyzer.analyze(items[0], 'fusion energy')
+
+    assert batch[0] == single
+    assert batch[0]['score'] > batch[1]['score']
+    assert batch[0]['title_matches'] == ['fusion']
+
+
+class KeywordEncoder:
+    """Deterministic stand-in for a sentence embedding model: one axis per keyword."""
+
+    axes = ['solar', 'wind', 'football']
+
+    def __init__(self):
+        self.batches = []
+
+    def encode(self, texts, **kwargs):
+        self.batches.append(list(texts))
+        vectors = np.array([[text.lower().count(word) for word in self.axes] for text in texts], dtype=float) + 1e-3
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def test_int8_embedding_storage_keeps_cosines():
+    """Quantized embeddings round-trip to nearly the same unit vector."""
+    cache = EmbeddingCache(storage='int8')
+    vector = np.array([0.6, -0.8, 0.0], dtype=np.float32)
+    cache.put('a', vector)
+
+    assert cache.get('a') @ vector == pytest.approx(1.0, abs=1e-3)
+
+
+@pytest.mark.asyncio
+async def test_semantic_scores_are_batched_and_cached():
+    """All uncached candidates are encoded in one call; repeats come from the cache."""
+    scorer = SemanticScorer({'latency_budget_ms': 5000})
+    scorer._model = KeywordEncoder()
+    views = [text_view({'title': 'Solar farms', 'content': 'solar power'}),
+             text_view({'title': 'Football', 'content': 'league results'})]
+
+    scores = await scorer.score_batch('solar', views)
+    await scorer.score_batch('solar', views)
+
+    assert scores[0] > 0.9 and scores[1] < 0.1
+    assert len(scorer._model.batches) == 1 and len(scorer._model.batches[0]) == 3
+
+
+@pytest.mark.asyncio
+async def test_semantic_falls_back_until_model_is_loaded():
+    """Without a loaded model every item gets None and relevance uses token overlap."""
+    scorer = SemanticScorer({'enabled': False})
+
+    assert await scorer.score_batch('solar', [text_view('solar news')]) == [None]
+
+
+@pytest.mark.asyncio
+async def test_partially_encoded_batch_is_scored_lexically():
+    """When the budget covers only part of a batch, no item gets a cosine score."""
+    scorer = SemanticScorer({'latency_budget_ms': 5000})
+    scorer._model = KeywordEncoder()
+    scorer._seconds_per_text = 2.0  # Budget fits the query and one candidate
+    views = [text_view({'title': 'Solar farms', 'content': 'solar power'}),
+             text_view({'title': 'Wind farms', 'content': 'wind power'})]
+
+    assert await scorer.score_batch('solar', views) == [None, None]
+
+    scorer._seconds_per_text = None
+    scores = await scorer.score_batch('solar', views)
+    assert all(score is not None for score in scores)
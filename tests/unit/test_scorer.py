@@ -0,0 +1,53 @@
+"""
+Unit tests for the content scorer.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+from app.aggregator.scorer import ContentScorer
+
+
+@pytest.fixture
+def scorer():
+    """Fixture to create a scorer with a news boost."""
+    return ContentScorer({'boost_factors': {'news': 1.1}})
+
+
+@pytest.fixture
+def items():
+    """A small mixed candidate pool."""
+    now = datetime.now()
+    return [
+        {'title': 'Old news', 'content': 'word ' * 900, 'source_type': 'news',
+         'published_date': (now - timedelta(days=40)).isoformat()},
+        {'title': 'New research study', 'content': 'findings', 'source_type': 'news',
+         'published_date': now.isoformat(),
+         'analysis': {'relevance': {'score': 0.9, 'title_matches': ['study']}}},
+        {'title': 'Popular clip', 'content': '', 'source_type': 'youtube',
+         'metadata': {'views': 250000, 'likes': 5000}},
+        {'title': 'Thread', 'content': 'discussion', 'source_type': 'reddit',
+         'metadata': {'score': 1200, 'comments': 300, 'upvote_ratio': 0.9},
+         'analysis': {'credibility': {'score': 0.7, 'risk_factors': ['anonymous']}}},
+        {'title': 'No date', 'content': 'text', 'source_type': 'web', 'published_date': 'not a date'}
+    ]
+
+
+def test_batch_matches_single_item_scores(scorer, items):
+    """Vectorized columns give the same per-item scores as calculate_score."""
+    expected = [scorer.calculate_score(item) for item in items]
+    scorer.score_batch(items)
+
+    assert [item['score'] for item in items] == expected
+    assert items[4]['score']['recency'] == 0.5
+    assert items[0]['score']['recency'] == 0.1
+
+
+def test_top_k_returns_highest_first(scorer, items):
+    """top_k only returns k items, ordered by composite score."""
+    full = scorer.score_batch([dict(item) for item in items])
+    top = scorer.score_batch(items, top_k=2)
+
+    assert [item['title'] for item in top] == [item['title'] for item in full[:2]]
+    composites = [item['score']['composite'] for item in full]
+    assert composites == sorted(composites, reverse=True)
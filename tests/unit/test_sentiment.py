@@ -0,0 +1,72 @@
+"""
+Unit tests for the sentiment analyzer and its lexicon backend.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.analyzer.sentiment import SentimentAnalyzer
+from app.analyzer.sentiment_lexicon import LexiconSentimentModel
+
+
+def test_lexicon_model_scores_batch_with_negation():
+    """Polarity follows the lexicon; a negation flips and dampens the next word."""
+    model = LexiconSentimentModel({'good': (0.7, 0.6), 'bad': (-0.7, 0.7)})
+
+    polarity, subjectivity = model.score([['good'], ['not', 'good'], ['bad', 'good'], ['neutral']])
+
+    assert list(polarity) == pytest.approx([0.7, -0.35, 0.0, 0.0])
+    assert list(subjectivity) == pytest.approx([0.6, 0.6, 0.65, 0.0])
+
+
+def test_lexicon_model_applies_modifier_intensity():
+    """An adverb modifier scales the next known word and joins its assessment, as in TextBlob."""
+    model = LexiconSentimentModel({
+        'terrible': (-1.0, 1.0), 'awful': (-1.0, 1.0), 'disaster': (-1.0, 1.0),
+        'bad': (-0.7, 0.67), 'good': (0.7, 0.6), 'very': (0.2, 0.3, 1.3, True), 'really': (0.2, 0.2, 1.0, True)
+    })
+
+    polarity, _ = model.score([
+        'the terrible awful disaster was very bad'.split(), ['very', 'good'], ['not', 'very', 'good'],
+        ['really', 'not', 'good']
+    ])
+
+    assert list(polarity) == pytest.approx([-0.9775, 0.91, -0.35 / 1.3, -0.35])
+
+
+@pytest.mark.asyncio
+async def test_analyze_batch_inside_running_loop():
+    """Batch analysis can be awaited from async code and labels each item."""
+    analyzer = SentimentAnalyzer()
+
+    results = await analyzer.analyze_batch([
+        {'title': 'Excellent results', 'content': 'A wonderful, great quarter.'},
+        'This was a terrible disaster.',
+        ''
+    ])
+
+    assert [result['label'] for result in results] == ['positive', 'negative', 'neutral']
+
+
+def test_results_are_cached_by_content_hash():
+    """Identical text in different items is scored once."""
+    analyzer = SentimentAnalyzer()
+    item = {'title': 'Great news', 'content': 'Amazing progress.'}
+
+    first = analyzer.analyze_many([item, dict(item, source='other')])
+
+    assert first[0] == first[1]
+    assert len(analyzer._cache) == 1
+
+
+def test_cache_is_safe_across_threads():
+    """Concurrent batches from executor threads keep the LRU cache bounded and consistent."""
+    analyzer = SentimentAnalyzer({'cache_size': 8})
+    batches = [[f'Great progress number {i}', f'Terrible setback number {i}'] for i in range(200)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(analyzer.analyze_many, batches))
+
+    assert all(positive['label'] == 'positive' and negative['label'] == 'negative' for positive, negative in results)
+    assert len(analyzer._cache) <= 8
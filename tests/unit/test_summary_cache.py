@@ -0,0 +1,70 @@
+"""
+Unit tests for the on-disk summary cache.
+"""
+
+import os
+import time
+
+from app.core.summary_cache import SummaryCache
+
+ARTICLE = {'title': 'Rates held', 'content': 'The central bank held rates at 5%.', 'source': 'reuters'}
+
+
+def test_keys_cover_content_prompt_model_and_length(tmp_path):
+    """Any input that changes the generated text changes the key."""
+    cache = SummaryCache({'directory': str(tmp_path)})
+    key = cache.article_key(ARTICLE, 1, 'llama3.1', 300)
+
+    assert key == cache.article_key(dict(ARTICLE, id='other'), 1, 'llama3.1', 300)
+    assert len({
+        key,
+        cache.article_key(dict(ARTICLE, content='Rates cut.'), 1, 'llama3.1', 300),
+        cache.article_key(ARTICLE, 2, 'llama3.1', 300),
+        cache.article_key(ARTICLE, 1, 'mistral', 300),
+        cache.article_key(ARTICLE, 1, 'llama3.1', 100)
+    }) == 5
+
+    other = dict(ARTICLE, title='Rates cut')
+    assert cache.report_key([ARTICLE, other], 'rates', 1, 'm', 280) != cache.report_key([other, ARTICLE], 'rates', 1, 'm', 280)
+    assert cache.report_key([ARTICLE], 'Rates ', 1, 'm', 280) == cache.report_key([ARTICLE], 'rates', 1, 'm', 280)
+
+
+def test_entries_are_shared_and_expire(tmp_path):
+    """A second cache instance (another worker) reads entries; expired ones are misses and get pruned."""
+    writer = SummaryCache({'directory': str(tmp_path), 'ttl': 60})
+    writer.put('abc123', 'Central bank holds rates.')
+
+    reader = SummaryCache({'directory': str(tmp_path), 'ttl': 60})
+    assert reader.get('abc123') == 'Central bank holds rates.'
+    assert reader.get('missing') is None
+
+    path = tmp_path / 'ab' / 'abc123.json'
+    old = time.time() - 120
+    os.utime(path, (old, old))
+    reader.prune()
+    assert not path.exists()
+
+
+def test_prune_keeps_newest_entries(tmp_path):
+    """Beyond max_entries the oldest files are removed."""
+    cache = SummaryCache({'directory': str(tmp_path), 'max_entries': 2, 'prune_every': 1000})
+    for i, key in enumerate(['aa1', 'bb2', 'cc3']):
+        cache.put(key, f'summary {i}')
+        stamp = time.time() - 10 + i
+        os.utime(tmp_path / key[:2] / f'{key}.json', (stamp, stamp))
+
+    cache.prune()
+
+    assert [cache.get(key) for key in ['aa1', 'bb2', 'cc3']] == [None, 'summary 1', 'summary 2']
+
+
+def test_put_prunes_in_the_background(tmp_path):
+    """Every prune_every writes a prune runs on a background thread, not inside put()."""
+    cache = SummaryCache({'directory': str(tmp_path), 'max_entries': 1, 'prune_every': 2})
+    cache.put('aa1', 'first')
+    assert cache._prune_thread is None
+
+    cache.put('bb2', 'second')
+    cache._prune_thread.join(5)
+
+    assert len(list(tmp_path.rglob('*.json'))) == 1
@@ -0,0 +1,41 @@
+"""
+Unit tests for the shared per-item text view.
+"""
+
+from app.aggregator.text_view import text_view, clean_text, strip_html
+
+
+def test_view_is_shared_between_consumers():
+    """Copies of an item with the same text get the same memoized view."""
+    item = {'title': 'Rates <b>rise</b>', 'content': 'Markets fell. Bonds rallied!', 'source': 'a'}
+
+    view = text_view(item)
+
+    assert text_view(dict(item, source='b')) is view
+    assert text_view(dict(item, content='Different text')) is not view
+
+
+def test_view_derived_forms():
+    """Cleaning, tokens, sentences and hash are derived from the cleaned text."""
+    view = text_view({
+        'title': 'AT&amp;T <i>earnings</i>',
+        'content': 'Profit rose. See https://example.com/x for details!  Contact ir@example.com.',
+        'tags': ['telecom']
+    })
+
+    assert view.clean_title == 'AT&T earnings'
+    assert 'https' not in view.lower and '@' not in view.lower
+    assert view.words[:3] == ['at', 't', 'earnings']
+    assert view.extra_words == ['telecom']
+    assert view.sentences == ['Profit rose.', 'See for details!', 'Contact']
+    assert view.content_hash == text_view({'title': 'AT&T earnings!', 'content': view.clean_content}).content_hash
+
+
+def test_clean_text_handles_empty():
+    assert clean_text('') == ''
+
+
+def test_strip_html_keeps_urls_and_addresses():
+    """Display cleaning removes markup only."""
+    assert strip_html('<p>AT&amp;T:  see https://example.com or ir@example.com</p>') == \
+        'AT&T: see https://example.com or ir@example.com'
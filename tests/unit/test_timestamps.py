@@ -0,0 +1,73 @@
+"""
+Unit tests for ingest-time timestamp normalization.
+"""
+
+import time
+
+import pytest
+from datetime import datetime, timezone
+
+from app.aggregator.timestamps import parse_timestamp, normalize_timestamps
+from app.analyzer.credibility import CredibilityAnalyzer
+
+NOW = datetime(2024, 3, 15, 12, 0, tzinfo=timezone.utc).timestamp()
+
+
+@pytest.mark.parametrize('value', [
+    'Fri, 15 Mar 2024 12:00:00 GMT',
+    'Fri, 15 Mar 2024 12:00:00 +0000',
+    '2024-03-15T12:00:00Z',
+    '2024-03-15T13:00:00+01:00',
+    1710504000,
+    1710504000000,
+    '1710504000',
+    datetime(2024, 3, 15, 12, 0, tzinfo=timezone.utc),
+    '2 hours ago',
+])
+def test_formats_parse_to_the_same_epoch(value):
+    """Every supported representation yields a UTC epoch."""
+    expected = NOW - 7200 if value == '2 hours ago' else NOW
+    assert parse_timestamp(value, now=NOW) == expected
+
+
+def test_struct_time_is_utc_regardless_of_dst(monkeypatch):
+    """A UTC struct_time parses the same while the local zone observes DST."""
+    monkeypatch.setenv('TZ', 'America/New_York')  # Mid-March 2024 is already daylight time there
+    time.tzset()
+    try:
+        assert parse_timestamp(time.gmtime(NOW)) == NOW
+        # DST flag unknown (-1), as from strptime
+        assert parse_timestamp(time.strptime('2024-03-15 12:00:00', '%Y-%m-%d %H:%M:%S')) == NOW
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+
+
+def test_unparseable_values_return_none():
+    """Unknown values are reported as None rather than a default."""
+    assert parse_timestamp('not a date') is None
+    assert parse_timestamp('') is None
+    assert parse_timestamp(None) is None
+
+
+def test_normalize_prefers_published_fields():
+    """Items get published_ts from the first parseable field and keep the field name."""
+    items = normalize_timestamps([
+        {'published': 'Fri, 15 Mar 2024 12:00:00 GMT'},
+        {'published_date': 'garbage', 'created_utc': NOW - 86400},
+        {'metadata': {'upload_date': 'yesterday'}, 'scraped_at': '2024-03-15T12:00:00+00:00'},
+        {'title': 'no date'}
+    ], now=NOW)
+
+    assert [item['published_ts'] for item in items] == [NOW, NOW - 86400, NOW - 86400, None]
+    assert [item['published_ts_field'] for item in items] == [
+        'published', 'created_utc', 'metadata.upload_date', None
+    ]
+    assert items[2]['scraped_ts'] == NOW
+
+
+def test_credibility_recency_reads_rfc822_dates():
+    """Feed dates no longer fall back to the neutral recency score."""
+    analyzer = CredibilityAnalyzer()
+    assert analyzer._analyze_recency('Mon, 01 Jan 2001 00:00:00 GMT') == 0.45
+    assert analyzer._analyze_recency(None) == 0.5